@@ -1,5 +1,6 @@
 from django.db import IntegrityError
 from .models import Auth
+from .revocations import broadcaster
 
 def insert_auth_record(access_token, refresh_token, expires_at, user_id):
     try:
@@ -21,3 +22,4 @@ def update_auth_record(auth_id, access_token, refresh_token, expires_at):
 
 def delete_auth_record(auth_id):
     Auth.objects.filter(id=auth_id).delete()
+    broadcaster.publish(auth_id)
@@ -4,6 +4,7 @@ from django.conf import settings
 import jwt
 from auth_service.auth.auth_db_operations import *
 from auth_service.auth.intra_api import *
+from auth_service.auth.revocations import broadcaster
 from datetime import datetime
 
 class AuthServiceHandler(auth_pb2_grpc.AuthServiceServicer):
@@ -52,6 +53,19 @@ class AuthServiceHandler(auth_pb2_grpc.AuthServiceServicer):
 
         return auth_pb2.GetUserIDFromJwtTokenResponse(user_id=user_id)
 
+    async def WatchRevokedSessions(self, request, context):
+        # Gateways cache validated sessions and drop them when they show up here.
+        subscriber = broadcaster.subscribe()
+        _, queue = subscriber
+        try:
+            # Tell the client it is subscribed before the first revocation.
+            await context.send_initial_metadata(())
+            while True:
+                auth_id = await queue.get()
+                yield auth_pb2.RevokedSession(auth_id=auth_id)
+        finally:
+            broadcaster.unsubscribe(subscriber)
+
     @classmethod
     def as_servicer(cls):
         return cls()
@@ -0,0 +1,39 @@
+import asyncio
+import threading
+
+
+class RevocationBroadcaster:
+    """
+    Fans out deleted auth records to every open WatchRevokedSessions stream.
+
+    Records are deleted from sync handlers running on worker threads, the
+    streams are served on the aio server's event loop, so each subscriber
+    queue is fed through its loop's ``call_soon_threadsafe``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    def subscribe(self):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, auth_id):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, auth_id)
+            except RuntimeError:
+                # Event loop already closed, the stream is gone with it.
+                self.unsubscribe((loop, queue))
+
+
+broadcaster = RevocationBroadcaster()
@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
 # source: auth.proto
+# Protobuf Python Version: 5.29.0
 """Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
 from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    0,
+    '',
+    'auth.proto'
+)
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -13,21 +24,25 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nauth.proto\x12\x04\x61uth\"2\n\x13\x45xchangeCodeRequest\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\"}\n\x14\x45xchangeCodeResponse\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x11\n\tjwt_token\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04mail\x18\x04 \x01(\t\x12\x12\n\navatar_url\x18\x05 \x01(\t\x12\x11\n\tfull_name\x18\x06 \x01(\t\"1\n\x1cGetUserIDFromJwtTokenRequest\x12\x11\n\tjwt_token\x18\x01 \x01(\t\"0\n\x1dGetUserIDFromJwtTokenResponse\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x32\xbe\x01\n\x0b\x41uthService\x12M\n\x14\x45xchangeCodeForToken\x12\x19.auth.ExchangeCodeRequest\x1a\x1a.auth.ExchangeCodeResponse\x12`\n\x15GetUserIDFromJwtToken\x12\".auth.GetUserIDFromJwtTokenRequest\x1a#.auth.GetUserIDFromJwtTokenResponseb\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'auth_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nauth.proto\x12\x04\x61uth\"2\n\x13\x45xchangeCodeRequest\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\r\n\x05state\x18\x02 \x01(\t\"}\n\x14\x45xchangeCodeResponse\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x11\n\tjwt_token\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0c\n\x04mail\x18\x04 \x01(\t\x12\x12\n\navatar_url\x18\x05 \x01(\t\x12\x11\n\tfull_name\x18\x06 \x01(\t\"1\n\x1cGetUserIDFromJwtTokenRequest\x12\x11\n\tjwt_token\x18\x01 \x01(\t\"0\n\x1dGetUserIDFromJwtTokenResponse\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\x1d\n\x1bWatchRevokedSessionsRequest\"!\n\x0eRevokedSession\x12\x0f\n\x07\x61uth_id\x18\x01 \x01(\x05\x32\x91\x02\n\x0b\x41uthService\x12M\n\x14\x45xchangeCodeForToken\x12\x19.auth.ExchangeCodeRequest\x1a\x1a.auth.ExchangeCodeResponse\x12`\n\x15GetUserIDFromJwtToken\x12\".auth.GetUserIDFromJwtTokenRequest\x1a#.auth.GetUserIDFromJwtTokenResponse\x12Q\n\x14WatchRevokedSessions\x12!.auth.WatchRevokedSessionsRequest\x1a\x14.auth.RevokedSession0\x01\x62\x06proto3')
 
-  DESCRIPTOR._options = None
-  _EXCHANGECODEREQUEST._serialized_start=20
-  _EXCHANGECODEREQUEST._serialized_end=70
-  _EXCHANGECODERESPONSE._serialized_start=72
-  _EXCHANGECODERESPONSE._serialized_end=197
-  _GETUSERIDFROMJWTTOKENREQUEST._serialized_start=199
-  _GETUSERIDFROMJWTTOKENREQUEST._serialized_end=248
-  _GETUSERIDFROMJWTTOKENRESPONSE._serialized_start=250
-  _GETUSERIDFROMJWTTOKENRESPONSE._serialized_end=298
-  _AUTHSERVICE._serialized_start=301
-  _AUTHSERVICE._serialized_end=491
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'auth_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_EXCHANGECODEREQUEST']._serialized_start=20
+  _globals['_EXCHANGECODEREQUEST']._serialized_end=70
+  _globals['_EXCHANGECODERESPONSE']._serialized_start=72
+  _globals['_EXCHANGECODERESPONSE']._serialized_end=197
+  _globals['_GETUSERIDFROMJWTTOKENREQUEST']._serialized_start=199
+  _globals['_GETUSERIDFROMJWTTOKENREQUEST']._serialized_end=248
+  _globals['_GETUSERIDFROMJWTTOKENRESPONSE']._serialized_start=250
+  _globals['_GETUSERIDFROMJWTTOKENRESPONSE']._serialized_end=298
+  _globals['_WATCHREVOKEDSESSIONSREQUEST']._serialized_start=300
+  _globals['_WATCHREVOKEDSESSIONSREQUEST']._serialized_end=329
+  _globals['_REVOKEDSESSION']._serialized_start=331
+  _globals['_REVOKEDSESSION']._serialized_end=364
+  _globals['_AUTHSERVICE']._serialized_start=367
+  _globals['_AUTHSERVICE']._serialized_end=640
 # @@protoc_insertion_point(module_scope)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ChatConfig(AppConfig):
     name = 'chat_service.chat'
     label = 'chat'
+
+    def ready(self):
+        from . import signals  # noqa: F401
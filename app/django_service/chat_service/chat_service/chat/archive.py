@@ -0,0 +1,114 @@
+"""
+Archival of cold chat history.
+
+Messages older than CHAT_MESSAGE_ARCHIVE_AFTER_DAYS are moved out of
+ChatRoomMessage into ChatRoomMessageArchive chunks: up to
+CHAT_MESSAGE_ARCHIVE_CHUNK_SIZE consecutive messages of one room and one
+month, stored as zlib-compressed JSON. The latest CHAT_MESSAGE_ARCHIVE_KEEP
+messages of a room always stay in ChatRoomMessage, so subscriptions and the
+first history pages never touch the archive and the table and its indexes
+only hold recent messages.
+
+Chunks of a room cover disjoint id ranges, so history reads continue from
+the hot table into the archive by id (see ListMessagesBefore), and from the
+archive into the hot table (see ListMessagesAfter).
+"""
+import json
+import zlib
+from datetime import datetime
+from itertools import groupby
+
+from django.db import transaction
+
+from .fast_serializers import MESSAGE_COLUMNS
+from .models import ChatRoomMessage, ChatRoomMessageArchive
+
+
+def _pack(rows):
+    data = [[id, content, sender_id, timestamp.isoformat()] for id, content, sender_id, timestamp, _ in rows]
+    return zlib.compress(json.dumps(data, separators=(",", ":")).encode(), 9)
+
+
+def _unpack(archive):
+    """Rows of an archive chunk in MESSAGE_COLUMNS order, oldest first."""
+    data = json.loads(zlib.decompress(archive.data))
+    return [
+        (id, content, sender_id, datetime.fromisoformat(timestamp), archive.chat_room_id)
+        for id, content, sender_id, timestamp in data
+    ]
+
+
+def archive_room(chat_room_id, cutoff, keep, chunk_size):
+    """
+    Move the messages of a room sent before ``cutoff`` into the archive,
+    except for its ``keep`` latest ones. Returns the number of messages
+    archived. Each chunk is written and its messages deleted in one
+    transaction.
+    """
+    messages = ChatRoomMessage.objects.filter(chat_room_id=chat_room_id)
+    newest_cold = list(messages.order_by("-id").values_list("id", flat=True)[keep:keep + 1])
+    if not newest_cold:
+        return 0
+    cold = messages.filter(id__lte=newest_cold[0], timestamp__lt=cutoff).order_by("id")
+
+    archived = 0
+    while True:
+        with transaction.atomic():
+            rows = list(cold.values_list(*MESSAGE_COLUMNS)[:chunk_size])
+            if not rows:
+                return archived
+            # Consecutive runs, so chunks never overlap in ids
+            chunks = [list(chunk) for _, chunk in groupby(rows, key=lambda row: (row[3].year, row[3].month))]
+            if len(rows) == chunk_size and len(chunks) > 1:
+                # The last month may go on, it starts the next chunk instead
+                rows = rows[:-len(chunks.pop())]
+            for chunk in chunks:
+                year, month = chunk[0][3].year, chunk[0][3].month
+                ChatRoomMessageArchive.objects.create(
+                    chat_room_id=chat_room_id,
+                    month=datetime(year, month, 1).date(),
+                    first_id=chunk[0][0],
+                    last_id=chunk[-1][0],
+                    count=len(chunk),
+                    data=_pack(chunk),
+                )
+            ChatRoomMessage.objects.filter(id__in=[row[0] for row in rows]).delete()
+        archived += len(rows)
+
+
+def archived_rows_before(chat_room_id, before_id, limit):
+    """
+    The ``limit`` latest archived messages of a room with an id below
+    ``before_id`` (any id if it is 0), as MESSAGE_COLUMNS rows, newest first.
+    """
+    archives = ChatRoomMessageArchive.objects.filter(chat_room_id=chat_room_id).order_by("-last_id")
+    if before_id:
+        archives = archives.filter(first_id__lt=before_id)
+    rows = []
+    for archive in archives.iterator(chunk_size=4):
+        for row in reversed(_unpack(archive)):
+            if before_id and row[0] >= before_id:
+                continue
+            rows.append(row)
+            if len(rows) == limit:
+                return rows
+    return rows
+
+
+def archived_rows_after(chat_room_id, after_id, limit):
+    """
+    The ``limit`` oldest archived messages of a room with an id above
+    ``after_id``, as MESSAGE_COLUMNS rows, oldest first.
+    """
+    archives = ChatRoomMessageArchive.objects.filter(
+        chat_room_id=chat_room_id, last_id__gt=after_id
+    ).order_by("first_id")
+    rows = []
+    for archive in archives.iterator(chunk_size=4):
+        for row in _unpack(archive):
+            if row[0] <= after_id:
+                continue
+            rows.append(row)
+            if len(rows) == limit:
+                return rows
+    return rows
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import select
+import threading
+import time
+
+from django.db import connection, connections
+
+logger = logging.getLogger('django_socio_grpc')
+
+# NOTIFY channels and what their payload identifies
+MESSAGES = 'chat_room_message'  # chat_room_id of a new message (":<message id>" when known)
+MEMBERSHIP = 'chat_room_user'  # user_id whose rooms changed
+HISTORY = 'chat_room_history'  # chat_room_id whose existing messages were edited or deleted
+CHANNELS = (MESSAGES, MEMBERSHIP, HISTORY)
+
+
+class ChatRoomBroadcaster:
+    """
+    Wakes the streaming RPCs waiting on a room's messages or a user's
+    memberships when they change, so idle streams cost no queries.
+
+    On Postgres, changes are announced with NOTIFY and every process holds
+    one LISTEN connection on a background thread that wakes its local
+    subscribers. While that listener is down (or on other databases, where
+    only changes in this process are seen) ``listening`` is False and
+    streams fall back to polling.
+
+    A subscriber is a ``(loop, asyncio.Event)`` pair; one subscriber may wait
+    on several keys at once. Callbacks added with ``add_callback`` are called
+    with ``(key, detail)`` for every announcement on their channel, and with
+    ``(None, None)`` when anything may have been missed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys = {}
+        self._callbacks = {}
+        self._listener = None
+        self.listening = False
+
+    @property
+    def reliable(self):
+        """Whether every change is announced: across processes on Postgres, only this one elsewhere."""
+        if connections['default'].vendor != 'postgresql':
+            return True
+        self._start_listener()
+        return self.listening
+
+    def add_callback(self, channel, callback):
+        self._callbacks.setdefault(channel, []).append(callback)
+
+    def subscribe(self, channel, key, subscriber=None):
+        self._start_listener()
+        if subscriber is None:
+            subscriber = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._keys.setdefault((channel, key), set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, channel, key, subscriber):
+        with self._lock:
+            subscribers = self._keys.get((channel, key))
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._keys[(channel, key)]
+
+    def publish(self, channel, key, detail=None):
+        with self._lock:
+            subscribers = list(self._keys.get((channel, key), ()))
+        self._wake(subscribers)
+        for callback in self._callbacks.get(channel, ()):
+            callback(key, detail)
+
+    def publish_all(self):
+        with self._lock:
+            subscribers = {subscriber for subscribers in self._keys.values() for subscriber in subscribers}
+        self._wake(subscribers)
+        for callbacks in self._callbacks.values():
+            for callback in callbacks:
+                callback(None, None)
+
+    @staticmethod
+    def _wake(subscribers):
+        for loop, event in subscribers:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Event loop already closed, the stream is gone with it.
+                pass
+
+    def notify(self, channel, key, detail=None):
+        """Announce a change of ``key`` on ``channel`` to every process."""
+        if connection.vendor != 'postgresql':
+            self.publish(channel, key, detail)
+            return
+        payload = str(key) if detail is None else f'{key}:{detail}'
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [channel, payload])
+
+    def _start_listener(self):
+        if self._listener is not None or connections['default'].vendor != 'postgresql':
+            return
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name='chat-room-listener', daemon=True)
+                self._listener.start()
+
+    def _listen(self):
+        backoff = 1
+        while True:
+            db = connections.create_connection('default')
+            try:
+                db.ensure_connection()
+                raw = db.connection
+                raw.autocommit = True
+                with raw.cursor() as cursor:
+                    for channel in CHANNELS:
+                        cursor.execute(f'LISTEN {channel}')
+                self.listening = True
+                backoff = 1
+                # Anything changed while nobody was listening is picked up now.
+                self.publish_all()
+                while True:
+                    if select.select([raw], [], [], 30) == ([], [], []):
+                        continue
+                    raw.poll()
+                    announcements = {}
+                    while raw.notifies:
+                        notify = raw.notifies.pop(0)
+                        key, _, detail = notify.payload.partition(':')
+                        announcements[(notify.channel, int(key), int(detail) if detail else None)] = None
+                    for channel, key, detail in announcements:
+                        self.publish(channel, key, detail)
+            except Exception as e:
+                logger.warning(f'Chat room listener lost its connection: {e}')
+            finally:
+                self.listening = False
+                self.publish_all()
+                try:
+                    db.close()
+                except Exception:
+                    pass
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+
+broadcaster = ChatRoomBroadcaster()
@@ -0,0 +1,70 @@
+"""
+Direct model -> protobuf conversion for the hot chat streams.
+
+Produces the same messages as ``ParseDict(<ProtoSerializer>(obj).data, ...)``
+without building the intermediate DRF dicts. Datetimes are rendered by a
+DRF DateTimeField so the strings stay identical to the serializer output.
+Rooms must be fetched with ``prefetch_related("participants")``, otherwise
+each room costs a participants query, as with ChatRoomProtoSerializer.
+"""
+from rest_framework import serializers
+
+from chat_service.chat.grpc.chat_pb2 import (
+    ChatRoomMessageListResponse,
+    ChatRoomMessageResponse,
+    ChatRoomResponse,
+    ChatRoomUserResponse,
+)
+
+_datetime = serializers.DateTimeField().to_representation
+
+# Columns for ``ChatRoomMessage.objects.values_list(*MESSAGE_COLUMNS)``,
+# read by message_row_to_proto. The id comes first so streams can keep
+# their cursor with ``row[0]``.
+MESSAGE_COLUMNS = ("id", "content", "sender_id", "timestamp", "chat_room_id")
+
+
+def message_to_proto(message):
+    return ChatRoomMessageResponse(
+        id=message.id,
+        content=message.content,
+        sender_id=message.sender_id,
+        timestamp=_datetime(message.timestamp),
+        chat_room=message.chat_room_id,
+    )
+
+
+def message_row_to_proto(row):
+    id, content, sender_id, timestamp, chat_room_id = row
+    return ChatRoomMessageResponse(
+        id=id,
+        content=content,
+        sender_id=sender_id,
+        timestamp=_datetime(timestamp),
+        chat_room=chat_room_id,
+    )
+
+
+def message_rows_to_list_proto(rows):
+    return ChatRoomMessageListResponse(results=[message_row_to_proto(row) for row in rows])
+
+
+def participant_to_proto(participant):
+    return ChatRoomUserResponse(
+        id=participant.id,
+        user_id=participant.user_id,
+        joined_at=_datetime(participant.joined_at),
+        chat_room=participant.chat_room_id,
+    )
+
+
+def chat_room_to_proto(chat_room):
+    response = ChatRoomResponse(
+        id=chat_room.id,
+        name=chat_room.name,
+        created_at=_datetime(chat_room.created_at),
+        participants=[participant_to_proto(participant) for participant in chat_room.participants.all()],
+    )
+    if chat_room.game_id is not None:
+        response.game_id = chat_room.game_id
+    return response
@@ -25,63 +25,85 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!chat_service/chat/grpc/chat.proto\x12\x11\x63hat_service.chat\x1a\x1bgoogle/protobuf/empty.proto\"$\n\x16\x43hatRoomDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\"ChatRoomGetChatRoomByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\x15\n\x13\x43hatRoomListRequest\"L\n\x14\x43hatRoomListResponse\x12\x34\n\x07results\x18\x01 \x03(\x0b\x32#.chat_service.chat.ChatRoomResponse\"+\n\x1d\x43hatRoomMessageDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x1c\n\x1a\x43hatRoomMessageListRequest\"Z\n\x1b\x43hatRoomMessageListResponse\x12;\n\x07results\x18\x01 \x03(\x0b\x32*.chat_service.chat.ChatRoomMessageResponse\"\xba\x01\n#ChatRoomMessagePartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x11\n\tsender_id\x18\x04 \x01(\x05\x12\x16\n\ttimestamp\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x06 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\"\x8d\x01\n\x16\x43hatRoomMessageRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x11\n\tsender_id\x18\x03 \x01(\x05\x12\x16\n\ttimestamp\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\"\x8e\x01\n\x17\x43hatRoomMessageResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x11\n\tsender_id\x18\x03 \x01(\x05\x12\x16\n\ttimestamp\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\",\n\x1e\x43hatRoomMessageRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"G\n/ChatRoomMessageSubscribeChatRoomMessagesRequest\x12\x14\n\x0c\x63hat_room_id\x18\x01 \x01(\x05\"\xae\x01\n\x1c\x43hatRoomPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x17\n\ncreated_at\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x05 \x01(\x05H\x02\x88\x01\x01\x42\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"\x81\x01\n\x0f\x43hatRoomRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\ncreated_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x04 \x01(\x05H\x02\x88\x01\x01\x42\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"\xc1\x01\n\x10\x43hatRoomResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\ncreated_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x04 \x01(\x05H\x02\x88\x01\x01\x12=\n\x0cparticipants\x18\x05 \x03(\x0b\x32\'.chat_service.chat.ChatRoomUserResponseB\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"%\n\x17\x43hatRoomRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"(\n\x1a\x43hatRoomUserDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x19\n\x17\x43hatRoomUserListRequest\"T\n\x18\x43hatRoomUserListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.chat_service.chat.ChatRoomUserResponse\"\xa4\x01\n ChatRoomUserPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\x05\x12\x16\n\tjoined_at\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\"w\n\x13\x43hatRoomUserRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x16\n\tjoined_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\"x\n\x14\x43hatRoomUserResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x16\n\tjoined_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\")\n\x1b\x43hatRoomUserRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x32\xa8\x05\n\x12\x43hatRoomController\x12S\n\x06\x43reate\x12\".chat_service.chat.ChatRoomRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12N\n\x07\x44\x65stroy\x12).chat_service.chat.ChatRoomDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12u\n\x13GetChatRoomByUserId\x12\x35.chat_service.chat.ChatRoomGetChatRoomByUserIdRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x30\x01\x12Y\n\x04List\x12&.chat_service.chat.ChatRoomListRequest\x1a\'.chat_service.chat.ChatRoomListResponse\"\x00\x12g\n\rPartialUpdate\x12/.chat_service.chat.ChatRoomPartialUpdateRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12]\n\x08Retrieve\x12*.chat_service.chat.ChatRoomRetrieveRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12S\n\x06Update\x12\".chat_service.chat.ChatRoomRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x32\x97\x06\n\x19\x43hatRoomMessageController\x12\x61\n\x06\x43reate\x12).chat_service.chat.ChatRoomMessageRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12U\n\x07\x44\x65stroy\x12\x30.chat_service.chat.ChatRoomMessageDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12g\n\x04List\x12-.chat_service.chat.ChatRoomMessageListRequest\x1a..chat_service.chat.ChatRoomMessageListResponse\"\x00\x12u\n\rPartialUpdate\x12\x36.chat_service.chat.ChatRoomMessagePartialUpdateRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12k\n\x08Retrieve\x12\x31.chat_service.chat.ChatRoomMessageRetrieveRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12\x8f\x01\n\x19SubscribeChatRoomMessages\x12\x42.chat_service.chat.ChatRoomMessageSubscribeChatRoomMessagesRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x30\x01\x12\x61\n\x06Update\x12).chat_service.chat.ChatRoomMessageRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x32\xe1\x04\n\x16\x43hatRoomUserController\x12[\n\x06\x43reate\x12&.chat_service.chat.ChatRoomUserRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12R\n\x07\x44\x65stroy\x12-.chat_service.chat.ChatRoomUserDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x61\n\x04List\x12*.chat_service.chat.ChatRoomUserListRequest\x1a+.chat_service.chat.ChatRoomUserListResponse\"\x00\x12o\n\rPartialUpdate\x12\x33.chat_service.chat.ChatRoomUserPartialUpdateRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12\x65\n\x08Retrieve\x12..chat_service.chat.ChatRoomUserRetrieveRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12[\n\x06Update\x12&.chat_service.chat.ChatRoomUserRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!chat_service/chat/grpc/chat.proto\x12\x11\x63hat_service.chat\x1a\x1bgoogle/protobuf/empty.proto\"1\n\x1e\x43hatRoomDestroyByGameIdRequest\x12\x0f\n\x07game_id\x18\x01 \x01(\x05\"2\n\x1f\x43hatRoomDestroyByGameIdResponse\x12\x0f\n\x07\x64\x65leted\x18\x01 \x01(\x05\"$\n\x16\x43hatRoomDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\"ChatRoomGetChatRoomByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\x15\n\x13\x43hatRoomListRequest\"L\n\x14\x43hatRoomListResponse\x12\x34\n\x07results\x18\x01 \x03(\x0b\x32#.chat_service.chat.ChatRoomResponse\"+\n\x1d\x43hatRoomMessageDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"`\n\'ChatRoomMessageListMessagesAfterRequest\x12\x14\n\x0c\x63hat_room_id\x18\x01 \x01(\x05\x12\x10\n\x08\x61\x66ter_id\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\"b\n(ChatRoomMessageListMessagesBeforeRequest\x12\x14\n\x0c\x63hat_room_id\x18\x01 \x01(\x05\x12\x11\n\tbefore_id\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\"\x1c\n\x1a\x43hatRoomMessageListRequest\"Z\n\x1b\x43hatRoomMessageListResponse\x12;\n\x07results\x18\x01 \x03(\x0b\x32*.chat_service.chat.ChatRoomMessageResponse\"\xba\x01\n#ChatRoomMessagePartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x11\n\tsender_id\x18\x04 \x01(\x05\x12\x16\n\ttimestamp\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x06 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\"\x8d\x01\n\x16\x43hatRoomMessageRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x11\n\tsender_id\x18\x03 \x01(\x05\x12\x16\n\ttimestamp\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\"\x8e\x01\n\x17\x43hatRoomMessageResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x11\n\tsender_id\x18\x03 \x01(\x05\x12\x16\n\ttimestamp\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\",\n\x1e\x43hatRoomMessageRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"{\n/ChatRoomMessageSubscribeChatRoomMessagesRequest\x12\x14\n\x0c\x63hat_room_id\x18\x01 \x01(\x05\x12\x10\n\x08\x61\x66ter_id\x18\x02 \x01(\x05\x12\x14\n\x07\x62\x61\x63klog\x18\x03 \x01(\x05H\x00\x88\x01\x01\x42\n\n\x08_backlog\"M\n(ChatRoomMessageSubscribeUserInboxRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x10\n\x08\x61\x66ter_id\x18\x02 \x01(\x05\"\xae\x01\n\x1c\x43hatRoomPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x17\n\ncreated_at\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x05 \x01(\x05H\x02\x88\x01\x01\x42\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"\x81\x01\n\x0f\x43hatRoomRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\ncreated_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x04 \x01(\x05H\x02\x88\x01\x01\x42\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"\xc1\x01\n\x10\x43hatRoomResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\ncreated_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x04 \x01(\x05H\x02\x88\x01\x01\x12=\n\x0cparticipants\x18\x05 \x03(\x0b\x32\'.chat_service.chat.ChatRoomUserResponseB\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"%\n\x17\x43hatRoomRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\":\n\'ChatRoomSubscribeChatRoomChangesRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\x9c\x01\n(ChatRoomSubscribeChatRoomChangesResponse\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x14\n\x0c\x63hat_room_id\x18\x02 \x01(\x05\x12\x36\n\tchat_room\x18\x03 \x01(\x0b\x32#.chat_service.chat.ChatRoomResponse\x12\x14\n\x0croom_deleted\x18\x04 \x01(\x08\"X\n\x1a\x43hatRoomUnreadListResponse\x12:\n\x07results\x18\x01 \x03(\x0b\x32).chat_service.chat.ChatRoomUnreadResponse\"\x83\x01\n\x16\x43hatRoomUnreadResponse\x12\x11\n\tchat_room\x18\x01 \x01(\x05\x12\x19\n\x0clast_read_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x19\n\x0cunread_count\x18\x03 \x01(\x05H\x01\x88\x01\x01\x42\x0f\n\r_last_read_idB\x0f\n\r_unread_count\"(\n\x1a\x43hatRoomUserDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\"ChatRoomUserGetUnreadCountsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\x19\n\x17\x43hatRoomUserListRequest\"T\n\x18\x43hatRoomUserListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.chat_service.chat.ChatRoomUserResponse\"Z\n\x1b\x43hatRoomUserMarkReadRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x14\n\x0c\x63hat_room_id\x18\x02 \x01(\x05\x12\x14\n\x0clast_read_id\x18\x03 \x01(\x05\"\xa4\x01\n ChatRoomUserPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\x05\x12\x16\n\tjoined_at\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\"w\n\x13\x43hatRoomUserRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x16\n\tjoined_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\"x\n\x14\x43hatRoomUserResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x16\n\tjoined_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\")\n\x1b\x43hatRoomUserRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x32\xbe\x07\n\x12\x43hatRoomController\x12S\n\x06\x43reate\x12\".chat_service.chat.ChatRoomRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12N\n\x07\x44\x65stroy\x12).chat_service.chat.ChatRoomDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12z\n\x0f\x44\x65stroyByGameId\x12\x31.chat_service.chat.ChatRoomDestroyByGameIdRequest\x1a\x32.chat_service.chat.ChatRoomDestroyByGameIdResponse\"\x00\x12u\n\x13GetChatRoomByUserId\x12\x35.chat_service.chat.ChatRoomGetChatRoomByUserIdRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x30\x01\x12Y\n\x04List\x12&.chat_service.chat.ChatRoomListRequest\x1a\'.chat_service.chat.ChatRoomListResponse\"\x00\x12g\n\rPartialUpdate\x12/.chat_service.chat.ChatRoomPartialUpdateRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12]\n\x08Retrieve\x12*.chat_service.chat.ChatRoomRetrieveRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12\x97\x01\n\x18SubscribeChatRoomChanges\x12:.chat_service.chat.ChatRoomSubscribeChatRoomChangesRequest\x1a;.chat_service.chat.ChatRoomSubscribeChatRoomChangesResponse\"\x00\x30\x01\x12S\n\x06Update\x12\".chat_service.chat.ChatRoomRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x32\xa5\t\n\x19\x43hatRoomMessageController\x12\x61\n\x06\x43reate\x12).chat_service.chat.ChatRoomMessageRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12U\n\x07\x44\x65stroy\x12\x30.chat_service.chat.ChatRoomMessageDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12g\n\x04List\x12-.chat_service.chat.ChatRoomMessageListRequest\x1a..chat_service.chat.ChatRoomMessageListResponse\"\x00\x12\x81\x01\n\x11ListMessagesAfter\x12:.chat_service.chat.ChatRoomMessageListMessagesAfterRequest\x1a..chat_service.chat.ChatRoomMessageListResponse\"\x00\x12\x83\x01\n\x12ListMessagesBefore\x12;.chat_service.chat.ChatRoomMessageListMessagesBeforeRequest\x1a..chat_service.chat.ChatRoomMessageListResponse\"\x00\x12u\n\rPartialUpdate\x12\x36.chat_service.chat.ChatRoomMessagePartialUpdateRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12k\n\x08Retrieve\x12\x31.chat_service.chat.ChatRoomMessageRetrieveRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12\x8f\x01\n\x19SubscribeChatRoomMessages\x12\x42.chat_service.chat.ChatRoomMessageSubscribeChatRoomMessagesRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x30\x01\x12\x81\x01\n\x12SubscribeUserInbox\x12;.chat_service.chat.ChatRoomMessageSubscribeUserInboxRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x30\x01\x12\x61\n\x06Update\x12).chat_service.chat.ChatRoomMessageRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x32\xc5\x06\n\x16\x43hatRoomUserController\x12[\n\x06\x43reate\x12&.chat_service.chat.ChatRoomUserRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12R\n\x07\x44\x65stroy\x12-.chat_service.chat.ChatRoomUserDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12y\n\x0fGetUnreadCounts\x12\x35.chat_service.chat.ChatRoomUserGetUnreadCountsRequest\x1a-.chat_service.chat.ChatRoomUnreadListResponse\"\x00\x12\x61\n\x04List\x12*.chat_service.chat.ChatRoomUserListRequest\x1a+.chat_service.chat.ChatRoomUserListResponse\"\x00\x12g\n\x08MarkRead\x12..chat_service.chat.ChatRoomUserMarkReadRequest\x1a).chat_service.chat.ChatRoomUnreadResponse\"\x00\x12o\n\rPartialUpdate\x12\x33.chat_service.chat.ChatRoomUserPartialUpdateRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12\x65\n\x08Retrieve\x12..chat_service.chat.ChatRoomUserRetrieveRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12[\n\x06Update\x12&.chat_service.chat.ChatRoomUserRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'chat_service.chat.grpc.chat_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_CHATROOMDESTROYREQUEST']._serialized_start=85
-  _globals['_CHATROOMDESTROYREQUEST']._serialized_end=121
-  _globals['_CHATROOMGETCHATROOMBYUSERIDREQUEST']._serialized_start=123
-  _globals['_CHATROOMGETCHATROOMBYUSERIDREQUEST']._serialized_end=176
-  _globals['_CHATROOMLISTREQUEST']._serialized_start=178
-  _globals['_CHATROOMLISTREQUEST']._serialized_end=199
-  _globals['_CHATROOMLISTRESPONSE']._serialized_start=201
-  _globals['_CHATROOMLISTRESPONSE']._serialized_end=277
-  _globals['_CHATROOMMESSAGEDESTROYREQUEST']._serialized_start=279
-  _globals['_CHATROOMMESSAGEDESTROYREQUEST']._serialized_end=322
-  _globals['_CHATROOMMESSAGELISTREQUEST']._serialized_start=324
-  _globals['_CHATROOMMESSAGELISTREQUEST']._serialized_end=352
-  _globals['_CHATROOMMESSAGELISTRESPONSE']._serialized_start=354
-  _globals['_CHATROOMMESSAGELISTRESPONSE']._serialized_end=444
-  _globals['_CHATROOMMESSAGEPARTIALUPDATEREQUEST']._serialized_start=447
-  _globals['_CHATROOMMESSAGEPARTIALUPDATEREQUEST']._serialized_end=633
-  _globals['_CHATROOMMESSAGEREQUEST']._serialized_start=636
-  _globals['_CHATROOMMESSAGEREQUEST']._serialized_end=777
-  _globals['_CHATROOMMESSAGERESPONSE']._serialized_start=780
-  _globals['_CHATROOMMESSAGERESPONSE']._serialized_end=922
-  _globals['_CHATROOMMESSAGERETRIEVEREQUEST']._serialized_start=924
-  _globals['_CHATROOMMESSAGERETRIEVEREQUEST']._serialized_end=968
-  _globals['_CHATROOMMESSAGESUBSCRIBECHATROOMMESSAGESREQUEST']._serialized_start=970
-  _globals['_CHATROOMMESSAGESUBSCRIBECHATROOMMESSAGESREQUEST']._serialized_end=1041
-  _globals['_CHATROOMPARTIALUPDATEREQUEST']._serialized_start=1044
-  _globals['_CHATROOMPARTIALUPDATEREQUEST']._serialized_end=1218
-  _globals['_CHATROOMREQUEST']._serialized_start=1221
-  _globals['_CHATROOMREQUEST']._serialized_end=1350
-  _globals['_CHATROOMRESPONSE']._serialized_start=1353
-  _globals['_CHATROOMRESPONSE']._serialized_end=1546
-  _globals['_CHATROOMRETRIEVEREQUEST']._serialized_start=1548
-  _globals['_CHATROOMRETRIEVEREQUEST']._serialized_end=1585
-  _globals['_CHATROOMUSERDESTROYREQUEST']._serialized_start=1587
-  _globals['_CHATROOMUSERDESTROYREQUEST']._serialized_end=1627
-  _globals['_CHATROOMUSERLISTREQUEST']._serialized_start=1629
-  _globals['_CHATROOMUSERLISTREQUEST']._serialized_end=1654
-  _globals['_CHATROOMUSERLISTRESPONSE']._serialized_start=1656
-  _globals['_CHATROOMUSERLISTRESPONSE']._serialized_end=1740
-  _globals['_CHATROOMUSERPARTIALUPDATEREQUEST']._serialized_start=1743
-  _globals['_CHATROOMUSERPARTIALUPDATEREQUEST']._serialized_end=1907
-  _globals['_CHATROOMUSERREQUEST']._serialized_start=1909
-  _globals['_CHATROOMUSERREQUEST']._serialized_end=2028
-  _globals['_CHATROOMUSERRESPONSE']._serialized_start=2030
-  _globals['_CHATROOMUSERRESPONSE']._serialized_end=2150
-  _globals['_CHATROOMUSERRETRIEVEREQUEST']._serialized_start=2152
-  _globals['_CHATROOMUSERRETRIEVEREQUEST']._serialized_end=2193
-  _globals['_CHATROOMCONTROLLER']._serialized_start=2196
-  _globals['_CHATROOMCONTROLLER']._serialized_end=2876
-  _globals['_CHATROOMMESSAGECONTROLLER']._serialized_start=2879
-  _globals['_CHATROOMMESSAGECONTROLLER']._serialized_end=3670
-  _globals['_CHATROOMUSERCONTROLLER']._serialized_start=3673
-  _globals['_CHATROOMUSERCONTROLLER']._serialized_end=4282
+  _globals['_CHATROOMDESTROYBYGAMEIDREQUEST']._serialized_start=85
+  _globals['_CHATROOMDESTROYBYGAMEIDREQUEST']._serialized_end=134
+  _globals['_CHATROOMDESTROYBYGAMEIDRESPONSE']._serialized_start=136
+  _globals['_CHATROOMDESTROYBYGAMEIDRESPONSE']._serialized_end=186
+  _globals['_CHATROOMDESTROYREQUEST']._serialized_start=188
+  _globals['_CHATROOMDESTROYREQUEST']._serialized_end=224
+  _globals['_CHATROOMGETCHATROOMBYUSERIDREQUEST']._serialized_start=226
+  _globals['_CHATROOMGETCHATROOMBYUSERIDREQUEST']._serialized_end=279
+  _globals['_CHATROOMLISTREQUEST']._serialized_start=281
+  _globals['_CHATROOMLISTREQUEST']._serialized_end=302
+  _globals['_CHATROOMLISTRESPONSE']._serialized_start=304
+  _globals['_CHATROOMLISTRESPONSE']._serialized_end=380
+  _globals['_CHATROOMMESSAGEDESTROYREQUEST']._serialized_start=382
+  _globals['_CHATROOMMESSAGEDESTROYREQUEST']._serialized_end=425
+  _globals['_CHATROOMMESSAGELISTMESSAGESAFTERREQUEST']._serialized_start=427
+  _globals['_CHATROOMMESSAGELISTMESSAGESAFTERREQUEST']._serialized_end=523
+  _globals['_CHATROOMMESSAGELISTMESSAGESBEFOREREQUEST']._serialized_start=525
+  _globals['_CHATROOMMESSAGELISTMESSAGESBEFOREREQUEST']._serialized_end=623
+  _globals['_CHATROOMMESSAGELISTREQUEST']._serialized_start=625
+  _globals['_CHATROOMMESSAGELISTREQUEST']._serialized_end=653
+  _globals['_CHATROOMMESSAGELISTRESPONSE']._serialized_start=655
+  _globals['_CHATROOMMESSAGELISTRESPONSE']._serialized_end=745
+  _globals['_CHATROOMMESSAGEPARTIALUPDATEREQUEST']._serialized_start=748
+  _globals['_CHATROOMMESSAGEPARTIALUPDATEREQUEST']._serialized_end=934
+  _globals['_CHATROOMMESSAGEREQUEST']._serialized_start=937
+  _globals['_CHATROOMMESSAGEREQUEST']._serialized_end=1078
+  _globals['_CHATROOMMESSAGERESPONSE']._serialized_start=1081
+  _globals['_CHATROOMMESSAGERESPONSE']._serialized_end=1223
+  _globals['_CHATROOMMESSAGERETRIEVEREQUEST']._serialized_start=1225
+  _globals['_CHATROOMMESSAGERETRIEVEREQUEST']._serialized_end=1269
+  _globals['_CHATROOMMESSAGESUBSCRIBECHATROOMMESSAGESREQUEST']._serialized_start=1271
+  _globals['_CHATROOMMESSAGESUBSCRIBECHATROOMMESSAGESREQUEST']._serialized_end=1394
+  _globals['_CHATROOMMESSAGESUBSCRIBEUSERINBOXREQUEST']._serialized_start=1396
+  _globals['_CHATROOMMESSAGESUBSCRIBEUSERINBOXREQUEST']._serialized_end=1473
+  _globals['_CHATROOMPARTIALUPDATEREQUEST']._serialized_start=1476
+  _globals['_CHATROOMPARTIALUPDATEREQUEST']._serialized_end=1650
+  _globals['_CHATROOMREQUEST']._serialized_start=1653
+  _globals['_CHATROOMREQUEST']._serialized_end=1782
+  _globals['_CHATROOMRESPONSE']._serialized_start=1785
+  _globals['_CHATROOMRESPONSE']._serialized_end=1978
+  _globals['_CHATROOMRETRIEVEREQUEST']._serialized_start=1980
+  _globals['_CHATROOMRETRIEVEREQUEST']._serialized_end=2017
+  _globals['_CHATROOMSUBSCRIBECHATROOMCHANGESREQUEST']._serialized_start=2019
+  _globals['_CHATROOMSUBSCRIBECHATROOMCHANGESREQUEST']._serialized_end=2077
+  _globals['_CHATROOMSUBSCRIBECHATROOMCHANGESRESPONSE']._serialized_start=2080
+  _globals['_CHATROOMSUBSCRIBECHATROOMCHANGESRESPONSE']._serialized_end=2236
+  _globals['_CHATROOMUNREADLISTRESPONSE']._serialized_start=2238
+  _globals['_CHATROOMUNREADLISTRESPONSE']._serialized_end=2326
+  _globals['_CHATROOMUNREADRESPONSE']._serialized_start=2329
+  _globals['_CHATROOMUNREADRESPONSE']._serialized_end=2460
+  _globals['_CHATROOMUSERDESTROYREQUEST']._serialized_start=2462
+  _globals['_CHATROOMUSERDESTROYREQUEST']._serialized_end=2502
+  _globals['_CHATROOMUSERGETUNREADCOUNTSREQUEST']._serialized_start=2504
+  _globals['_CHATROOMUSERGETUNREADCOUNTSREQUEST']._serialized_end=2557
+  _globals['_CHATROOMUSERLISTREQUEST']._serialized_start=2559
+  _globals['_CHATROOMUSERLISTREQUEST']._serialized_end=2584
+  _globals['_CHATROOMUSERLISTRESPONSE']._serialized_start=2586
+  _globals['_CHATROOMUSERLISTRESPONSE']._serialized_end=2670
+  _globals['_CHATROOMUSERMARKREADREQUEST']._serialized_start=2672
+  _globals['_CHATROOMUSERMARKREADREQUEST']._serialized_end=2762
+  _globals['_CHATROOMUSERPARTIALUPDATEREQUEST']._serialized_start=2765
+  _globals['_CHATROOMUSERPARTIALUPDATEREQUEST']._serialized_end=2929
+  _globals['_CHATROOMUSERREQUEST']._serialized_start=2931
+  _globals['_CHATROOMUSERREQUEST']._serialized_end=3050
+  _globals['_CHATROOMUSERRESPONSE']._serialized_start=3052
+  _globals['_CHATROOMUSERRESPONSE']._serialized_end=3172
+  _globals['_CHATROOMUSERRETRIEVEREQUEST']._serialized_start=3174
+  _globals['_CHATROOMUSERRETRIEVEREQUEST']._serialized_end=3215
+  _globals['_CHATROOMCONTROLLER']._serialized_start=3218
+  _globals['_CHATROOMCONTROLLER']._serialized_end=4176
+  _globals['_CHATROOMMESSAGECONTROLLER']._serialized_start=4179
+  _globals['_CHATROOMMESSAGECONTROLLER']._serialized_end=5368
+  _globals['_CHATROOMUSERCONTROLLER']._serialized_start=5371
+  _globals['_CHATROOMUSERCONTROLLER']._serialized_end=6208
 # @@protoc_insertion_point(module_scope)
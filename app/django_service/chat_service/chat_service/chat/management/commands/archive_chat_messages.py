@@ -0,0 +1,46 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+
+from chat_service.chat.archive import archive_room
+from chat_service.chat.models import ChatRoomMessage
+
+
+class Command(BaseCommand):
+    help = (
+        "Move cold chat messages into compressed ChatRoomMessageArchive chunks. "
+        "Archived history stays readable through ListMessagesBefore. Safe to run "
+        "repeatedly, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days", type=int, default=settings.CHAT_MESSAGE_ARCHIVE_AFTER_DAYS,
+            help="Archive messages older than this",
+        )
+        parser.add_argument(
+            "--keep", type=int, default=settings.CHAT_MESSAGE_ARCHIVE_KEEP,
+            help="Latest messages per room that are never archived",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=settings.CHAT_MESSAGE_ARCHIVE_CHUNK_SIZE,
+            help="Messages per archive chunk (and per transaction)",
+        )
+        parser.add_argument("--room", type=int, action="append", help="Only archive these chat rooms")
+
+    def handle(self, *args, **options):
+        cutoff = now() - timedelta(days=options["older_than_days"])
+        rooms = ChatRoomMessage.objects.filter(timestamp__lt=cutoff)
+        if options["room"]:
+            rooms = rooms.filter(chat_room_id__in=options["room"])
+        rooms = rooms.values_list("chat_room_id", flat=True).distinct().order_by("chat_room_id")
+
+        total = 0
+        for chat_room_id in rooms:
+            archived = archive_room(chat_room_id, cutoff, options["keep"], options["chunk_size"])
+            if archived:
+                self.stdout.write(f"Chat room {chat_room_id}: archived {archived} messages")
+            total += archived
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} messages sent before {cutoff:%Y-%m-%d %H:%M}"))
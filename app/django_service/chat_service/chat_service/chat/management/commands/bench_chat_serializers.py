@@ -0,0 +1,84 @@
+import timeit
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+from google.protobuf.json_format import ParseDict
+
+from chat_service.chat.fast_serializers import (
+    MESSAGE_COLUMNS,
+    chat_room_to_proto,
+    message_row_to_proto,
+    message_to_proto,
+)
+from chat_service.chat.grpc.chat_pb2 import ChatRoomMessageResponse, ChatRoomResponse
+from chat_service.chat.models import ChatRoom, ChatRoomMessage, ChatRoomUser
+from chat_service.chat.serializers import ChatRoomMessageProtoSerializer, ChatRoomProtoSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Microbenchmark of the DRF serializer path (serializer.data -> ParseDict) "
+        "against chat.fast_serializers. Runs on in-memory rows, no database needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=1000, help="Messages per run")
+        parser.add_argument("--rooms", type=int, default=100, help="Rooms per run")
+        parser.add_argument("--participants", type=int, default=4, help="Participants per room")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per path, the best one is reported")
+
+    def handle(self, *args, **options):
+        messages, rooms = self.build(options["messages"], options["rooms"], options["participants"])
+        rows = [tuple(getattr(message, column) for column in MESSAGE_COLUMNS) for message in messages]
+
+        paths = [
+            ("message", "drf", len(messages),
+             lambda: [ParseDict(ChatRoomMessageProtoSerializer(m).data, ChatRoomMessageResponse()) for m in messages]),
+            ("message", "fast (model)", len(messages), lambda: [message_to_proto(m) for m in messages]),
+            ("message", "fast (values)", len(rows), lambda: [message_row_to_proto(row) for row in rows]),
+            ("chat room", "drf", len(rooms),
+             lambda: [ParseDict(ChatRoomProtoSerializer(room).data, ChatRoomResponse()) for room in rooms]),
+            ("chat room", "fast (model)", len(rooms), lambda: [chat_room_to_proto(room) for room in rooms]),
+        ]
+
+        # Both paths have to produce the same messages for the numbers to mean anything
+        results = {}
+        for kind, name, _, run in paths:
+            result = run()
+            if results.setdefault(kind, result) != result:
+                raise AssertionError(f"{kind} {name} differs from the DRF output")
+
+        baselines = {}
+        self.stdout.write(f"{'':10} {'path':14} {'us/object':>10} {'speedup':>8}")
+        for kind, name, count, run in paths:
+            best = min(timeit.repeat(run, number=1, repeat=options["repeat"]))
+            per_object = best / count * 1e6
+            baseline = baselines.setdefault(kind, per_object)
+            self.stdout.write(f"{kind:10} {name:14} {per_object:10.2f} {baseline / per_object:7.1f}x")
+
+    @staticmethod
+    def build(message_count, room_count, participant_count):
+        start = now()
+        rooms = []
+        for room_id in range(1, room_count + 1):
+            room = ChatRoom(id=room_id, name=f"Room {room_id}", created_at=start, game_id=room_id if room_id % 2 else None)
+            participants = ChatRoomUser.objects.none()
+            participants._result_cache = [
+                ChatRoomUser(id=room_id * 100 + n, user_id=n, chat_room=room, joined_at=start + timedelta(seconds=n))
+                for n in range(participant_count)
+            ]
+            # What prefetch_related("participants") leaves behind
+            room._prefetched_objects_cache = {"participants": participants}
+            rooms.append(room)
+        messages = [
+            ChatRoomMessage(
+                id=n,
+                content=f"Message number {n} " * 4,
+                sender_id=n % 50,
+                chat_room=rooms[n % room_count],
+                timestamp=start + timedelta(milliseconds=n),
+            )
+            for n in range(1, message_count + 1)
+        ]
+        return messages, rooms
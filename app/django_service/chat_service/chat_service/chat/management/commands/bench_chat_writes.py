@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from chat_service.chat.models import ChatRoom, ChatRoomMessage
+from chat_service.chat.write_buffer import ASYNC, GROUP, SYNC, write_buffer
+
+
+class Command(BaseCommand):
+    help = (
+        "Throughput of chat message writes in each CHAT_MESSAGE_WRITE_MODE, with "
+        "concurrent writers. Writes to the configured database in a scratch room "
+        "that is deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--messages", type=int, default=2000, help="Messages per mode")
+        parser.add_argument("--concurrency", type=int, default=50, help="Concurrent writers")
+        parser.add_argument("--modes", nargs="+", default=[SYNC, GROUP, ASYNC], choices=[SYNC, GROUP, ASYNC])
+
+    def handle(self, *args, **options):
+        room = ChatRoom.objects.create(name="bench_chat_writes")
+        try:
+            self.stdout.write(f"{'mode':8} {'messages/s':>11} {'ack p50 ms':>11} {'ack p99 ms':>11}")
+            for mode in options["modes"]:
+                with override_settings(CHAT_MESSAGE_WRITE_MODE=mode):
+                    effective = write_buffer.mode
+                    rate, p50, p99 = asyncio.run(self.run(room, mode, options["messages"], options["concurrency"]))
+                label = mode if effective == mode else f"{mode}*"
+                self.stdout.write(f"{label:8} {rate:11.0f} {p50:11.2f} {p99:11.2f}")
+                if effective != mode:
+                    self.stdout.write(f"* ran as {effective} on this database")
+        finally:
+            room.delete()
+
+    async def run(self, room, mode, count, concurrency):
+        latencies = []
+        queue = asyncio.Queue()
+        for n in range(count):
+            queue.put_nowait(n)
+
+        async def writer():
+            while not queue.empty():
+                n = queue.get_nowait()
+                message = ChatRoomMessage(chat_room=room, sender_id=n % 50, content=f"Message {n}")
+                start = time.perf_counter()
+                if mode == SYNC:
+                    await sync_to_async(message.save)()
+                else:
+                    await write_buffer.save(message)
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(writer() for _ in range(concurrency)))
+        # Write-behind acknowledges early, wait until everything is stored
+        stored = ChatRoomMessage.objects.filter(chat_room=room)
+        while await stored.acount() < count:
+            await asyncio.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        await stored.adelete()
+
+        latencies.sort()
+        return count / elapsed, latencies[len(latencies) // 2] * 1000, latencies[int(len(latencies) * 0.99)] * 1000
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0002_alter_chatroomuser_unique_together'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatroommessage',
+            index=models.Index(fields=['chat_room', 'id'], name='chat_message_room_id_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0003_chatroommessage_room_id_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='chatroom',
+            name='game_id',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0004_chatroom_game_id_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChatRoomMessageArchive',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('month', models.DateField()),
+                ('first_id', models.IntegerField()),
+                ('last_id', models.IntegerField()),
+                ('count', models.IntegerField()),
+                ('data', models.BinaryField()),
+                ('chat_room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archives', to='chat.chatroom')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['chat_room', 'last_id'], name='chat_archive_room_last_id_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 18:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0005_chatroommessagearchive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatroomuser',
+            name='last_read_id',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='chatroomuser',
+            name='unread_count',
+            field=models.IntegerField(default=0),
+        ),
+    ]
@@ -6,7 +6,7 @@ class ChatRoom(models.Model):
     id = models.AutoField(primary_key=True)  # Auto-generated primary key
     name = models.CharField(max_length=255)  # Name of the chat room
     created_at = models.DateTimeField(default=now)  # Timestamp for when the room was created
-    game_id = models.IntegerField(null=True, blank=True)  # Foreign key to the game (optional)
+    game_id = models.IntegerField(null=True, blank=True, db_index=True)  # Foreign key to the game (optional)
 
     def __str__(self):
         return self.name
@@ -21,9 +21,33 @@ class ChatRoomMessage(models.Model):
     )  # Foreign key to the ChatRoom
     timestamp = models.DateTimeField(default=now)  # Timestamp of the message
 
+    class Meta:
+        # Subscriptions and scrollback page through a room by id
+        indexes = [models.Index(fields=["chat_room", "id"], name="chat_message_room_id_idx")]
+
     def __str__(self):
         return f"Message {self.id} in ChatRoom {self.chat_room}"
 
+# ChatRoomMessageArchive model
+class ChatRoomMessageArchive(models.Model):
+    """Cold messages of a room, moved out of ChatRoomMessage by archive_chat_messages (see chat.archive)."""
+    id = models.AutoField(primary_key=True)  # Auto-generated primary key
+    chat_room = models.ForeignKey(
+        ChatRoom, related_name="archives", on_delete=models.CASCADE
+    )  # Foreign key to the ChatRoom
+    month = models.DateField()  # First day of the month the messages were sent in
+    first_id = models.IntegerField()  # Lowest message id in the chunk
+    last_id = models.IntegerField()  # Highest message id in the chunk
+    count = models.IntegerField()  # Number of messages in the chunk
+    data = models.BinaryField()  # zlib-compressed JSON rows, oldest first
+
+    class Meta:
+        # History reads walk a room's chunks from the newest one
+        indexes = [models.Index(fields=["chat_room", "last_id"], name="chat_archive_room_last_id_idx")]
+
+    def __str__(self):
+        return f"Archive of ChatRoom {self.chat_room_id} messages {self.first_id}-{self.last_id}"
+
 # ChatRoomUser model
 class ChatRoomUser(models.Model):
     id = models.AutoField(primary_key=True)  # Auto-generated primary key
@@ -32,6 +56,8 @@ class ChatRoomUser(models.Model):
         ChatRoom, related_name="participants", on_delete=models.CASCADE
     )  # Foreign key to the ChatRoom
     joined_at = models.DateTimeField(default=now)  # Timestamp when the user joined the room
+    last_read_id = models.IntegerField(default=0)  # Latest message id the user has read (see chat.unread)
+    unread_count = models.IntegerField(default=0)  # Messages of others after last_read_id, kept up to date on write
     class Meta:
         unique_together = [['user_id', 'chat_room']]
     def __str__(self):
@@ -0,0 +1,205 @@
+import threading
+from collections import OrderedDict, deque
+
+from django.conf import settings
+
+from .broadcast import HISTORY, MESSAGES, broadcaster
+from .fast_serializers import MESSAGE_COLUMNS, message_row_to_proto, message_to_proto
+from .models import ChatRoomMessage
+
+# Rough per-message overhead of a cached ChatRoomMessageResponse on top of
+# its serialized size
+MESSAGE_OVERHEAD = 200
+
+
+class _Room:
+    __slots__ = ("messages", "ids", "bytes", "complete", "stale", "reload", "generation")
+
+    def __init__(self):
+        self.messages = deque()
+        self.ids = set()
+        self.bytes = 0
+        # Holds every message of the room, nothing older exists
+        self.complete = False
+        # New messages may be missing (stale) or anything may be wrong (reload)
+        self.stale = False
+        self.reload = True
+        # Bumped by every announcement, to spot the ones racing with a refresh
+        self.generation = 0
+
+    @property
+    def last_id(self):
+        return self.messages[-1].id if self.messages else 0
+
+
+class RecentMessages:
+    """
+    The latest CHAT_RECENT_MESSAGES_PER_ROOM messages of recently read rooms,
+    as ready ChatRoomMessageResponse messages, so opening a room does not
+    query the database.
+
+    Rooms are warmed on their first read and least recently read rooms are
+    evicted once the cache holds more than CHAT_RECENT_MESSAGES_MAX_BYTES.
+    Messages written by this process are appended as they are committed;
+    the broadcaster's announcements of other messages mark a room stale
+    (fetched incrementally on its next read), edits and deletes have it
+    reread. While the broadcaster cannot vouch for seeing every change,
+    nothing is served from the cache.
+    """
+
+    def __init__(self, size=None, max_bytes=None):
+        self._size = size
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._rooms = OrderedDict()
+        self._bytes = 0
+        broadcaster.add_callback(MESSAGES, self._on_message)
+        broadcaster.add_callback(HISTORY, self._on_history)
+
+    @property
+    def size(self):
+        if self._size is None:
+            self._size = settings.CHAT_RECENT_MESSAGES_PER_ROOM
+        return self._size
+
+    @property
+    def max_bytes(self):
+        if self._max_bytes is None:
+            self._max_bytes = settings.CHAT_RECENT_MESSAGES_MAX_BYTES
+        return self._max_bytes
+
+    def get(self, chat_room_id, limit, before_id=0, after_id=0):
+        """
+        The ``limit`` latest messages of a room with an id above ``after_id``
+        and below ``before_id`` (if set), oldest first, along with the room's
+        latest message id. With ``limit`` None every such message is returned.
+        Returns None if the cache cannot answer, the caller then reads the
+        database.
+
+        Refreshing a room queries the database, call it off the event loop.
+        """
+        if self.size <= 0 or not broadcaster.reliable:
+            return None
+        room = self._refresh(chat_room_id)
+        with self._lock:
+            messages = [
+                message for message in room.messages
+                if message.id > after_id and (not before_id or message.id < before_id)
+            ]
+            oldest_id = room.messages[0].id if room.messages else None
+            covered = (
+                (limit is not None and len(messages) >= limit)
+                or room.complete
+                or (oldest_id is not None and oldest_id <= after_id)
+            )
+            if not covered:
+                return None
+            if limit is not None:
+                messages = messages[-limit:] if limit else []
+            return messages, room.last_id
+
+    def _refresh(self, chat_room_id):
+        with self._lock:
+            room = self._rooms.get(chat_room_id)
+            if room is None:
+                room = self._rooms[chat_room_id] = _Room()
+            self._rooms.move_to_end(chat_room_id)
+            if not room.reload and not room.stale:
+                return room
+            # The flags stay set until the result is in, so concurrent
+            # readers do not take the room for fresh in the meantime
+            reload, generation, last_id = room.reload, room.generation, room.last_id
+
+        messages = ChatRoomMessage.objects.filter(chat_room_id=chat_room_id)
+        if not reload:
+            messages = messages.filter(id__gt=last_id)
+        rows = list(messages.order_by("-id").values_list(*MESSAGE_COLUMNS)[:self.size])
+        # Too many new messages to append, start over from them
+        reload = reload or len(rows) == self.size
+
+        with self._lock:
+            current = self._rooms.get(chat_room_id)
+            if current is not room:
+                if current is not None:
+                    # Evicted and warmed again meanwhile, that refresh owns it
+                    return current
+                self._rooms[chat_room_id] = room
+            if reload:
+                self._clear(room)
+                room.complete = len(rows) < self.size
+            for row in reversed(rows):
+                if row[0] > room.last_id:
+                    self._append(room, message_row_to_proto(row))
+            if room.generation == generation:
+                room.stale = False
+                room.reload = False
+            # Otherwise it was announced while querying and may already be behind
+            self._evict()
+        return room
+
+    def add(self, messages):
+        """Append just committed messages to the rooms that are cached and fresh."""
+        with self._lock:
+            for message in sorted(messages, key=lambda message: message.id):
+                room = self._rooms.get(message.chat_room_id)
+                if room is None or room.reload or room.stale or message.id in room.ids:
+                    continue
+                if message.id < room.last_id:
+                    # Committed out of order, the room is reread instead
+                    room.reload = True
+                    continue
+                self._append(room, message_to_proto(message))
+            self._evict()
+
+    def _append(self, room, message):
+        room.messages.append(message)
+        room.ids.add(message.id)
+        size = message.ByteSize() + MESSAGE_OVERHEAD
+        room.bytes += size
+        self._bytes += size
+        while len(room.messages) > self.size:
+            dropped = room.messages.popleft()
+            room.ids.discard(dropped.id)
+            size = dropped.ByteSize() + MESSAGE_OVERHEAD
+            room.bytes -= size
+            self._bytes -= size
+            room.complete = False
+
+    def _clear(self, room):
+        self._bytes -= room.bytes
+        room.messages.clear()
+        room.ids.clear()
+        room.bytes = 0
+        room.complete = False
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._rooms:
+            _, room = self._rooms.popitem(last=False)
+            self._clear(room)
+            room.reload = True
+            room.generation += 1
+
+    def _on_message(self, chat_room_id, message_id):
+        with self._lock:
+            rooms = self._rooms.values() if chat_room_id is None else [self._rooms.get(chat_room_id)]
+            for room in rooms:
+                if room is None:
+                    continue
+                room.generation += 1
+                if chat_room_id is None:
+                    room.reload = True
+                elif message_id is None or message_id not in room.ids:
+                    room.stale = True
+                    if message_id is not None and message_id < room.last_id:
+                        room.reload = True
+
+    def _on_history(self, chat_room_id, _):
+        with self._lock:
+            rooms = self._rooms.values() if chat_room_id is None else [self._rooms.get(chat_room_id)]
+            for room in rooms:
+                if room is not None:
+                    room.generation += 1
+                    room.reload = True
+
+
+recent_messages = RecentMessages()
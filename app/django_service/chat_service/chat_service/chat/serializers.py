@@ -4,6 +4,8 @@ from .models import ChatRoom, ChatRoomMessage, ChatRoomUser
 from chat_service.chat.grpc.chat_pb2 import (
     ChatRoomListResponse,
     ChatRoomMessageListResponse,
+    ChatRoomUnreadListResponse,
+    ChatRoomUnreadResponse,
     ChatRoomUserListResponse,
     ChatRoomResponse,
     ChatRoomMessageResponse,
@@ -14,7 +16,16 @@ class ChatRoomUserProtoSerializer(proto_serializers.ModelProtoSerializer):
         model = ChatRoomUser
         proto_class = ChatRoomUserResponse
         proto_class_list = ChatRoomUserListResponse
-        fields = "__all__"
+        # A participant's read state is only served to that user, see ChatRoomUnreadProtoSerializer
+        exclude = ["last_read_id", "unread_count"]
+
+
+class ChatRoomUnreadProtoSerializer(proto_serializers.ModelProtoSerializer):
+    class Meta:
+        model = ChatRoomUser
+        proto_class = ChatRoomUnreadResponse
+        proto_class_list = ChatRoomUnreadListResponse
+        fields = ["chat_room", "last_read_id", "unread_count"]
 
 class ChatRoomProtoSerializer(proto_serializers.ModelProtoSerializer):
     participants = ChatRoomUserProtoSerializer(many=True, read_only=True)
@@ -3,7 +3,12 @@ import grp
 from urllib import response
 from django_socio_grpc import generics, mixins
 from .models import ChatRoom, ChatRoomMessage, ChatRoomUser
-from .serializers import ChatRoomProtoSerializer, ChatRoomMessageProtoSerializer, ChatRoomUserProtoSerializer
+from .serializers import (
+    ChatRoomProtoSerializer,
+    ChatRoomMessageProtoSerializer,
+    ChatRoomUnreadProtoSerializer,
+    ChatRoomUserProtoSerializer,
+)
 from django_socio_grpc.decorators import grpc_action
 from django_socio_grpc.protobuf.generation_plugin import ListGenerationPlugin
 from asgiref.sync import sync_to_async
@@ -12,6 +17,15 @@ from chat_service.chat.grpc import chat_pb2, chat_pb2_grpc
 from chat_service.chat.grpc.chat_pb2 import ChatRoomMessageResponse, ChatRoomResponse  # Import the correct gRPC message class
 import logging
 from django_socio_grpc.exceptions import NotFound
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from .archive import archived_rows_after, archived_rows_before
+from .broadcast import HISTORY, MEMBERSHIP, MESSAGES, broadcaster
+from .fast_serializers import MESSAGE_COLUMNS, chat_room_to_proto, message_row_to_proto
+from .recent import recent_messages
+from .unread import mark_read
+from .write_buffer import SYNC, write_buffer
 
 logger = logging.getLogger('django_socio_grpc')
 
@@ -20,6 +34,53 @@ class ChatRoomService(generics.AsyncModelService):
     queryset = ChatRoom.objects.all()
     serializer_class = ChatRoomProtoSerializer
 
+    CHAT_ROOM_ADDED = "added"
+    CHAT_ROOM_UPDATED = "updated"
+    CHAT_ROOM_REMOVED = "removed"
+
+    def _chat_rooms_of(self, user_id):
+        chat_rooms = ChatRoom.objects.filter(participants__user_id=user_id).prefetch_related("participants")
+        return {chat_room.id: chat_room_to_proto(chat_room) for chat_room in chat_rooms}
+
+    async def _chat_room_changes(self, user_id, context):
+        """
+        Yields ``(kind, chat_room_id, ChatRoomResponse, room_deleted)``
+        whenever a room ``user_id`` is in is added, updated (renamed or its
+        participants changed) or removed, starting with an ``added`` for
+        every current room. Only queries when the broadcaster announces a
+        membership change of the user, or on every poll while it is not
+        listening.
+        """
+        subscriber = broadcaster.subscribe(MEMBERSHIP, user_id)
+        _, wakeup = subscriber
+        known = {}
+        try:
+            await context.send_initial_metadata(())
+            while True:
+                current = await sync_to_async(self._chat_rooms_of)(user_id)
+                removed = sorted(known.keys() - current.keys())
+                if removed:
+                    still_there = set(await sync_to_async(list)(
+                        ChatRoom.objects.filter(id__in=removed).values_list("id", flat=True)
+                    ))
+                    for chat_room_id in removed:
+                        yield self.CHAT_ROOM_REMOVED, chat_room_id, known[chat_room_id], chat_room_id not in still_there
+                for chat_room_id, chat_room in current.items():
+                    if chat_room_id not in known:
+                        yield self.CHAT_ROOM_ADDED, chat_room_id, chat_room, False
+                    elif chat_room != known[chat_room_id]:
+                        yield self.CHAT_ROOM_UPDATED, chat_room_id, chat_room, False
+                known = current
+
+                timeout = None if broadcaster.listening else settings.CHAT_MEMBERSHIP_POLL_INTERVAL
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+        finally:
+            broadcaster.unsubscribe(MEMBERSHIP, user_id, subscriber)
+
     @grpc_action(request=[{"name": "user_id", "type": "int32"}],
                  response=ChatRoomProtoSerializer,
                  response_stream=True)
@@ -32,66 +93,317 @@ class ChatRoomService(generics.AsyncModelService):
             context: The gRPC context for the call.
 
         Yields:
-            Serialized chat room data for each chat room associated with the specified user.
+            Serialized chat room data for each chat room the user is in, then
+            for each room they join. SubscribeChatRoomChanges also reports
+            updated and removed rooms.
         """
-        user_id = request.user_id
-        last_chat_rooms = set()
-
-        while True:
-            # Fetch chat rooms where the specified user is a participant
-            chat_rooms = await sync_to_async(list)(ChatRoom.objects.filter(participants__user_id=user_id))
-
-            # Convert chat rooms to a set of IDs for comparison
-            current_chat_rooms = set(chat_room.id for chat_room in chat_rooms)
-
-            # Check for new or updated chat rooms
-            new_or_updated_chat_rooms = current_chat_rooms - last_chat_rooms
+        async for kind, _, chat_room, _ in self._chat_room_changes(request.user_id, context):
+            if kind == self.CHAT_ROOM_ADDED:
+                yield chat_room
 
-            for chat_room in chat_rooms:
-                if chat_room.id in new_or_updated_chat_rooms:
-                    serialized_message = await sync_to_async(lambda: self.serializer_class(chat_room).data)()
-                    yield ParseDict(serialized_message, ChatRoomResponse())
-
-            # Update the last chat rooms set
-            last_chat_rooms = current_chat_rooms
+    @grpc_action(
+        request=[{"name": "user_id", "type": "int32"}],
+        response=[
+            {"name": "kind", "type": "string", "comment": "added, updated or removed"},
+            {"name": "chat_room_id", "type": "int32"},
+            {"name": "chat_room", "type": "ChatRoomResponse", "comment": "Last known state for removed rooms"},
+            {"name": "room_deleted", "type": "bool", "comment": "Removed because the room itself was deleted"},
+        ],
+        response_stream=True,
+    )
+    async def SubscribeChatRoomChanges(self, request, context):
+        """
+        Streams the changes to the rooms of ``user_id``: every current room
+        as ``added``, then rooms joined (``added``), renamed or with changed
+        participants (``updated``) and left or deleted (``removed``).
+        """
+        async for kind, chat_room_id, chat_room, room_deleted in self._chat_room_changes(request.user_id, context):
+            yield chat_pb2.ChatRoomSubscribeChatRoomChangesResponse(
+                kind=kind,
+                chat_room_id=chat_room_id,
+                chat_room=chat_room,
+                room_deleted=room_deleted,
+            )
 
-            # Sleep for a while before checking for updates again
-            await asyncio.sleep(5)
+    @grpc_action(
+        request=[{"name": "game_id", "type": "int32"}],
+        response=[{"name": "deleted", "type": "int32", "comment": "Number of chat rooms deleted"}],
+    )
+    async def DestroyByGameId(self, request, context):
+        """
+        Deletes the chat rooms of a game, with their messages and
+        participants, through the game_id index.
+        """
+        _, deleted = await ChatRoom.objects.filter(game_id=request.game_id).adelete()
+        return chat_pb2.ChatRoomDestroyByGameIdResponse(deleted=deleted.get(ChatRoom._meta.label, 0))
 
 class ChatRoomMessageService(generics.AsyncModelService):
     queryset = ChatRoomMessage.objects.all()
     serializer_class = ChatRoomMessageProtoSerializer
     filter_set = {"chat_room_id": "chat_room_id"}
 
-    @grpc_action(request=[{"name": "chat_room_id", "type": "int32"}], response=ChatRoomMessageProtoSerializer, response_stream=True)
+    async def aperform_create(self, serializer):
+        """Goes through the write buffer unless CHAT_MESSAGE_WRITE_MODE is sync."""
+        if write_buffer.mode == SYNC:
+            # The message commits together with the unread counters it bumps
+            return await sync_to_async(transaction.atomic(serializer.save))()
+        serializer.instance = await write_buffer.save(ChatRoomMessage(**serializer.validated_data))
+
+    async def aperform_destroy(self, instance):
+        # Not a post_delete receiver, which would slow down deleting messages in bulk
+        await super().aperform_destroy(instance)
+        await sync_to_async(broadcaster.notify)(HISTORY, instance.chat_room_id)
+
+    @grpc_action(
+        request=[
+            {"name": "chat_room_id", "type": "int32"},
+            {"name": "after_id", "type": "int32"},
+            {"name": "backlog", "type": "int32", "cardinality": "optional"},
+        ],
+        response=ChatRoomMessageProtoSerializer,
+        response_stream=True,
+    )
     async def SubscribeChatRoomMessages(self, request, context):
-        chat_room_id = request.chat_room_id
-        last_message_id = None
+        """
+        Streams the messages of a chat room: at most ``backlog`` of the
+        latest messages after ``after_id`` (everything is "after" 0), then
+        new messages as the broadcaster announces them. Older messages are
+        fetched with ListMessagesBefore. Without ``backlog`` it defaults to
+        CHAT_MESSAGE_BACKLOG; with ``backlog`` 0 only new messages are sent.
 
-        # Create an async generator to yield messages
-        async def message_generator():
-            nonlocal last_message_id
+        The backlog and new messages come from recent_messages when it
+        holds them, from the database otherwise.
+
+        Initial metadata is sent once the stream's starting point is fixed,
+        so clients can fetch anything older without missing a message.
+        Polls every CHAT_MESSAGE_POLL_INTERVAL seconds only while the
+        broadcaster is not listening for NOTIFYs.
+        """
+        chat_room_id = request.chat_room_id
+        backlog = request.backlog if request.HasField("backlog") else settings.CHAT_MESSAGE_BACKLOG
+        backlog = min(max(backlog, 0), settings.CHAT_MESSAGE_BACKLOG_MAX)
+        subscriber = broadcaster.subscribe(MESSAGES, chat_room_id)
+        _, wakeup = subscriber
+        try:
+            room_messages = self.queryset.filter(chat_room_id=chat_room_id)
+            cached = await sync_to_async(recent_messages.get)(chat_room_id, backlog, after_id=request.after_id)
+            if cached is not None:
+                messages, latest_id = cached
+                last_message_id = max(request.after_id, latest_id)
+            else:
+                latest_id = await room_messages.order_by("-id").values_list("id", flat=True).afirst()
+                last_message_id = max(request.after_id, latest_id or 0)
+                # Latest messages first so the backlog is cut at the old end, on
+                # the (chat_room_id, id) index
+                messages = []
+                if backlog and last_message_id > request.after_id:
+                    rows = await sync_to_async(list)(
+                        room_messages.filter(id__gt=request.after_id, id__lte=last_message_id)
+                        .order_by("-id")
+                        .values_list(*MESSAGE_COLUMNS)[:backlog]
+                    )
+                    messages = [message_row_to_proto(row) for row in reversed(rows)]
+            await context.send_initial_metadata(())
             while True:
-                # Fetch new messages from the database
-                if last_message_id is None:
-                    messages = await sync_to_async(list)(self.queryset.filter(chat_room_id=chat_room_id))
+                for message in messages:
+                    yield message
+                    last_message_id = max(last_message_id, message.id)
+
+                timeout = None if broadcaster.listening else settings.CHAT_MESSAGE_POLL_INTERVAL
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                # Cleared before querying so a message saved meanwhile wakes us again
+                wakeup.clear()
+                cached = await sync_to_async(recent_messages.get)(chat_room_id, None, after_id=last_message_id)
+                if cached is not None:
+                    messages = cached[0]
                 else:
-                    messages = await sync_to_async(list)(self.queryset.filter(chat_room_id=chat_room_id, id__gt=last_message_id))
+                    rows = await sync_to_async(list)(
+                        room_messages.filter(id__gt=last_message_id).order_by("-id").values_list(*MESSAGE_COLUMNS)
+                    )
+                    messages = [message_row_to_proto(row) for row in reversed(rows)]
+        finally:
+            broadcaster.unsubscribe(MESSAGES, chat_room_id, subscriber)
 
-                for message in messages:
-                    serialized_message = self.serializer_class(message).data
-                    grpc_message = ParseDict(serialized_message, ChatRoomMessageResponse())
-                    yield grpc_message
-                    last_message_id = message.id
+    @grpc_action(
+        request=[
+            {"name": "user_id", "type": "int32"},
+            {"name": "after_id", "type": "int32"},
+        ],
+        response=ChatRoomMessageProtoSerializer,
+        response_stream=True,
+    )
+    async def SubscribeUserInbox(self, request, context):
+        """
+        Streams the new messages of every room ``user_id`` participates in,
+        each tagged with its chat_room, over one stream. Rooms joined or left
+        while streaming are picked up right away. With ``after_id`` the
+        stream resumes with the (at most CHAT_MESSAGE_BACKLOG_MAX latest)
+        messages after it, otherwise it starts with the next message.
+        Messages posted before the user joined a room are left out.
+
+        Message ids increase across rooms, so one cursor covers all of them.
+        """
+        user_id = request.user_id
+        subscriber = broadcaster.subscribe(MEMBERSHIP, user_id)
+        _, wakeup = subscriber
+        rooms = set()
+        try:
+            # Only what was posted while the user was in the room
+            inbox = self.queryset.filter(
+                chat_room__participants__user_id=user_id,
+                timestamp__gte=F("chat_room__participants__joined_at"),
+            )
+            if request.after_id:
+                last_message_id = request.after_id
+                limit = settings.CHAT_MESSAGE_BACKLOG_MAX
+            else:
+                last_message_id = await inbox.order_by("-id").values_list("id", flat=True).afirst() or 0
+                limit = None
+            await context.send_initial_metadata(())
+            while True:
+                # Rooms are subscribed before their messages are queried, so
+                # nothing saved in between is missed
+                member_of = set(await sync_to_async(list)(
+                    ChatRoomUser.objects.filter(user_id=user_id).values_list("chat_room_id", flat=True)
+                ))
+                for chat_room_id in member_of - rooms:
+                    broadcaster.subscribe(MESSAGES, chat_room_id, subscriber)
+                for chat_room_id in rooms - member_of:
+                    broadcaster.unsubscribe(MESSAGES, chat_room_id, subscriber)
+                rooms = member_of
+
+                messages = await sync_to_async(list)(
+                    inbox.filter(id__gt=last_message_id).order_by("-id").values_list(*MESSAGE_COLUMNS)[:limit]
+                )
+                limit = None
+                for row in reversed(messages):
+                    yield message_row_to_proto(row)
+                    last_message_id = max(last_message_id, row[0])
+
+                timeout = None if broadcaster.listening else settings.CHAT_MESSAGE_POLL_INTERVAL
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+        finally:
+            broadcaster.unsubscribe(MEMBERSHIP, user_id, subscriber)
+            for chat_room_id in rooms:
+                broadcaster.unsubscribe(MESSAGES, chat_room_id, subscriber)
 
-                # Sleep for a short period before checking for new messages again
-                await asyncio.sleep(1)
+    @grpc_action(
+        request=[
+            {"name": "chat_room_id", "type": "int32"},
+            {"name": "before_id", "type": "int32"},
+            {"name": "limit", "type": "int32"},
+        ],
+        response=ChatRoomMessageProtoSerializer,
+        use_generation_plugins=[ListGenerationPlugin(response=True)],
+    )
+    async def ListMessagesBefore(self, request, context):
+        """
+        One page of a room's history for scrollback: the ``limit`` messages
+        right before ``before_id`` (the latest ones if it is 0), oldest first.
+        Pages reach into the archive once the room's recent messages run out.
+        The latest pages of recently read rooms come from recent_messages.
+        """
+        limit = min(request.limit or settings.CHAT_MESSAGE_PAGE_SIZE, settings.CHAT_MESSAGE_PAGE_SIZE_MAX)
+        cached = await sync_to_async(recent_messages.get)(request.chat_room_id, limit, before_id=request.before_id)
+        if cached is not None:
+            messages = cached[0]
+        else:
+            queryset = self.queryset.filter(chat_room_id=request.chat_room_id)
+            if request.before_id:
+                queryset = queryset.filter(id__lt=request.before_id)
+            rows = await sync_to_async(list)(queryset.order_by("-id").values_list(*MESSAGE_COLUMNS)[:limit])
+            messages = [message_row_to_proto(row) for row in reversed(rows)]
+        if len(messages) < limit:
+            # Older history continues in the archive
+            before_id = messages[0].id if messages else request.before_id
+            rows = await sync_to_async(archived_rows_before)(
+                request.chat_room_id, before_id, limit - len(messages)
+            )
+            messages = [message_row_to_proto(row) for row in reversed(rows)] + messages
+        return chat_pb2.ChatRoomMessageListResponse(results=messages)
 
-        # Use the async generator to yield messages
-        async for message in message_generator():
-            yield message
+    @grpc_action(
+        request=[
+            {"name": "chat_room_id", "type": "int32"},
+            {"name": "after_id", "type": "int32"},
+            {"name": "limit", "type": "int32"},
+        ],
+        response=ChatRoomMessageProtoSerializer,
+        use_generation_plugins=[ListGenerationPlugin(response=True)],
+    )
+    async def ListMessagesAfter(self, request, context):
+        """
+        One page of a room's messages for catching up: the ``limit`` messages
+        right after ``after_id``, oldest first. A page shorter than ``limit``
+        ends at the latest message. Pages start in the archive while
+        ``after_id`` lies in archived history.
+        """
+        limit = min(request.limit or settings.CHAT_MESSAGE_PAGE_SIZE, settings.CHAT_MESSAGE_PAGE_SIZE_MAX)
+        cached = await sync_to_async(recent_messages.get)(request.chat_room_id, None, after_id=request.after_id)
+        if cached is not None:
+            messages = cached[0][:limit]
+        else:
+            # Archived messages all precede the ones in the table
+            rows = await sync_to_async(archived_rows_after)(request.chat_room_id, request.after_id, limit)
+            if len(rows) < limit:
+                after_id = rows[-1][0] if rows else request.after_id
+                queryset = self.queryset.filter(chat_room_id=request.chat_room_id, id__gt=after_id)
+                rows += await sync_to_async(list)(
+                    queryset.order_by("id").values_list(*MESSAGE_COLUMNS)[:limit - len(rows)]
+                )
+            messages = [message_row_to_proto(row) for row in rows]
+        return chat_pb2.ChatRoomMessageListResponse(results=messages)
 
 class ChatRoomUserService(generics.AsyncModelService):
     queryset = ChatRoomUser.objects.all()
     serializer_class = ChatRoomUserProtoSerializer
 
+    @staticmethod
+    def _unread_to_proto(chat_room_id, last_read_id, unread_count):
+        return chat_pb2.ChatRoomUnreadResponse(
+            chat_room=chat_room_id, last_read_id=last_read_id, unread_count=unread_count
+        )
+
+    @grpc_action(
+        request=[{"name": "user_id", "type": "int32"}],
+        response=ChatRoomUnreadProtoSerializer,
+        use_generation_plugins=[ListGenerationPlugin(response=True)],
+    )
+    async def GetUnreadCounts(self, request, context):
+        """
+        Read marker and unread count of every room ``user_id`` is in, in one
+        query on the participants table (see chat.unread).
+        """
+        rows = await sync_to_async(list)(
+            ChatRoomUser.objects.filter(user_id=request.user_id).values_list(
+                "chat_room_id", "last_read_id", "unread_count"
+            )
+        )
+        return chat_pb2.ChatRoomUnreadListResponse(results=[self._unread_to_proto(*row) for row in rows])
+
+    @grpc_action(
+        request=[
+            {"name": "user_id", "type": "int32"},
+            {"name": "chat_room_id", "type": "int32"},
+            {"name": "last_read_id", "type": "int32", "comment": "Latest message read, 0 for all of them"},
+        ],
+        response=ChatRoomUnreadProtoSerializer,
+    )
+    async def MarkRead(self, request, context):
+        """
+        Moves the user's read marker of a room forward (never back) and
+        returns what is left unread.
+        """
+        try:
+            participant = await sync_to_async(mark_read)(request.user_id, request.chat_room_id, request.last_read_id)
+        except ChatRoomUser.DoesNotExist:
+            raise NotFound(f"User {request.user_id} is not in chat room {request.chat_room_id}")
+        return self._unread_to_proto(participant.chat_room_id, participant.last_read_id, participant.unread_count)
+
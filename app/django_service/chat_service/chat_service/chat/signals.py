@@ -0,0 +1,54 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .broadcast import HISTORY, MEMBERSHIP, MESSAGES, broadcaster
+from .models import ChatRoom, ChatRoomMessage, ChatRoomUser
+from .recent import recent_messages
+from .unread import count_unread
+
+
+def _announce_to_participants(chat_room_id, user_ids=()):
+    """Wake the membership streams of everyone in the room (and ``user_ids``) once committed."""
+    user_ids = set(user_ids)
+    user_ids.update(ChatRoomUser.objects.filter(chat_room_id=chat_room_id).values_list("user_id", flat=True))
+
+    def notify():
+        for user_id in user_ids:
+            broadcaster.notify(MEMBERSHIP, user_id)
+
+    transaction.on_commit(notify)
+
+
+@receiver(post_save, sender=ChatRoomMessage)
+def announce_chat_room_message(sender, instance, created, **kwargs):
+    chat_room_id = instance.chat_room_id
+    if not created:
+        transaction.on_commit(lambda: broadcaster.notify(HISTORY, chat_room_id))
+        return
+    count_unread([instance])
+
+    def announce():
+        recent_messages.add([instance])
+        broadcaster.notify(MESSAGES, chat_room_id, instance.id)
+
+    transaction.on_commit(announce)
+
+
+@receiver(post_save, sender=ChatRoomUser)
+@receiver(post_delete, sender=ChatRoomUser)
+def announce_membership(sender, instance, **kwargs):
+    # The other participants see the room's participants change
+    _announce_to_participants(instance.chat_room_id, [instance.user_id])
+
+
+@receiver(post_save, sender=ChatRoom)
+def announce_chat_room(sender, instance, created, **kwargs):
+    if not created:
+        _announce_to_participants(instance.id)
+
+
+@receiver(post_delete, sender=ChatRoom)
+def announce_chat_room_deleted(sender, instance, **kwargs):
+    chat_room_id = instance.id
+    transaction.on_commit(lambda: broadcaster.notify(HISTORY, chat_room_id))
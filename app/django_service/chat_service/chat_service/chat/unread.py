@@ -0,0 +1,60 @@
+"""
+Read markers and unread counters.
+
+Every ChatRoomUser keeps the latest message id its user has read and the
+number of messages from others posted since. The counters are bumped in the
+transaction that writes the messages, so reading them is one indexed query
+for all of a user's rooms, however long the history. A message only counts
+for participants whose marker is below it: a buffered message can be marked
+read before it is written. Marking a room read
+recounts only the messages after the new marker, under a lock on the
+participant row, so it cannot race with writers bumping the counter.
+"""
+from functools import reduce
+from operator import add
+
+from django.db import transaction
+from django.db.models import Case, F, Q, Value, When
+
+from .models import ChatRoomMessage, ChatRoomUser
+
+
+def count_unread(messages):
+    """
+    Add just inserted ``messages`` to the unread counters of their rooms'
+    participants who have not read past them, except their senders.
+    """
+    rooms = {}
+    for message in messages:
+        rooms.setdefault(message.chat_room_id, []).append(message)
+    for chat_room_id, room_messages in rooms.items():
+        unread = reduce(add, [
+            Case(
+                When(Q(last_read_id__lt=message.id) & ~Q(user_id=message.sender_id), then=Value(1)),
+                default=Value(0),
+            )
+            for message in room_messages
+        ])
+        ChatRoomUser.objects.filter(chat_room_id=chat_room_id).update(unread_count=F("unread_count") + unread)
+
+
+def mark_read(user_id, chat_room_id, last_read_id=0):
+    """
+    Move the user's read marker of a room forward to ``last_read_id`` (the
+    room's latest message if 0) and recount what is left unread. Returns the
+    ChatRoomUser, raises ChatRoomUser.DoesNotExist if the user is not in the
+    room.
+    """
+    with transaction.atomic():
+        participant = ChatRoomUser.objects.select_for_update().get(user_id=user_id, chat_room_id=chat_room_id)
+        messages = ChatRoomMessage.objects.filter(chat_room_id=chat_room_id)
+        if not last_read_id:
+            last_read_id = messages.order_by("-id").values_list("id", flat=True).first() or 0
+        if last_read_id > participant.last_read_id:
+            participant.last_read_id = last_read_id
+            participant.unread_count = messages.filter(id__gt=last_read_id).exclude(sender_id=user_id).count()
+            # Not save(), whose post_save would wake every participant's membership streams
+            ChatRoomUser.objects.filter(pk=participant.pk).update(
+                last_read_id=participant.last_read_id, unread_count=participant.unread_count
+            )
+    return participant
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+
+from .broadcast import MESSAGES, broadcaster
+from .models import ChatRoomMessage
+from .recent import recent_messages
+from .unread import count_unread
+
+logger = logging.getLogger('django_socio_grpc')
+
+# CHAT_MESSAGE_WRITE_MODE values, see settings.py for their guarantees
+SYNC = 'sync'
+GROUP = 'group'
+ASYNC = 'async'
+
+
+class MessageWriteBuffer:
+    """
+    Group commit for ChatRoomMessage inserts.
+
+    Messages are queued and written by a single flusher task: once
+    CHAT_MESSAGE_FLUSH_SIZE messages are waiting, or CHAT_MESSAGE_FLUSH_INTERVAL
+    seconds after the first one, the batch is inserted with one bulk_create
+    in one transaction. bulk_create sends no post_save, so the unread counters
+    are bumped and the broadcaster is notified here. If the batch fails, its messages are retried one by one so
+    a single bad message only fails itself.
+
+    In ``group`` mode ``save`` returns once the message is committed. In
+    ``async`` mode it returns as soon as the message is queued, with an id
+    taken from the table's sequence (reserved CHAT_MESSAGE_ID_BLOCK at a
+    time), and write errors are only logged.
+
+    Batches of one process are written in queue order, so ids commit in
+    order per process. Across processes, and in ``async`` mode against
+    readers, they do not: a reserved id can commit after a higher one was
+    read, and readers that resume from an id (ListMessagesAfter,
+    SubscribeUserInbox, ``after_id``) skip it for good.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._pending = []
+        self._ids = []
+
+    @property
+    def mode(self):
+        mode = settings.CHAT_MESSAGE_WRITE_MODE
+        if mode == ASYNC and connection.vendor != 'postgresql':
+            # Ids can only be reserved from a Postgres sequence
+            return GROUP
+        return mode
+
+    def _start(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._pending = []
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        # Ids are handed out in the order messages arrive
+        self._id_lock = asyncio.Lock()
+        self._flusher = loop.create_task(self._run())
+
+    async def save(self, message):
+        """Queue ``message`` for the next batch, see the class docstring for when this returns."""
+        self._start()
+        mode = self.mode
+        future = None
+        if mode == ASYNC:
+            message.id = await self._next_id()
+        else:
+            future = self._loop.create_future()
+        # Appended right after the id is assigned, so the queue stays in id order
+        self._pending.append((message, future))
+        self._has_pending.set()
+        if len(self._pending) >= settings.CHAT_MESSAGE_FLUSH_SIZE:
+            self._batch_full.set()
+        if future is not None:
+            # Shielded: a cancelled RPC must not cancel the write of its batch
+            await asyncio.shield(future)
+        return message
+
+    async def _next_id(self):
+        async with self._id_lock:
+            if not self._ids:
+                self._ids = await sync_to_async(self._reserve_ids)(settings.CHAT_MESSAGE_ID_BLOCK)
+            return self._ids.pop(0)
+
+    @staticmethod
+    def _reserve_ids(count):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                [ChatRoomMessage._meta.db_table, max(count, 1)],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    async def _run(self):
+        while True:
+            await self._has_pending.wait()
+            deadline = self._loop.time() + settings.CHAT_MESSAGE_FLUSH_INTERVAL
+            while len(self._pending) < settings.CHAT_MESSAGE_FLUSH_SIZE:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                self._batch_full.clear()
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            batch = self._pending[:settings.CHAT_MESSAGE_FLUSH_SIZE]
+            del self._pending[:len(batch)]
+            if not self._pending:
+                self._has_pending.clear()
+            try:
+                results = await sync_to_async(self._write)([message for message, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+            for (message, future), error in zip(batch, results):
+                if future is None:
+                    if error is not None:
+                        logger.error(f"Lost chat message {message.id} in room {message.chat_room_id}: {error}")
+                elif not future.done():
+                    if error is None:
+                        future.set_result(message)
+                    else:
+                        future.set_exception(error)
+
+    def _write(self, messages):
+        """Insert ``messages``, returning the error of each one (None once written)."""
+        try:
+            self._insert(messages)
+            return [None] * len(messages)
+        except Exception as e:
+            if len(messages) == 1:
+                return [e]
+            logger.warning(f"Writing {len(messages)} chat messages at once failed, retrying one by one: {e}")
+        return [self._write([message])[0] for message in messages]
+
+    @staticmethod
+    def _insert(messages):
+        with transaction.atomic():
+            ChatRoomMessage.objects.bulk_create(messages)
+            count_unread(messages)
+            rooms = {}
+            for message in messages:
+                rooms[message.chat_room_id] = max(rooms.get(message.chat_room_id, 0), message.id)
+
+            def notify():
+                recent_messages.add(messages)
+                for chat_room_id, last_id in rooms.items():
+                    broadcaster.notify(MESSAGES, chat_room_id, last_id)
+
+            transaction.on_commit(notify)
+
+
+write_buffer = MessageWriteBuffer()
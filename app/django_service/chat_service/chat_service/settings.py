@@ -58,6 +58,55 @@ GRPC_FRAMEWORK = {
     "ROOT_HANDLERS_HOOK": 'chat_service.chat.handlers.grpc_handlers',
 }
 
+# SubscribeChatRoomMessages is woken by Postgres NOTIFY (chat.broadcast) and
+# only polls at this interval, in seconds, while no LISTEN connection is up.
+CHAT_MESSAGE_POLL_INTERVAL = float(os.environ.get('CHAT_MESSAGE_POLL_INTERVAL', 1))
+# Same for the membership streams (GetChatRoomByUserId, SubscribeChatRoomChanges)
+CHAT_MEMBERSHIP_POLL_INTERVAL = float(os.environ.get('CHAT_MEMBERSHIP_POLL_INTERVAL', 5))
+
+# How ChatRoomMessageController.Create writes messages (chat.write_buffer):
+#   sync   one INSERT and commit per message, acknowledged once committed.
+#   group  messages arriving within CHAT_MESSAGE_FLUSH_INTERVAL seconds (up to
+#          CHAT_MESSAGE_FLUSH_SIZE) are committed together with bulk_create;
+#          each is acknowledged once its batch is committed, so durability is
+#          the same as sync at the cost of up to the interval in latency.
+#   async  write-behind: acknowledged as soon as it is queued, with its id
+#          already reserved from the sequence. Messages still queued are lost
+#          if the process dies. Postgres only, elsewhere it acts as group.
+#          A message can therefore commit after one with a higher id has
+#          been read: ListMessagesAfter, SubscribeUserInbox and after_id
+#          resumes move their cursor past it and never return it. Use sync or
+#          group where clients must not miss messages when resuming by id.
+# Ids give the order of messages. They are reserved CHAT_MESSAGE_ID_BLOCK at
+# a time in async mode: with more than one chat_service process, blocks
+# above 1 let ids diverge from arrival order between processes.
+CHAT_MESSAGE_WRITE_MODE = os.environ.get('CHAT_MESSAGE_WRITE_MODE', 'sync')
+CHAT_MESSAGE_FLUSH_INTERVAL = float(os.environ.get('CHAT_MESSAGE_FLUSH_INTERVAL', 0.005))
+CHAT_MESSAGE_FLUSH_SIZE = int(os.environ.get('CHAT_MESSAGE_FLUSH_SIZE', 100))
+CHAT_MESSAGE_ID_BLOCK = int(os.environ.get('CHAT_MESSAGE_ID_BLOCK', 1))
+
+# Messages sent when a subscription starts (the latest ones after after_id)
+# and per ListMessagesBefore page, when the request does not ask for a
+# number, and the most it may ask for.
+CHAT_MESSAGE_BACKLOG = int(os.environ.get('CHAT_MESSAGE_BACKLOG', 50))
+CHAT_MESSAGE_BACKLOG_MAX = int(os.environ.get('CHAT_MESSAGE_BACKLOG_MAX', 1000))
+CHAT_MESSAGE_PAGE_SIZE = int(os.environ.get('CHAT_MESSAGE_PAGE_SIZE', 50))
+CHAT_MESSAGE_PAGE_SIZE_MAX = int(os.environ.get('CHAT_MESSAGE_PAGE_SIZE_MAX', 200))
+
+# Cold history (manage.py archive_chat_messages, chat.archive): messages older
+# than CHAT_MESSAGE_ARCHIVE_AFTER_DAYS move to compressed chunks of up to
+# CHAT_MESSAGE_ARCHIVE_CHUNK_SIZE messages; the latest CHAT_MESSAGE_ARCHIVE_KEEP
+# of every room stay in place.
+CHAT_MESSAGE_ARCHIVE_AFTER_DAYS = int(os.environ.get('CHAT_MESSAGE_ARCHIVE_AFTER_DAYS', 90))
+CHAT_MESSAGE_ARCHIVE_KEEP = int(os.environ.get('CHAT_MESSAGE_ARCHIVE_KEEP', 200))
+CHAT_MESSAGE_ARCHIVE_CHUNK_SIZE = int(os.environ.get('CHAT_MESSAGE_ARCHIVE_CHUNK_SIZE', 500))
+
+# In-memory copy of the latest CHAT_RECENT_MESSAGES_PER_ROOM messages of
+# recently read rooms (chat.recent), at most CHAT_RECENT_MESSAGES_MAX_BYTES
+# per process; least recently read rooms are dropped first. 0 turns it off.
+CHAT_RECENT_MESSAGES_PER_ROOM = int(os.environ.get('CHAT_RECENT_MESSAGES_PER_ROOM', 200))
+CHAT_RECENT_MESSAGES_MAX_BYTES = int(os.environ.get('CHAT_RECENT_MESSAGES_MAX_BYTES', 64 * 1024 * 1024))
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
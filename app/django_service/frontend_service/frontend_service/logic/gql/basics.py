@@ -1,6 +1,14 @@
+import hashlib
+import json
 import os
+import requests
 from gql import gql, Client
+from gql.transport.exceptions import TransportQueryError
 from gql.transport.requests import RequestsHTTPTransport
+from graphql import OperationType, get_operation_ast
+
+GRAPHQL_URL = "http://main_service:8000/graphql/"
+
 
 def load_query(filename):
     filepath = os.path.join(os.path.dirname(__file__),  filename)
@@ -8,6 +16,35 @@ def load_query(filename):
         return file.read()
 
 
+def execute_persisted_query(query, headers, variables=None):
+    """
+    Send only the SHA-256 of a document registered in main_service's
+    persisted query manifest. Queries go out as GET so they can be cached.
+    Returns None if main_service does not know the hash.
+    """
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": hashlib.sha256(query.encode("utf-8")).hexdigest()}}
+    operation = get_operation_ast(gql(query))
+
+    if operation is not None and operation.operation == OperationType.QUERY:
+        params = {"extensions": json.dumps(extensions)}
+        if variables:
+            params["variables"] = json.dumps(variables)
+        response = requests.get(GRAPHQL_URL, params=params, headers=headers)
+    else:
+        response = requests.post(GRAPHQL_URL, json={"extensions": extensions, "variables": variables}, headers=headers)
+
+    # 400 carries GraphQL errors; anything else (e.g. 401 from the auth middleware) is a transport error
+    if response.status_code not in (200, 400):
+        response.raise_for_status()
+    result = response.json()
+    errors = result.get("errors")
+    if errors:
+        if errors[0].get("message") == "PersistedQueryNotFound":
+            return None
+        raise TransportQueryError(str(errors[0]), errors=errors, data=result.get("data"))
+    return result["data"]
+
+
 def execute_query(query, request, variables=None):
     headers = {"Host": "localhost:8000"}
 
@@ -17,8 +54,12 @@ def execute_query(query, request, variables=None):
         cookie_header = "; ".join([f"{key}={value}" for key, value in cookies.items()])
         headers["Cookie"] = cookie_header
 
+    response = execute_persisted_query(query, headers, variables)
+    if response is not None:
+        return response
+
     transport = RequestsHTTPTransport(
-        url="http://main_service:8000/graphql/",
+        url=GRAPHQL_URL,
         use_json=True,
         headers=headers,
     )
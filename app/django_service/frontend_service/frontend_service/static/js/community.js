@@ -1,5 +1,5 @@
-import {addFriend, blockUser, deleteFriendship, fetchFriendships, fetchFriendsWithProfiles} from './friendservice.js';
-import {fetchProfileByUserId, fetchProfiles, fetchUserProfileAndStats} from './profileservice.js';
+import {addFriend, blockUser, deleteFriendship, fetchFriendNetwork, fetchFriendships} from './friendservice.js';
+import {fetchProfileByUserId, fetchProfiles, fetchUserProfileAndStats, searchProfiles} from './profileservice.js';
 import {generateUserAvatarHTML, showError, userCache, initializeOnlineStatusSubscriptions} from './utils.js';
 import {createElement, DEFAULT_AVATAR, DEFAULT_USER_AVATAR, formatDate} from './domHelpers.js';
 import {createFriendGame} from "./gameService.js"
@@ -11,9 +11,14 @@ const NO_FRIENDS_HTML = '<p class="text-light">No friends available 😞.</p>';
 const LOADING_FRIENDS_HTML = '<p class="text-light">Loading friends...</p>';
 const NO_FRIENDS_WARNING = 'Sad ... you don\'t seem to have any friends 😞.';
 const NO_PROFILES_HTML = '<p class="text-light">No profiles found.</p>';
+const NO_SUGGESTIONS_HTML = '<p class="text-light">No suggestions yet.</p>';
 const LOADING_PROFILES_HTML = '<p class="text-light">Loading profiles, please wait...</p>';
 
 let cachedFriendships = null;
+// Cursors of the Add Friend pages up to the shown one, see fetchAndRenderProfiles
+const profilePages = [0];
+const PROFILES_PER_PAGE = 10;
+const SEARCH_DEBOUNCE_MS = 200;
 
 const refetchFriends = async () => {
     const data = await fetchFriendships();
@@ -63,20 +68,21 @@ const handleTabSwitch = async (tabId) => {
             const profilesContainer = document.getElementById('profilesContainer');
             const prevPageBtn = document.getElementById('prevPageBtn');
             const nextPageBtn = document.getElementById('nextPageBtn');
-            const limit = 10;
-            let currentOffset = 0;
-            await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, currentOffset);
+            const limit = PROFILES_PER_PAGE;
+            const pages = profilePages;
+            pages.splice(1);
+            await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, pages);
 
             prevPageBtn.addEventListener('click', async () => {
-                if (currentOffset > 0) {
-                    currentOffset -= limit;
-                    await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, currentOffset);
+                if (pages.length > 1) {
+                    pages.pop();
+                    await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, pages);
                 }
             });
 
             nextPageBtn.addEventListener('click', async () => {
-                currentOffset += limit;
-                await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, currentOffset);
+                pages.push(Number(nextPageBtn.dataset.after));
+                await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, pages);
             });
 
             break;
@@ -152,17 +158,16 @@ const generateFriendHTML = (friendship, profile) => {
     );
 };
 
-const renderFriendsList = (friendships, combinedData, friendsContainer) => {
+const renderFriendsList = (friends, friendsContainer) => {
     friendsContainer.innerHTML = '';
     let friendCount = 0;
-    friendships.forEach((friendship, index) => {
-        const profile = combinedData[`friend${index}`];
-        if (friendship.accepted && profile) {
-            const friendHtmlElement = generateFriendHTML(friendship, profile);
+    friends.forEach((friend) => {
+        if (friend.profile) {
+            const friendHtmlElement = generateFriendHTML(friend.friendship, friend.profile);
             friendsContainer.appendChild(friendHtmlElement);
             friendCount++;
-        } else if (!profile) {
-            console.warn(`No profile found for friend${index}.`);
+        } else {
+            console.warn(`No profile found for friend ${friend.userId}.`);
         }
     });
 
@@ -171,19 +176,60 @@ const renderFriendsList = (friendships, combinedData, friendsContainer) => {
     }
 };
 
+const generateSuggestionHTML = (suggestion) => {
+    const profile = suggestion.profile;
+    userCache[profile.userId] = {profile};
+    return createElement(
+        'li',
+        `
+        <div class="avatar me-3">
+            <a href="/home/profile/${profile.userId}" class="text-decoration-none">
+                ${generateUserAvatarHTML(profile.userId, 50)}
+            </a>
+        </div>
+        <div>
+            <a href="/home/profile/${profile.userId}" class="text-decoration-none">
+                <h6>${profile.nickname || 'Unknown User'}</h6>
+            </a>
+            <p class="small mb-0" style="color:white">
+                ${suggestion.mutualFriends} mutual friend${suggestion.mutualFriends === 1 ? '' : 's'}
+            </p>
+        </div>
+        <div class="ms-auto">
+            <button class="btn btn-success btn-sm add-suggested-friend" data-friend-id="${profile.userId}">
+                Add Friend
+            </button>
+        </div>
+        `,
+        'list-group-item bg-dark text-light d-flex align-items-center p-3 rounded-3 mb-2',
+    );
+};
+
+const renderSuggestions = (suggestions, suggestionsContainer) => {
+    suggestionsContainer.innerHTML = '';
+    suggestions
+        .filter((suggestion) => suggestion.profile)
+        .forEach((suggestion) => suggestionsContainer.appendChild(generateSuggestionHTML(suggestion)));
+    if (!suggestionsContainer.children.length) {
+        suggestionsContainer.innerHTML = NO_SUGGESTIONS_HTML;
+    }
+};
+
 const loadFriends = async (friendsContainer) => {
     friendsContainer.innerHTML = LOADING_FRIENDS_HTML;
+    const suggestionsContainer = document.getElementById('friend-suggestions');
     try {
-        const data = await fetchFriendships();
-        const friendships = Array.isArray(data) ? data : Object.values(data);
+        const data = await fetchFriendNetwork();
+        cachedFriendships = data.friendships || [];
+        if (suggestionsContainer) {
+            renderSuggestions(data.friendNetwork.suggestions, suggestionsContainer);
+        }
 
-        if (!friendships.length) {
+        if (!data.friendNetwork.friends.length) {
             friendsContainer.innerHTML = `<p class="text-light">${NO_FRIENDS_WARNING}</p>`;
             return;
         }
-        cachedFriendships = friendships;
-        const combinedData = await fetchFriendsWithProfiles(friendships);
-        renderFriendsList(combinedData.friendships, combinedData, friendsContainer);
+        renderFriendsList(data.friendNetwork.friends, friendsContainer);
     } catch (error) {
         showToast('Failed to load friends:', error);
         showError(friendsContainer, 'Failed to load friends. Try again later.');
@@ -494,24 +540,27 @@ const renderProfiles = (profiles, profilesContainer) => {
     });
 };
 
+// Keyset pagination: pages holds the cursor of every page up to the shown one,
+// the next page's cursor is kept on the next button
 const fetchAndRenderProfiles = async (
     profilesContainer,
     prevPageBtn,
     nextPageBtn,
     limit,
-    offset
+    pages
 ) => {
     profilesContainer.innerHTML = LOADING_PROFILES_HTML;
 
     try {
-        const data = await fetchProfiles(limit, offset);
-        if (data && data.getAllProfiles) {
-            const profiles = data.getAllProfiles.profiles;
+        const data = await fetchProfiles(limit, pages[pages.length - 1]);
+        if (data && data.profiles) {
+            const {profiles, nextAfter} = data.profiles;
 
             renderProfiles(profiles, profilesContainer);
             initializeOnlineStatusSubscriptions();
-            prevPageBtn.disabled = offset === 0;
-            nextPageBtn.disabled = profiles.length < limit;
+            prevPageBtn.disabled = pages.length === 1;
+            nextPageBtn.disabled = !nextAfter;
+            nextPageBtn.dataset.after = nextAfter || '';
         } else {
             throw new Error('Unable to fetch profiles.');
         }
@@ -525,17 +574,17 @@ async function initProfileList(){
     const prevPageBtn = document.getElementById('prevPageBtn');
     const nextPageBtn = document.getElementById('nextPageBtn');
     const limit = 10;
-    let currentOffset = 0;
-    await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, currentOffset);
+    const pages = [0];
+    await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, pages);
     prevPageBtn.addEventListener('click', async () => {
-        if (currentOffset > 0) {
-            currentOffset -= limit;
-            await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, currentOffset);
+        if (pages.length > 1) {
+            pages.pop();
+            await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, pages);
         }
     });
     nextPageBtn.addEventListener('click', async () => {
-        currentOffset += limit;
-        await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, currentOffset);
+        pages.push(Number(nextPageBtn.dataset.after));
+        await fetchAndRenderProfiles(profilesContainer, prevPageBtn, nextPageBtn, limit, pages);
     });
 }
 async function initProfile(){
@@ -544,6 +593,71 @@ async function initProfile(){
 
 }
 
+document.addEventListener('DOMContentLoaded', async () => {
+    const searchInput = document.getElementById('profileSearch');
+    let searchTimer = null;
+    let searchSeq = 0;
+    searchInput?.addEventListener('input', () => {
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(async () => {
+            const profilesContainer = document.getElementById('profilesContainer');
+            const paginationControls = document.getElementById('paginationControls');
+            const prefix = searchInput.value.trim();
+            // Only the latest search gets rendered, slower earlier ones are dropped
+            const seq = ++searchSeq;
+            if (!prefix) {
+                paginationControls.classList.remove('d-none');
+                await fetchAndRenderProfiles(
+                    profilesContainer,
+                    document.getElementById('prevPageBtn'),
+                    document.getElementById('nextPageBtn'),
+                    PROFILES_PER_PAGE,
+                    profilePages
+                );
+                return;
+            }
+            try {
+                const profiles = await searchProfiles(prefix, PROFILES_PER_PAGE);
+                if (seq !== searchSeq) {
+                    return;
+                }
+                paginationControls.classList.add('d-none');
+                renderProfiles(profiles, profilesContainer);
+                initializeOnlineStatusSubscriptions();
+            } catch (error) {
+                profilesContainer.innerHTML = `<p class="text-danger">Search failed. Please try again later.</p>`;
+            }
+        }, SEARCH_DEBOUNCE_MS);
+    });
+
+    const suggestionsContainer = document.getElementById('friend-suggestions');
+    suggestionsContainer?.addEventListener('click', async (event) => {
+        if (!event.target.classList.contains('add-suggested-friend')) {
+            return;
+        }
+        const button = event.target;
+        const friendId = parseInt(button.getAttribute('data-friend-id'), 10);
+        if (isNaN(friendId)) {
+            showToast("Invalid friend ID.");
+            return;
+        }
+        try {
+            const response = await addFriend(friendId);
+            if (response && response.success) {
+                button.textContent = "Friend Added!";
+                button.classList.remove("btn-success");
+                button.classList.add("btn-secondary");
+                button.disabled = true;
+                refetchFriends();
+            } else {
+                showToast(`Failed to add friend: ${response ? response.message : 'Unknown error'}`);
+            }
+        } catch (error) {
+            showToast("An unexpected error occurred:", error);
+        }
+    });
+});
+
 document.addEventListener('DOMContentLoaded', async () => {
     const friendsContainer = document.querySelector('#friends ul');
 
@@ -30,96 +30,55 @@ export const fetchFriendships = async () => {
 };
 
 /**
- * Dynamically generates a GraphQL query to fetch profiles for each friend ID.
- * @param {Array} friendships - Array of friendship objects.
- * @returns {String} - The combined GraphQL query for fetching profiles.
+ * Fetches the friendships, the friends with their profiles and friend suggestions in one query.
+ * @param {Number} suggestions - How many friend suggestions to fetch.
+ * @returns {Promise<Object>} - { friendships, friendNetwork: { friends, suggestions } }.
  */
-const buildProfileQuery = (friendships) => {
-    // Debug: Log the original nested friendships array
-
-    // Step 1: Flatten the friendships array
-    const flattenedFriendships = friendships.flat();
-
-    // Debug: Log the flattened friendships array
-
-    const query = flattenedFriendships
-        .map((friendship, index) => {
-            // Ensure friendId is properly cast as a number
-            const friendId = Number(friendship.friendId);
-
-            // Validate friendId to avoid NaN in the query
-            if (isNaN(friendId)) {
-                console.warn(`Invalid "friendId" detected for friend${index}:`, friendship.friendId);
-                return ""; // Skip invalid entries
-            }
-
-            // Build the query segment for each friend
-            const querySegment = `
-            friend${index}: profile(userId: ${friendId}) {
-                id
-                additionalInfo
-                avatarUrl
-                nickname
-                bio
-                userId
-            }
-        `;
-
-            // Debug: Log the generated query segment
-
-            return querySegment;
-        })
-        .filter((segment) => segment) // Remove any empty segments
-        .join("\n");
-
-    // Debug: Log the final generated query
-
-    return query;
-};
-
-/**
- * Fetches friendships and associated profiles in one combined query using plain strings.
- * @param {Array} friendships - Array of friendship objects.
- * @returns {Promise<Object>} - Combined friendships and profiles data.
- */
-export const fetchFriendsWithProfiles = async (friendships) => {
-    // Debug: Log the input friendships before processing
-
-    // Handle edge cases with a warning
-    if (!friendships || friendships.length === 0) {
-        console.warn("No friendships data provided. Returning empty result.");
-        return { friendships: [], profiles: [] };
-    }
-
-    const profileQueries = buildProfileQuery(friendships);
-
-    // Debug: Log the dynamic GraphQL query to be sent
-
-    const GET_FRIENDSHIPS_AND_PROFILES_QUERY = `
-        query GetFriendshipsAndProfiles {
+export const fetchFriendNetwork = async (suggestions = 5) => {
+    const GET_FRIEND_NETWORK_QUERY = `
+        query GetFriendNetwork($suggestions: Int) {
             friendships {
                 id
                 friendId
                 accepted
+                blocked
                 establishedAt
                 userId
             }
-
-            ${profileQueries}
+            friendNetwork(suggestions: $suggestions) {
+                friends {
+                    userId
+                    friendship {
+                        id
+                        establishedAt
+                    }
+                    profile {
+                        id
+                        avatarUrl
+                        nickname
+                        bio
+                        userId
+                    }
+                }
+                suggestions {
+                    userId
+                    mutualFriends
+                    profile {
+                        id
+                        avatarUrl
+                        nickname
+                        bio
+                        userId
+                    }
+                }
+            }
         }
     `;
 
     try {
-        // Debug: Indicate that the query execution is starting
-
-        const result = await executeQuery(GET_FRIENDSHIPS_AND_PROFILES_QUERY);
-
-        // Debug: Log the result of the GraphQL query
-
-        return result;
+        return await executeQuery(GET_FRIEND_NETWORK_QUERY, { suggestions });
     } catch (error) {
-        // Debug: Log detailed error information
-        showToast("Failed to fetch friends and their profiles:", error);
+        showToast('Failed to fetch friends:', error);
         throw error;
     }
 };
@@ -53,17 +53,15 @@ import { executeQuery,  } from './utils.js';
    };
 
 /**
- * Fetches all profiles with pagination support.
+ * Fetches a page of profiles, ordered by id.
  * @param {number} limit - The maximum number of profiles to fetch.
- * @param {number} offset - The offset for pagination.
- * @returns {Promise<object>} The paginated list of profiles.
+ * @param {number} after - The nextAfter of the previous page, 0 for the first page.
+ * @returns {Promise<object>} The page: { profiles, nextAfter, totalCount }, nextAfter is null on the last page.
  */
-export const fetchProfiles = async (limit, offset) => {
-
-
-    const GET_ALL_PROFILES_QUERY = `
-        query GetAllProfiles($limit: Int!, $offset: Int!) {
-            getAllProfiles(limit: $limit, offset: $offset) {
+export const fetchProfiles = async (limit, after) => {
+    const LIST_PROFILES_QUERY = `
+        query ListProfiles($limit: Int, $after: Int) {
+            profiles(limit: $limit, after: $after) {
                 profiles {
                     additionalInfo
                     avatarUrl
@@ -71,12 +69,14 @@ export const fetchProfiles = async (limit, offset) => {
                     nickname
                     userId
                 }
+                nextAfter
+                totalCount
             }
         }
     `;
 
     try {
-        const result = await executeQuery(GET_ALL_PROFILES_QUERY, { limit, offset });
+        const result = await executeQuery(LIST_PROFILES_QUERY, { limit, after });
         return result;
     } catch (error) {
         showToast('Error fetching profiles with pagination:', error);
@@ -84,6 +84,33 @@ export const fetchProfiles = async (limit, offset) => {
     }
 };
 
+/**
+ * Searches profiles by nickname, case-insensitive, for autocomplete.
+ * @param {string} prefix - The start of the nickname.
+ * @param {number} limit - The maximum number of profiles to fetch.
+ * @returns {Promise<Array>} The matching profiles, in nickname order.
+ */
+export const searchProfiles = async (prefix, limit = 10) => {
+    const SEARCH_PROFILES_QUERY = `
+        query SearchProfiles($prefix: String, $limit: Int) {
+            searchProfiles(prefix: $prefix, limit: $limit) {
+                avatarUrl
+                bio
+                nickname
+                userId
+            }
+        }
+    `;
+
+    try {
+        const result = await executeQuery(SEARCH_PROFILES_QUERY, { prefix, limit });
+        return result.searchProfiles || [];
+    } catch (error) {
+        showToast('Error searching profiles:', error);
+        throw error;
+    }
+};
+
 /**
  * Fetches a user's profile by the provided user ID.
  * @param {number} userId - The user's ID.
@@ -349,15 +349,9 @@ class GameServiceHandler(game_pb2_grpc.GameServiceServicer):
             )
             create_stat_response = stat_stub.CreateStat(create_stat_request)
 
-            # List all chat rooms and find the one associated with the game
-            logger.info(f"Listing chat rooms to find the one associated with game {request.game_id}")
-            chat_rooms = chat_stub.List(chat_pb2.ChatRoomListRequest())
-            for chat_room in chat_rooms.results:
-                logger.debug(f"Checking chat room {chat_room.id} associated with game {chat_room.game_id}")
-                if chat_room.game_id == request.game_id:
-                    chat_stub.Destroy(chat_pb2.ChatRoomDestroyRequest(id=chat_room.id))
-                    logger.info(f"Destroyed chat room {chat_room.id} associated with game {request.game_id}")
-                    break
+            # Delete the chat room(s) associated with the game
+            chat_response = chat_stub.DestroyByGameId(chat_pb2.ChatRoomDestroyByGameIdRequest(game_id=request.game_id))
+            logger.info(f"Destroyed {chat_response.deleted} chat room(s) associated with game {request.game_id}")
 
             # Return empty response as acknowledgment
             return Empty()
@@ -25,63 +25,85 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nchat.proto\x12\x11\x63hat_service.chat\x1a\x1bgoogle/protobuf/empty.proto\"$\n\x16\x43hatRoomDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\"ChatRoomGetChatRoomByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\x15\n\x13\x43hatRoomListRequest\"L\n\x14\x43hatRoomListResponse\x12\x34\n\x07results\x18\x01 \x03(\x0b\x32#.chat_service.chat.ChatRoomResponse\"+\n\x1d\x43hatRoomMessageDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x1c\n\x1a\x43hatRoomMessageListRequest\"Z\n\x1b\x43hatRoomMessageListResponse\x12;\n\x07results\x18\x01 \x03(\x0b\x32*.chat_service.chat.ChatRoomMessageResponse\"\xba\x01\n#ChatRoomMessagePartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x11\n\tsender_id\x18\x04 \x01(\x05\x12\x16\n\ttimestamp\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x06 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\"\x8d\x01\n\x16\x43hatRoomMessageRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x11\n\tsender_id\x18\x03 \x01(\x05\x12\x16\n\ttimestamp\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\"\x8e\x01\n\x17\x43hatRoomMessageResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x11\n\tsender_id\x18\x03 \x01(\x05\x12\x16\n\ttimestamp\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\",\n\x1e\x43hatRoomMessageRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"G\n/ChatRoomMessageSubscribeChatRoomMessagesRequest\x12\x14\n\x0c\x63hat_room_id\x18\x01 \x01(\x05\"\xae\x01\n\x1c\x43hatRoomPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x17\n\ncreated_at\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x05 \x01(\x05H\x02\x88\x01\x01\x42\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"\x81\x01\n\x0f\x43hatRoomRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\ncreated_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x04 \x01(\x05H\x02\x88\x01\x01\x42\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"\xc1\x01\n\x10\x43hatRoomResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\ncreated_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x04 \x01(\x05H\x02\x88\x01\x01\x12=\n\x0cparticipants\x18\x05 \x03(\x0b\x32\'.chat_service.chat.ChatRoomUserResponseB\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"%\n\x17\x43hatRoomRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"(\n\x1a\x43hatRoomUserDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x19\n\x17\x43hatRoomUserListRequest\"T\n\x18\x43hatRoomUserListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.chat_service.chat.ChatRoomUserResponse\"\xa4\x01\n ChatRoomUserPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\x05\x12\x16\n\tjoined_at\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\"w\n\x13\x43hatRoomUserRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x16\n\tjoined_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\"x\n\x14\x43hatRoomUserResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x16\n\tjoined_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\")\n\x1b\x43hatRoomUserRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x32\xa8\x05\n\x12\x43hatRoomController\x12S\n\x06\x43reate\x12\".chat_service.chat.ChatRoomRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12N\n\x07\x44\x65stroy\x12).chat_service.chat.ChatRoomDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12u\n\x13GetChatRoomByUserId\x12\x35.chat_service.chat.ChatRoomGetChatRoomByUserIdRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x30\x01\x12Y\n\x04List\x12&.chat_service.chat.ChatRoomListRequest\x1a\'.chat_service.chat.ChatRoomListResponse\"\x00\x12g\n\rPartialUpdate\x12/.chat_service.chat.ChatRoomPartialUpdateRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12]\n\x08Retrieve\x12*.chat_service.chat.ChatRoomRetrieveRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12S\n\x06Update\x12\".chat_service.chat.ChatRoomRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x32\x97\x06\n\x19\x43hatRoomMessageController\x12\x61\n\x06\x43reate\x12).chat_service.chat.ChatRoomMessageRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12U\n\x07\x44\x65stroy\x12\x30.chat_service.chat.ChatRoomMessageDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12g\n\x04List\x12-.chat_service.chat.ChatRoomMessageListRequest\x1a..chat_service.chat.ChatRoomMessageListResponse\"\x00\x12u\n\rPartialUpdate\x12\x36.chat_service.chat.ChatRoomMessagePartialUpdateRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12k\n\x08Retrieve\x12\x31.chat_service.chat.ChatRoomMessageRetrieveRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12\x8f\x01\n\x19SubscribeChatRoomMessages\x12\x42.chat_service.chat.ChatRoomMessageSubscribeChatRoomMessagesRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x30\x01\x12\x61\n\x06Update\x12).chat_service.chat.ChatRoomMessageRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x32\xe1\x04\n\x16\x43hatRoomUserController\x12[\n\x06\x43reate\x12&.chat_service.chat.ChatRoomUserRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12R\n\x07\x44\x65stroy\x12-.chat_service.chat.ChatRoomUserDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x61\n\x04List\x12*.chat_service.chat.ChatRoomUserListRequest\x1a+.chat_service.chat.ChatRoomUserListResponse\"\x00\x12o\n\rPartialUpdate\x12\x33.chat_service.chat.ChatRoomUserPartialUpdateRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12\x65\n\x08Retrieve\x12..chat_service.chat.ChatRoomUserRetrieveRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12[\n\x06Update\x12&.chat_service.chat.ChatRoomUserRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nchat.proto\x12\x11\x63hat_service.chat\x1a\x1bgoogle/protobuf/empty.proto\"1\n\x1e\x43hatRoomDestroyByGameIdRequest\x12\x0f\n\x07game_id\x18\x01 \x01(\x05\"2\n\x1f\x43hatRoomDestroyByGameIdResponse\x12\x0f\n\x07\x64\x65leted\x18\x01 \x01(\x05\"$\n\x16\x43hatRoomDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\"ChatRoomGetChatRoomByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\x15\n\x13\x43hatRoomListRequest\"L\n\x14\x43hatRoomListResponse\x12\x34\n\x07results\x18\x01 \x03(\x0b\x32#.chat_service.chat.ChatRoomResponse\"+\n\x1d\x43hatRoomMessageDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"`\n\'ChatRoomMessageListMessagesAfterRequest\x12\x14\n\x0c\x63hat_room_id\x18\x01 \x01(\x05\x12\x10\n\x08\x61\x66ter_id\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\"b\n(ChatRoomMessageListMessagesBeforeRequest\x12\x14\n\x0c\x63hat_room_id\x18\x01 \x01(\x05\x12\x11\n\tbefore_id\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\"\x1c\n\x1a\x43hatRoomMessageListRequest\"Z\n\x1b\x43hatRoomMessageListResponse\x12;\n\x07results\x18\x01 \x03(\x0b\x32*.chat_service.chat.ChatRoomMessageResponse\"\xba\x01\n#ChatRoomMessagePartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x11\n\tsender_id\x18\x04 \x01(\x05\x12\x16\n\ttimestamp\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x06 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\"\x8d\x01\n\x16\x43hatRoomMessageRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x11\n\tsender_id\x18\x03 \x01(\x05\x12\x16\n\ttimestamp\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\"\x8e\x01\n\x17\x43hatRoomMessageResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12\x11\n\tsender_id\x18\x03 \x01(\x05\x12\x16\n\ttimestamp\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_timestamp\",\n\x1e\x43hatRoomMessageRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"{\n/ChatRoomMessageSubscribeChatRoomMessagesRequest\x12\x14\n\x0c\x63hat_room_id\x18\x01 \x01(\x05\x12\x10\n\x08\x61\x66ter_id\x18\x02 \x01(\x05\x12\x14\n\x07\x62\x61\x63klog\x18\x03 \x01(\x05H\x00\x88\x01\x01\x42\n\n\x08_backlog\"M\n(ChatRoomMessageSubscribeUserInboxRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x10\n\x08\x61\x66ter_id\x18\x02 \x01(\x05\"\xae\x01\n\x1c\x43hatRoomPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x17\n\ncreated_at\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x05 \x01(\x05H\x02\x88\x01\x01\x42\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"\x81\x01\n\x0f\x43hatRoomRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\ncreated_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x04 \x01(\x05H\x02\x88\x01\x01\x42\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"\xc1\x01\n\x10\x43hatRoomResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x17\n\ncreated_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07game_id\x18\x04 \x01(\x05H\x02\x88\x01\x01\x12=\n\x0cparticipants\x18\x05 \x03(\x0b\x32\'.chat_service.chat.ChatRoomUserResponseB\x05\n\x03_idB\r\n\x0b_created_atB\n\n\x08_game_id\"%\n\x17\x43hatRoomRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\":\n\'ChatRoomSubscribeChatRoomChangesRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\x9c\x01\n(ChatRoomSubscribeChatRoomChangesResponse\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x14\n\x0c\x63hat_room_id\x18\x02 \x01(\x05\x12\x36\n\tchat_room\x18\x03 \x01(\x0b\x32#.chat_service.chat.ChatRoomResponse\x12\x14\n\x0croom_deleted\x18\x04 \x01(\x08\"X\n\x1a\x43hatRoomUnreadListResponse\x12:\n\x07results\x18\x01 \x03(\x0b\x32).chat_service.chat.ChatRoomUnreadResponse\"\x83\x01\n\x16\x43hatRoomUnreadResponse\x12\x11\n\tchat_room\x18\x01 \x01(\x05\x12\x19\n\x0clast_read_id\x18\x02 \x01(\x05H\x00\x88\x01\x01\x12\x19\n\x0cunread_count\x18\x03 \x01(\x05H\x01\x88\x01\x01\x42\x0f\n\r_last_read_idB\x0f\n\r_unread_count\"(\n\x1a\x43hatRoomUserDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"5\n\"ChatRoomUserGetUnreadCountsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\x19\n\x17\x43hatRoomUserListRequest\"T\n\x18\x43hatRoomUserListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.chat_service.chat.ChatRoomUserResponse\"Z\n\x1b\x43hatRoomUserMarkReadRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x14\n\x0c\x63hat_room_id\x18\x02 \x01(\x05\x12\x14\n\x0clast_read_id\x18\x03 \x01(\x05\"\xa4\x01\n ChatRoomUserPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\x05\x12\x16\n\tjoined_at\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x05 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\"w\n\x13\x43hatRoomUserRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x16\n\tjoined_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\"x\n\x14\x43hatRoomUserResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x16\n\tjoined_at\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\tchat_room\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x0c\n\n_joined_at\")\n\x1b\x43hatRoomUserRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x32\xbe\x07\n\x12\x43hatRoomController\x12S\n\x06\x43reate\x12\".chat_service.chat.ChatRoomRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12N\n\x07\x44\x65stroy\x12).chat_service.chat.ChatRoomDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12z\n\x0f\x44\x65stroyByGameId\x12\x31.chat_service.chat.ChatRoomDestroyByGameIdRequest\x1a\x32.chat_service.chat.ChatRoomDestroyByGameIdResponse\"\x00\x12u\n\x13GetChatRoomByUserId\x12\x35.chat_service.chat.ChatRoomGetChatRoomByUserIdRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x30\x01\x12Y\n\x04List\x12&.chat_service.chat.ChatRoomListRequest\x1a\'.chat_service.chat.ChatRoomListResponse\"\x00\x12g\n\rPartialUpdate\x12/.chat_service.chat.ChatRoomPartialUpdateRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12]\n\x08Retrieve\x12*.chat_service.chat.ChatRoomRetrieveRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x12\x97\x01\n\x18SubscribeChatRoomChanges\x12:.chat_service.chat.ChatRoomSubscribeChatRoomChangesRequest\x1a;.chat_service.chat.ChatRoomSubscribeChatRoomChangesResponse\"\x00\x30\x01\x12S\n\x06Update\x12\".chat_service.chat.ChatRoomRequest\x1a#.chat_service.chat.ChatRoomResponse\"\x00\x32\xa5\t\n\x19\x43hatRoomMessageController\x12\x61\n\x06\x43reate\x12).chat_service.chat.ChatRoomMessageRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12U\n\x07\x44\x65stroy\x12\x30.chat_service.chat.ChatRoomMessageDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12g\n\x04List\x12-.chat_service.chat.ChatRoomMessageListRequest\x1a..chat_service.chat.ChatRoomMessageListResponse\"\x00\x12\x81\x01\n\x11ListMessagesAfter\x12:.chat_service.chat.ChatRoomMessageListMessagesAfterRequest\x1a..chat_service.chat.ChatRoomMessageListResponse\"\x00\x12\x83\x01\n\x12ListMessagesBefore\x12;.chat_service.chat.ChatRoomMessageListMessagesBeforeRequest\x1a..chat_service.chat.ChatRoomMessageListResponse\"\x00\x12u\n\rPartialUpdate\x12\x36.chat_service.chat.ChatRoomMessagePartialUpdateRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12k\n\x08Retrieve\x12\x31.chat_service.chat.ChatRoomMessageRetrieveRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x12\x8f\x01\n\x19SubscribeChatRoomMessages\x12\x42.chat_service.chat.ChatRoomMessageSubscribeChatRoomMessagesRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x30\x01\x12\x81\x01\n\x12SubscribeUserInbox\x12;.chat_service.chat.ChatRoomMessageSubscribeUserInboxRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x30\x01\x12\x61\n\x06Update\x12).chat_service.chat.ChatRoomMessageRequest\x1a*.chat_service.chat.ChatRoomMessageResponse\"\x00\x32\xc5\x06\n\x16\x43hatRoomUserController\x12[\n\x06\x43reate\x12&.chat_service.chat.ChatRoomUserRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12R\n\x07\x44\x65stroy\x12-.chat_service.chat.ChatRoomUserDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12y\n\x0fGetUnreadCounts\x12\x35.chat_service.chat.ChatRoomUserGetUnreadCountsRequest\x1a-.chat_service.chat.ChatRoomUnreadListResponse\"\x00\x12\x61\n\x04List\x12*.chat_service.chat.ChatRoomUserListRequest\x1a+.chat_service.chat.ChatRoomUserListResponse\"\x00\x12g\n\x08MarkRead\x12..chat_service.chat.ChatRoomUserMarkReadRequest\x1a).chat_service.chat.ChatRoomUnreadResponse\"\x00\x12o\n\rPartialUpdate\x12\x33.chat_service.chat.ChatRoomUserPartialUpdateRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12\x65\n\x08Retrieve\x12..chat_service.chat.ChatRoomUserRetrieveRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x12[\n\x06Update\x12&.chat_service.chat.ChatRoomUserRequest\x1a\'.chat_service.chat.ChatRoomUserResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'chat_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_CHATROOMDESTROYREQUEST']._serialized_start=62
-  _globals['_CHATROOMDESTROYREQUEST']._serialized_end=98
-  _globals['_CHATROOMGETCHATROOMBYUSERIDREQUEST']._serialized_start=100
-  _globals['_CHATROOMGETCHATROOMBYUSERIDREQUEST']._serialized_end=153
-  _globals['_CHATROOMLISTREQUEST']._serialized_start=155
-  _globals['_CHATROOMLISTREQUEST']._serialized_end=176
-  _globals['_CHATROOMLISTRESPONSE']._serialized_start=178
-  _globals['_CHATROOMLISTRESPONSE']._serialized_end=254
-  _globals['_CHATROOMMESSAGEDESTROYREQUEST']._serialized_start=256
-  _globals['_CHATROOMMESSAGEDESTROYREQUEST']._serialized_end=299
-  _globals['_CHATROOMMESSAGELISTREQUEST']._serialized_start=301
-  _globals['_CHATROOMMESSAGELISTREQUEST']._serialized_end=329
-  _globals['_CHATROOMMESSAGELISTRESPONSE']._serialized_start=331
-  _globals['_CHATROOMMESSAGELISTRESPONSE']._serialized_end=421
-  _globals['_CHATROOMMESSAGEPARTIALUPDATEREQUEST']._serialized_start=424
-  _globals['_CHATROOMMESSAGEPARTIALUPDATEREQUEST']._serialized_end=610
-  _globals['_CHATROOMMESSAGEREQUEST']._serialized_start=613
-  _globals['_CHATROOMMESSAGEREQUEST']._serialized_end=754
-  _globals['_CHATROOMMESSAGERESPONSE']._serialized_start=757
-  _globals['_CHATROOMMESSAGERESPONSE']._serialized_end=899
-  _globals['_CHATROOMMESSAGERETRIEVEREQUEST']._serialized_start=901
-  _globals['_CHATROOMMESSAGERETRIEVEREQUEST']._serialized_end=945
-  _globals['_CHATROOMMESSAGESUBSCRIBECHATROOMMESSAGESREQUEST']._serialized_start=947
-  _globals['_CHATROOMMESSAGESUBSCRIBECHATROOMMESSAGESREQUEST']._serialized_end=1018
-  _globals['_CHATROOMPARTIALUPDATEREQUEST']._serialized_start=1021
-  _globals['_CHATROOMPARTIALUPDATEREQUEST']._serialized_end=1195
-  _globals['_CHATROOMREQUEST']._serialized_start=1198
-  _globals['_CHATROOMREQUEST']._serialized_end=1327
-  _globals['_CHATROOMRESPONSE']._serialized_start=1330
-  _globals['_CHATROOMRESPONSE']._serialized_end=1523
-  _globals['_CHATROOMRETRIEVEREQUEST']._serialized_start=1525
-  _globals['_CHATROOMRETRIEVEREQUEST']._serialized_end=1562
-  _globals['_CHATROOMUSERDESTROYREQUEST']._serialized_start=1564
-  _globals['_CHATROOMUSERDESTROYREQUEST']._serialized_end=1604
-  _globals['_CHATROOMUSERLISTREQUEST']._serialized_start=1606
-  _globals['_CHATROOMUSERLISTREQUEST']._serialized_end=1631
-  _globals['_CHATROOMUSERLISTRESPONSE']._serialized_start=1633
-  _globals['_CHATROOMUSERLISTRESPONSE']._serialized_end=1717
-  _globals['_CHATROOMUSERPARTIALUPDATEREQUEST']._serialized_start=1720
-  _globals['_CHATROOMUSERPARTIALUPDATEREQUEST']._serialized_end=1884
-  _globals['_CHATROOMUSERREQUEST']._serialized_start=1886
-  _globals['_CHATROOMUSERREQUEST']._serialized_end=2005
-  _globals['_CHATROOMUSERRESPONSE']._serialized_start=2007
-  _globals['_CHATROOMUSERRESPONSE']._serialized_end=2127
-  _globals['_CHATROOMUSERRETRIEVEREQUEST']._serialized_start=2129
-  _globals['_CHATROOMUSERRETRIEVEREQUEST']._serialized_end=2170
-  _globals['_CHATROOMCONTROLLER']._serialized_start=2173
-  _globals['_CHATROOMCONTROLLER']._serialized_end=2853
-  _globals['_CHATROOMMESSAGECONTROLLER']._serialized_start=2856
-  _globals['_CHATROOMMESSAGECONTROLLER']._serialized_end=3647
-  _globals['_CHATROOMUSERCONTROLLER']._serialized_start=3650
-  _globals['_CHATROOMUSERCONTROLLER']._serialized_end=4259
+  _globals['_CHATROOMDESTROYBYGAMEIDREQUEST']._serialized_start=62
+  _globals['_CHATROOMDESTROYBYGAMEIDREQUEST']._serialized_end=111
+  _globals['_CHATROOMDESTROYBYGAMEIDRESPONSE']._serialized_start=113
+  _globals['_CHATROOMDESTROYBYGAMEIDRESPONSE']._serialized_end=163
+  _globals['_CHATROOMDESTROYREQUEST']._serialized_start=165
+  _globals['_CHATROOMDESTROYREQUEST']._serialized_end=201
+  _globals['_CHATROOMGETCHATROOMBYUSERIDREQUEST']._serialized_start=203
+  _globals['_CHATROOMGETCHATROOMBYUSERIDREQUEST']._serialized_end=256
+  _globals['_CHATROOMLISTREQUEST']._serialized_start=258
+  _globals['_CHATROOMLISTREQUEST']._serialized_end=279
+  _globals['_CHATROOMLISTRESPONSE']._serialized_start=281
+  _globals['_CHATROOMLISTRESPONSE']._serialized_end=357
+  _globals['_CHATROOMMESSAGEDESTROYREQUEST']._serialized_start=359
+  _globals['_CHATROOMMESSAGEDESTROYREQUEST']._serialized_end=402
+  _globals['_CHATROOMMESSAGELISTMESSAGESAFTERREQUEST']._serialized_start=404
+  _globals['_CHATROOMMESSAGELISTMESSAGESAFTERREQUEST']._serialized_end=500
+  _globals['_CHATROOMMESSAGELISTMESSAGESBEFOREREQUEST']._serialized_start=502
+  _globals['_CHATROOMMESSAGELISTMESSAGESBEFOREREQUEST']._serialized_end=600
+  _globals['_CHATROOMMESSAGELISTREQUEST']._serialized_start=602
+  _globals['_CHATROOMMESSAGELISTREQUEST']._serialized_end=630
+  _globals['_CHATROOMMESSAGELISTRESPONSE']._serialized_start=632
+  _globals['_CHATROOMMESSAGELISTRESPONSE']._serialized_end=722
+  _globals['_CHATROOMMESSAGEPARTIALUPDATEREQUEST']._serialized_start=725
+  _globals['_CHATROOMMESSAGEPARTIALUPDATEREQUEST']._serialized_end=911
+  _globals['_CHATROOMMESSAGEREQUEST']._serialized_start=914
+  _globals['_CHATROOMMESSAGEREQUEST']._serialized_end=1055
+  _globals['_CHATROOMMESSAGERESPONSE']._serialized_start=1058
+  _globals['_CHATROOMMESSAGERESPONSE']._serialized_end=1200
+  _globals['_CHATROOMMESSAGERETRIEVEREQUEST']._serialized_start=1202
+  _globals['_CHATROOMMESSAGERETRIEVEREQUEST']._serialized_end=1246
+  _globals['_CHATROOMMESSAGESUBSCRIBECHATROOMMESSAGESREQUEST']._serialized_start=1248
+  _globals['_CHATROOMMESSAGESUBSCRIBECHATROOMMESSAGESREQUEST']._serialized_end=1371
+  _globals['_CHATROOMMESSAGESUBSCRIBEUSERINBOXREQUEST']._serialized_start=1373
+  _globals['_CHATROOMMESSAGESUBSCRIBEUSERINBOXREQUEST']._serialized_end=1450
+  _globals['_CHATROOMPARTIALUPDATEREQUEST']._serialized_start=1453
+  _globals['_CHATROOMPARTIALUPDATEREQUEST']._serialized_end=1627
+  _globals['_CHATROOMREQUEST']._serialized_start=1630
+  _globals['_CHATROOMREQUEST']._serialized_end=1759
+  _globals['_CHATROOMRESPONSE']._serialized_start=1762
+  _globals['_CHATROOMRESPONSE']._serialized_end=1955
+  _globals['_CHATROOMRETRIEVEREQUEST']._serialized_start=1957
+  _globals['_CHATROOMRETRIEVEREQUEST']._serialized_end=1994
+  _globals['_CHATROOMSUBSCRIBECHATROOMCHANGESREQUEST']._serialized_start=1996
+  _globals['_CHATROOMSUBSCRIBECHATROOMCHANGESREQUEST']._serialized_end=2054
+  _globals['_CHATROOMSUBSCRIBECHATROOMCHANGESRESPONSE']._serialized_start=2057
+  _globals['_CHATROOMSUBSCRIBECHATROOMCHANGESRESPONSE']._serialized_end=2213
+  _globals['_CHATROOMUNREADLISTRESPONSE']._serialized_start=2215
+  _globals['_CHATROOMUNREADLISTRESPONSE']._serialized_end=2303
+  _globals['_CHATROOMUNREADRESPONSE']._serialized_start=2306
+  _globals['_CHATROOMUNREADRESPONSE']._serialized_end=2437
+  _globals['_CHATROOMUSERDESTROYREQUEST']._serialized_start=2439
+  _globals['_CHATROOMUSERDESTROYREQUEST']._serialized_end=2479
+  _globals['_CHATROOMUSERGETUNREADCOUNTSREQUEST']._serialized_start=2481
+  _globals['_CHATROOMUSERGETUNREADCOUNTSREQUEST']._serialized_end=2534
+  _globals['_CHATROOMUSERLISTREQUEST']._serialized_start=2536
+  _globals['_CHATROOMUSERLISTREQUEST']._serialized_end=2561
+  _globals['_CHATROOMUSERLISTRESPONSE']._serialized_start=2563
+  _globals['_CHATROOMUSERLISTRESPONSE']._serialized_end=2647
+  _globals['_CHATROOMUSERMARKREADREQUEST']._serialized_start=2649
+  _globals['_CHATROOMUSERMARKREADREQUEST']._serialized_end=2739
+  _globals['_CHATROOMUSERPARTIALUPDATEREQUEST']._serialized_start=2742
+  _globals['_CHATROOMUSERPARTIALUPDATEREQUEST']._serialized_end=2906
+  _globals['_CHATROOMUSERREQUEST']._serialized_start=2908
+  _globals['_CHATROOMUSERREQUEST']._serialized_end=3027
+  _globals['_CHATROOMUSERRESPONSE']._serialized_start=3029
+  _globals['_CHATROOMUSERRESPONSE']._serialized_end=3149
+  _globals['_CHATROOMUSERRETRIEVEREQUEST']._serialized_start=3151
+  _globals['_CHATROOMUSERRETRIEVEREQUEST']._serialized_end=3192
+  _globals['_CHATROOMCONTROLLER']._serialized_start=3195
+  _globals['_CHATROOMCONTROLLER']._serialized_end=4153
+  _globals['_CHATROOMMESSAGECONTROLLER']._serialized_start=4156
+  _globals['_CHATROOMMESSAGECONTROLLER']._serialized_end=5345
+  _globals['_CHATROOMUSERCONTROLLER']._serialized_start=5348
+  _globals['_CHATROOMUSERCONTROLLER']._serialized_end=6185
 # @@protoc_insertion_point(module_scope)
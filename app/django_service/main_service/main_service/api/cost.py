@@ -0,0 +1,258 @@
+import logging
+import math
+
+from ariadne.types import Extension
+from django.conf import settings
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    ValidationRule,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+    is_list_type,
+)
+from prometheus_client import Histogram
+
+from main_service.api.grpc_pool import RpcCount, rpc_count
+from main_service.api.loaders import MAX_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_OPERATION_COST = Histogram(
+    "graphql_operation_cost",
+    "Estimated downstream RPCs of executed GraphQL operations",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200),
+)
+GRAPHQL_OPERATION_RPC_CALLS = Histogram(
+    "graphql_operation_rpc_calls",
+    "Downstream RPCs actually issued by executed GraphQL operations",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200),
+)
+
+# Downstream RPCs triggered by each resolved field. "batched" fields go
+# through a DataLoader and cost one call per MAX_BATCH_SIZE parents;
+# "per_item" RPCs are issued once for every element of the returned list.
+# Fields that are not listed only read data their parent already fetched.
+FIELD_COSTS = {
+    "Query": {
+        "user": {"rpcs": 1},
+        "profile": {"rpcs": 1},
+        "getAllProfiles": {"rpcs": 1},
+        "profiles": {"rpcs": 1},
+        "searchProfiles": {"rpcs": 1},
+        "stat": {"rpcs": 1},
+        "statsByUser": {"rpcs": 1, "per_item": 1},
+        "calculateUserStats": {"rpcs": 1},
+        "StatList": {"rpcs": 11},
+        "game": {"rpcs": 1},
+        "ongoing_games": {"rpcs": 1},
+        "game_event": {"rpcs": 1},
+        "tournament": {"rpcs": 2},
+        "tournaments": {"rpcs": 1},
+        "tournament_users": {"rpcs": 1},
+        "tournament_games": {"rpcs": 1},
+        "friendships": {"rpcs": 1},
+        "friendNetwork": {"rpcs": 1},
+        "mutualFriends": {"rpcs": 1},
+        "chat_room_messages_before": {"rpcs": 1},
+        "chatUnreadCounts": {"rpcs": 1},
+    },
+    "User": {
+        "profile": {"rpcs": 1, "batched": True},
+        "notifications": {"rpcs": 1, "batched": True},
+    },
+    "Friend": {
+        "profile": {"rpcs": 1, "batched": True},
+    },
+    "FriendSuggestion": {
+        "profile": {"rpcs": 1, "batched": True},
+    },
+    "ChatRoomUser": {
+        "user": {"rpcs": 1, "batched": True},
+        "profile": {"rpcs": 1, "batched": True},
+    },
+    "Mutation": {
+        "createUser": {"rpcs": 1},
+        "manageProfile": {"rpcs": 1},
+        "manageFriendship": {"rpcs": 7},
+        "manageNotification": {"rpcs": 3},
+        "manageSetting": {"rpcs": 2},
+        "manageUserAchievement": {"rpcs": 2},
+        "createStat": {"rpcs": 1},
+        "create_game": {"rpcs": 1},
+        "create_game_event": {"rpcs": 1},
+        "start_game": {"rpcs": 1},
+        "create_tournament": {"rpcs": 2},
+        "create_tournament_user": {"rpcs": 3},
+        "update_tournament_user": {"rpcs": 1},
+        "remove_user_from_chat_room": {"rpcs": 1},
+        "create_tournament_game": {"rpcs": 2},
+        "create_friend_game": {"rpcs": 7},
+        "update_game_state": {"rpcs": 1},
+        "create_chat_room": {"rpcs": 2},
+        "add_user_to_chat_room": {"rpcs": 1},
+        "startChatWithUser": {"rpcs": 3},
+        "create_chat_room_message": {"rpcs": 1},
+        "markChatRoomRead": {"rpcs": 1},
+    },
+    "Subscription": {
+        "chatRoomsForUser": {"rpcs": 1},
+        "chatRoomChanges": {"rpcs": 1},
+        "chat_room_message": {"rpcs": 2},
+        "chatInbox": {"rpcs": 1},
+        "notificationsForUser": {"rpcs": 2},
+        "onlineStatus": {"rpcs": 1},
+    },
+}
+
+LIST_SIZE_ARGUMENTS = ("limit", "first")
+
+
+class QueryCost:
+    """Static cost of one operation: nesting depth and downstream RPCs."""
+
+    def __init__(self, schema, fragments, variables, default_list_size):
+        self.schema = schema
+        self.fragments = fragments
+        self.variables = variables or {}
+        self.default_list_size = default_list_size
+        self.depth = 0
+        self.cost = 0
+
+    def measure(self, operation):
+        root_type = self.schema.get_root_type(operation.operation)
+        self.visit(root_type, operation.selection_set, multiplier=1, depth=0, visited_fragments=frozenset())
+        return self
+
+    def visit(self, parent_type, selection_set, multiplier, depth, visited_fragments):
+        if selection_set is None or parent_type is None:
+            return
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                self.visit_field(parent_type, selection, multiplier, depth + 1, visited_fragments)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value)
+                self.visit(fragment_type, selection.selection_set, multiplier, depth, visited_fragments)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited_fragments:
+                    continue
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                self.visit(fragment_type, fragment.selection_set, multiplier, depth, visited_fragments | {name})
+
+    def visit_field(self, parent_type, node, multiplier, depth, visited_fragments):
+        name = node.name.value
+        if name.startswith("__"):
+            return
+        field = getattr(parent_type, "fields", {}).get(name)
+        if field is None:
+            return
+
+        self.depth = max(self.depth, depth)
+        list_size = self.list_size(node) if is_list_type(get_nullable_type(field.type)) else 1
+
+        field_cost = FIELD_COSTS.get(parent_type.name, {}).get(name)
+        if field_cost:
+            rpcs = field_cost.get("rpcs", 0)
+            if field_cost.get("batched"):
+                self.cost += rpcs * math.ceil(multiplier / MAX_BATCH_SIZE)
+            else:
+                self.cost += rpcs * multiplier
+            self.cost += field_cost.get("per_item", 0) * list_size * multiplier
+
+        self.visit(get_named_type(field.type), node.selection_set, multiplier * list_size, depth, visited_fragments)
+
+    def list_size(self, node):
+        for argument in node.arguments:
+            if argument.name.value not in LIST_SIZE_ARGUMENTS:
+                continue
+            if isinstance(argument.value, VariableNode):
+                value = self.variables.get(argument.value.name.value)
+            else:
+                value = getattr(argument.value, "value", None)
+            try:
+                return max(int(value), 0)
+            except (TypeError, ValueError):
+                break
+        return self.default_list_size
+
+
+class QueryCostRule(ValidationRule):
+    """
+    Rejects operations over GRAPHQL_MAX_DEPTH or GRAPHQL_MAX_COST before any
+    resolver runs. The estimate is left in the context for QueryCostExtension.
+
+    The result depends on the request's variables, so the document cache must
+    not reuse it across requests.
+    """
+
+    cacheable = False
+    context_value = None
+    data = None
+
+    def enter_document(self, node, *_args):
+        data = self.data or {}
+        operation = get_operation_ast(node, data.get("operationName"))
+        if operation is None:
+            return self.SKIP
+
+        fragments = {
+            definition.name.value: definition
+            for definition in node.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        query_cost = QueryCost(
+            self.context.schema,
+            fragments,
+            data.get("variables"),
+            getattr(settings, "GRAPHQL_DEFAULT_LIST_SIZE", 10),
+        ).measure(operation)
+
+        max_depth = getattr(settings, "GRAPHQL_MAX_DEPTH", 10)
+        max_cost = getattr(settings, "GRAPHQL_MAX_COST", 50)
+        if query_cost.depth > max_depth:
+            self.report_error(GraphQLError(
+                f"Query depth {query_cost.depth} exceeds the maximum of {max_depth}", operation
+            ))
+        elif query_cost.cost > max_cost:
+            self.report_error(GraphQLError(
+                f"Query cost {query_cost.cost} exceeds the maximum of {max_cost}", operation
+            ))
+        elif isinstance(self.context_value, dict):
+            self.context_value["query_cost"] = query_cost.cost
+        return self.SKIP
+
+
+def get_validation_rules(context_value, document, data):
+    """``validation_rules`` callable binding the cost rule to one request."""
+    rule = type("QueryCostRule", (QueryCostRule,), {"context_value": context_value, "data": data})
+    return [rule]
+
+
+class QueryCostExtension(Extension):
+    """Records the estimated and the measured downstream cost of each operation."""
+
+    def __init__(self):
+        self.rpc_count = RpcCount()
+        self.token = None
+
+    def request_started(self, context):
+        self.token = rpc_count.set(self.rpc_count)
+
+    def request_finished(self, context):
+        rpc_count.reset(self.token)
+        estimated = context.get("query_cost") if isinstance(context, dict) else None
+        if estimated is None:
+            return
+        GRAPHQL_OPERATION_COST.observe(estimated)
+        GRAPHQL_OPERATION_RPC_CALLS.observe(self.rpc_count.calls)
+        if self.rpc_count.calls > estimated:
+            logger.warning(f"Operation issued {self.rpc_count.calls} RPCs, estimated {estimated}")
@@ -0,0 +1,255 @@
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+
+import grpc
+from django.conf import settings
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+GRPC_CHANNEL_CREATED = Counter(
+    "grpc_channel_created_total",
+    "gRPC channels opened by the gateway",
+    ["target", "kind"],
+)
+GRPC_CHANNEL_REUSED = Counter(
+    "grpc_channel_reused_total",
+    "Stub lookups served by an already open gRPC channel",
+    ["target", "kind"],
+)
+GRPC_CHANNEL_OPEN = Gauge(
+    "grpc_channel_open",
+    "gRPC channels currently held by the registry",
+    ["target", "kind"],
+)
+
+
+GRPC_CLIENT_DURATION = Histogram(
+    "grpc_client_duration_seconds",
+    "Latency of unary gRPC calls issued by the gateway",
+    ["target", "method", "status"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+
+class RpcCount:
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = 0
+
+
+class RpcCall:
+    __slots__ = ("target", "method", "status", "duration")
+
+    def __init__(self, target, method, status, duration):
+        self.target = target
+        self.method = method
+        self.status = status
+        self.duration = duration
+
+
+# Set per GraphQL operation to count the RPCs its resolvers issue.
+rpc_count = ContextVar("grpc_rpc_count", default=None)
+# Set by the tracing extension to an object with an ``rpc_calls`` list that
+# collects the RPCs issued by the resolver currently running.
+rpc_trace = ContextVar("grpc_rpc_trace", default=None)
+
+
+def _method_name(method):
+    if isinstance(method, bytes):
+        method = method.decode()
+    return method.rsplit(".", 1)[-1]
+
+
+class _ClientInterceptorBase:
+    def __init__(self, service):
+        self.service = service
+
+    @staticmethod
+    def _count():
+        counter = rpc_count.get()
+        if counter is not None:
+            counter.calls += 1
+
+    def _record(self, method, code, start, trace):
+        duration = time.perf_counter() - start
+        call = RpcCall(self.service, _method_name(method), code.name if code is not None else "UNKNOWN", duration)
+        GRPC_CLIENT_DURATION.labels(call.target, call.method, call.status).observe(duration)
+        if trace is not None:
+            trace.rpc_calls.append(call)
+
+
+class _ClientInterceptor(
+    _ClientInterceptorBase, grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        self._count()
+        trace = rpc_trace.get()
+        start = time.perf_counter()
+        call = await continuation(client_call_details, request)
+        # code() waits for the call to finish without raising its error,
+        # the stub still gets it when it awaits the call.
+        self._record(client_call_details.method, await call.code(), start, trace)
+        return call
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        self._count()
+        return await continuation(client_call_details, request)
+
+
+class _SyncClientInterceptor(_ClientInterceptorBase, grpc.UnaryUnaryClientInterceptor):
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        self._count()
+        trace = rpc_trace.get()
+        start = time.perf_counter()
+        outcome = continuation(client_call_details, request)
+        self._record(client_call_details.method, outcome.code(), start, trace)
+        return outcome
+
+
+class ChannelRegistry:
+    """
+    Process-wide registry of long-lived gRPC channels, keyed by service name.
+
+    Sync channels are shared by every thread of the process. ``grpc.aio``
+    channels are bound to the event loop that created them, so they are kept
+    per loop and dropped once that loop is closed.
+
+    Targets and channel options default to ``settings.GRPC_TARGETS`` and
+    ``settings.GRPC_CHANNEL_OPTIONS``; they are read on first use because the
+    schema modules import the registry before Django is configured.
+    """
+
+    def __init__(self, targets=None, options=None):
+        self._targets = targets
+        self._options = options
+        self._lock = threading.Lock()
+        self._channels = {}
+        self._stubs = {}
+        self._aio_channels = weakref.WeakKeyDictionary()
+        self._aio_stubs = weakref.WeakKeyDictionary()
+
+    @property
+    def targets(self):
+        if self._targets is None:
+            self._targets = dict(settings.GRPC_TARGETS)
+        return self._targets
+
+    @property
+    def options(self):
+        if self._options is None:
+            self._options = list(getattr(settings, "GRPC_CHANNEL_OPTIONS", []))
+        return self._options
+
+    def target(self, service):
+        try:
+            return self.targets[service]
+        except KeyError:
+            raise KeyError(f"Unknown gRPC service '{service}'")
+
+    def channel(self, service):
+        channel = self._channels.get(service)
+        if channel is not None:
+            return channel
+        with self._lock:
+            channel = self._channels.get(service)
+            if channel is None:
+                target = self.target(service)
+                logger.info(f"Opening gRPC channel to {service} ({target})")
+                channel = grpc.intercept_channel(
+                    grpc.insecure_channel(target, options=self.options), _SyncClientInterceptor(service)
+                )
+                self._channels[service] = channel
+                GRPC_CHANNEL_CREATED.labels(service, "sync").inc()
+                GRPC_CHANNEL_OPEN.labels(service, "sync").inc()
+        return channel
+
+    def stub(self, service, stub_class):
+        # Reuse is counted here only, once per lookup
+        key = (service, stub_class)
+        stub = self._stubs.get(key)
+        if stub is None:
+            reused = service in self._channels
+            stub = stub_class(self.channel(service))
+            self._stubs[key] = stub
+        else:
+            reused = True
+        if reused:
+            GRPC_CHANNEL_REUSED.labels(service, "sync").inc()
+        return stub
+
+    def aio_channel(self, service):
+        loop = asyncio.get_running_loop()
+        channels = self._aio_channels.get(loop)
+        if channels is None:
+            self._drop_closed_loops()
+            channels = self._aio_channels.setdefault(loop, {})
+        channel = channels.get(service)
+        if channel is None:
+            target = self.target(service)
+            logger.info(f"Opening grpc.aio channel to {service} ({target})")
+            channel = grpc.aio.insecure_channel(
+                target, options=self.options, interceptors=[_ClientInterceptor(service)]
+            )
+            channels[service] = channel
+            GRPC_CHANNEL_CREATED.labels(service, "aio").inc()
+            GRPC_CHANNEL_OPEN.labels(service, "aio").inc()
+        return channel
+
+    def aio_stub(self, service, stub_class):
+        loop = asyncio.get_running_loop()
+        stubs = self._aio_stubs.setdefault(loop, {})
+        key = (service, stub_class)
+        stub = stubs.get(key)
+        if stub is None:
+            reused = service in self._aio_channels.get(loop, {})
+            stub = stub_class(self.aio_channel(service))
+            stubs[key] = stub
+        else:
+            reused = True
+        if reused:
+            GRPC_CHANNEL_REUSED.labels(service, "aio").inc()
+        return stub
+
+    def _drop_closed_loops(self):
+        # A channel references its loop, so entries never leave the weak
+        # dicts on their own. Channels of a closed loop cannot be closed
+        # any more; dropping them is all that is left to do.
+        for loop in [loop for loop in self._aio_channels if loop.is_closed()]:
+            self._aio_stubs.pop(loop, None)
+            for service in self._aio_channels.pop(loop):
+                GRPC_CHANNEL_OPEN.labels(service, "aio").dec()
+
+    def close(self):
+        with self._lock:
+            for service, channel in self._channels.items():
+                channel.close()
+                GRPC_CHANNEL_OPEN.labels(service, "sync").dec()
+            self._channels.clear()
+            self._stubs.clear()
+
+    async def aio_close(self):
+        loop = asyncio.get_running_loop()
+        channels = self._aio_channels.pop(loop, {})
+        self._aio_stubs.pop(loop, None)
+        for service, channel in channels.items():
+            await channel.close()
+            GRPC_CHANNEL_OPEN.labels(service, "aio").dec()
+
+
+registry = ChannelRegistry()
+
+
+def get_stub(service, stub_class):
+    """Return a cached sync stub for ``service`` on its shared channel."""
+    return registry.stub(service, stub_class)
+
+
+def get_aio_stub(service, stub_class):
+    """Return a cached ``grpc.aio`` stub for ``service`` on the running loop."""
+    return registry.aio_stub(service, stub_class)
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime
+
+import grpc
+from main_service.api.grpc_pool import get_aio_stub
+from main_service.protos.notification_pb2 import GetNotificationsByUserIdsRequest
+from main_service.protos.notification_pb2_grpc import NotificationServiceStub
+from main_service.protos.profile_pb2 import GetProfilesByUserIdsRequest
+from main_service.protos.profile_pb2_grpc import ProfileServiceStub
+from main_service.protos.stat_pb2 import CalculateStatsRequest
+from main_service.protos.stat_pb2_grpc import StatServiceStub
+from main_service.protos.user_pb2 import GetUsersByIdsRequest
+from main_service.protos.user_pb2_grpc import UserServiceStub
+
+logger = logging.getLogger(__name__)
+
+# Keys per batch_load_fn call; larger batches are split
+MAX_BATCH_SIZE = 100
+
+
+class DataLoader:
+    """
+    Collects the keys requested during one event loop tick and resolves them
+    with a single call to ``batch_load_fn``.
+
+    ``batch_load_fn`` receives the list of distinct keys and must return a
+    list of values in the same order. Results are cached for the lifetime of
+    the loader, which is one GraphQL request.
+    """
+
+    def __init__(self, batch_load_fn, max_batch_size=MAX_BATCH_SIZE):
+        self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self._cache = {}
+        self._queue = []
+
+    def load(self, key):
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        if not self._queue:
+            loop.call_soon(self._dispatch)
+        self._queue.append((key, future))
+        return future
+
+    def load_many(self, keys):
+        return asyncio.gather(*(self.load(key) for key in keys))
+
+    def clear(self, key):
+        self._cache.pop(key, None)
+
+    def _dispatch(self):
+        queue, self._queue = self._queue, []
+        for start in range(0, len(queue), self.max_batch_size):
+            asyncio.ensure_future(self._load_batch(queue[start:start + self.max_batch_size]))
+
+    async def _load_batch(self, batch):
+        keys = [key for key, _ in batch]
+        try:
+            values = await self.batch_load_fn(keys)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"batch_load_fn returned {len(values)} values for {len(keys)} keys"
+                )
+        except Exception as e:
+            logger.error(f"Batch load failed for keys {keys}: {e}")
+            for key, future in batch:
+                self._cache.pop(key, None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), value in zip(batch, values):
+            if not future.done():
+                future.set_result(value)
+
+
+def user_to_dict(user):
+    return {
+        "id": user.id,
+        "name": user.name,
+        "mail": user.mail,
+        "blocked": user.blocked,
+        "createdAt": datetime.fromtimestamp(user.created_at.seconds) if user.HasField("created_at") else None,
+        "updatedAt": datetime.fromtimestamp(user.updated_at.seconds) if user.HasField("updated_at") else None,
+        "roleId": user.role_id,
+        "lastLogin": datetime.fromtimestamp(user.last_login.seconds) if user.HasField("last_login") else None,
+        "lastLoginIp": user.last_login_ip,
+    }
+
+
+def profile_to_dict(profile):
+    return {
+        "id": profile.id,
+        "userId": profile.user_id,
+        "avatarUrl": profile.avatar_url,
+        "nickname": profile.nickname,
+        "bio": profile.bio,
+        "additionalInfo": profile.additional_info,
+    }
+
+
+def notification_to_dict(notification):
+    return {
+        "id": notification.id,
+        "userId": notification.user_id,
+        "message": notification.message,
+        "read": notification.read,
+        "sentAt": datetime.fromtimestamp(notification.sent_at.seconds) if notification.HasField(
+            "sent_at") else None,
+    }
+
+
+async def load_users(user_ids):
+    stub = get_aio_stub("user_service", UserServiceStub)
+    response = await stub.GetUsersByIds(GetUsersByIdsRequest(ids=user_ids))
+    by_id = {user.id: user_to_dict(user) for user in response.users}
+    return [by_id.get(user_id) for user_id in user_ids]
+
+
+async def load_profiles(user_ids):
+    stub = get_aio_stub("user_service", ProfileServiceStub)
+    response = await stub.GetProfilesByUserIds(GetProfilesByUserIdsRequest(user_ids=user_ids))
+    by_user = {profile.user_id: profile_to_dict(profile) for profile in response.profiles}
+    return [by_user.get(user_id) for user_id in user_ids]
+
+
+async def load_notifications(user_ids):
+    stub = get_aio_stub("user_service", NotificationServiceStub)
+    response = await stub.GetNotificationsByUserIds(GetNotificationsByUserIdsRequest(user_ids=user_ids))
+    by_user = defaultdict(list)
+    for notification in response.notifications:
+        by_user[notification.user_id].append(notification_to_dict(notification))
+    return [by_user[user_id] for user_id in user_ids]
+
+
+async def load_stats(user_ids):
+    # stat_service has no batch RPC; the calls of one batch run concurrently.
+    stub = get_aio_stub("stat_service", StatServiceStub)
+
+    async def calculate(user_id):
+        try:
+            return await stub.CalculateStats(CalculateStatsRequest(user_id=user_id))
+        except grpc.RpcError as e:
+            logger.error(f"gRPC error calculating stats for user {user_id}: {e.details()}")
+            return None
+
+    return await asyncio.gather(*(calculate(user_id) for user_id in user_ids))
+
+
+class Loaders:
+    """The DataLoaders of one GraphQL request."""
+
+    def __init__(self):
+        self.user = DataLoader(load_users)
+        self.profile = DataLoader(load_profiles)
+        self.notifications = DataLoader(load_notifications)
+        self.stats = DataLoader(load_stats)
+
+
+def get_loaders(info):
+    context = info.context
+    loaders = context.get("loaders")
+    if loaders is None:
+        loaders = context["loaders"] = Loaders()
+    return loaders
+
+
+def get_context_value(request):
+    return {"request": request, "loaders": Loaders()}
@@ -0,0 +1,13 @@
+import logging
+
+from django.conf import settings
+from prometheus_client import start_http_server
+
+logger = logging.getLogger(__name__)
+
+
+def start_metrics_server():
+    """Serve the gateway's Prometheus metrics on METRICS_PORT, if set."""
+    if settings.METRICS_PORT:
+        start_http_server(settings.METRICS_PORT)
+        logger.info(f"Serving metrics on port {settings.METRICS_PORT}")
@@ -1,11 +1,6 @@
 import grpc
 from django.http import JsonResponse
-from main_service.protos.auth_pb2_grpc import AuthServiceStub
-from main_service.protos.auth_pb2 import GetUserIDFromJwtTokenRequest
-
-GRPC_HOST = "auth_service"
-GRPC_PORT = "50051"
-GRPC_TARGET = f"{GRPC_HOST}:{GRPC_PORT}"
+from main_service.api.sessions import AuthenticationFailed, aauthenticate, authenticate
 
 class AuthMiddleware:
     def __init__(self, inner):
@@ -26,11 +21,12 @@ class AuthMiddleware:
                 )
 
             try:
-                with grpc.insecure_channel(GRPC_TARGET) as channel:
-                    stub = AuthServiceStub(channel)
-                    request_message = GetUserIDFromJwtTokenRequest(jwt_token=jwt_token)
-                    response = stub.GetUserIDFromJwtToken(request_message)
-                    request.user_id = response.user_id
+                request.user_id = authenticate(jwt_token)
+            except AuthenticationFailed as e:
+                return JsonResponse(
+                    {'error': 'Authentication failed', 'details': str(e)},
+                    status=401
+                )
             except grpc.RpcError as e:
                 return JsonResponse(
                     {'error': 'Authentication failed', 'details': str(e)},
@@ -63,11 +59,9 @@ class AuthMiddleware:
 
             if jwt_token:
                 try:
-                    async with grpc.aio.insecure_channel(GRPC_TARGET) as channel:
-                        stub = AuthServiceStub(channel)
-                        request_message = GetUserIDFromJwtTokenRequest(jwt_token=jwt_token)
-                        response = await stub.GetUserIDFromJwtToken(request_message)
-                        scope["user_id"] = response.user_id
+                    scope["user_id"] = await aauthenticate(jwt_token)
+                except AuthenticationFailed as e:
+                    print(f"Authentication failed: {e}")
                 except grpc.RpcError as e:
                     print(f"Authentication failed: {e.details()}")
                 except Exception as e:
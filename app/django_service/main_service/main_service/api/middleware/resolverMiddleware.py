@@ -0,0 +1,16 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+
+
+def offload_sync_resolvers(next_, obj, info, **kwargs):
+    """
+    GraphQL middleware for async execution: custom resolvers that are still
+    synchronous make blocking gRPC calls, so they run in a worker thread
+    instead of on the event loop. Default and async resolvers run inline.
+    """
+    field = info.parent_type.fields.get(info.field_name)
+    resolver = field.resolve if field is not None else None
+    if resolver is None or asyncio.iscoroutinefunction(resolver):
+        return next_(obj, info, **kwargs)
+    return sync_to_async(next_, thread_sensitive=False)(obj, info, **kwargs)
@@ -0,0 +1,215 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from graphql import GraphQLError, OperationDefinitionNode, parse, validate
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'persisted_queries.json')
+
+GRAPHQL_DOCUMENT_CACHE = Counter(
+    "graphql_document_cache_total",
+    "Lookups in the parsed GraphQL document cache",
+    ["step", "result"],
+)
+
+
+class PersistedQueryNotFound(Exception):
+    pass
+
+
+def query_hash(query):
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryRegistry:
+    """
+    Documents the frontend is allowed to send by hash only, keyed by the
+    SHA-256 of their text. The manifest is written at build time by running
+    this module against frontend_service/logic/gql.
+    """
+
+    def __init__(self, manifest=None):
+        self._manifest = manifest
+        self._documents = None
+        self._operation_names = None
+
+    @property
+    def documents(self):
+        if self._documents is None:
+            path = self._manifest or getattr(settings, "PERSISTED_QUERIES_MANIFEST", DEFAULT_MANIFEST)
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    self._documents = json.load(file)
+            except FileNotFoundError:
+                logger.warning(f"Persisted query manifest {path} not found, only full documents are accepted")
+                self._documents = {}
+        return self._documents
+
+    @property
+    def operation_names(self):
+        """Names of the operations in the manifest, a set bounded by the frontend's documents."""
+        if self._operation_names is None:
+            names = set()
+            for query in self.documents.values():
+                try:
+                    document = parse(query)
+                except GraphQLError:
+                    continue
+                names.update(
+                    definition.name.value
+                    for definition in document.definitions
+                    if isinstance(definition, OperationDefinitionNode) and definition.name
+                )
+            self._operation_names = frozenset(names)
+        return self._operation_names
+
+    def get(self, sha256_hash):
+        return self.documents.get(sha256_hash)
+
+
+class _CachedDocument:
+    __slots__ = ("document", "validation")
+
+    def __init__(self, document):
+        self.document = document
+        self.validation = {}
+
+
+class DocumentCache:
+    """
+    LRU cache of parsed GraphQL documents and their validation result.
+
+    ``parse`` and ``validate`` match ariadne's ``query_parser`` and
+    ``query_validator`` hooks. The validator recognises documents handed out
+    by ``parse`` and only runs the validation rules once per document and
+    rule set. Rules with ``cacheable = False`` run on every request.
+    """
+
+    def __init__(self, max_size=None):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._by_document = {}
+
+    @property
+    def max_size(self):
+        if self._max_size is None:
+            self._max_size = getattr(settings, "GRAPHQL_DOCUMENT_CACHE_SIZE", 256)
+        return self._max_size
+
+    def parse(self, context_value, data):
+        query = data["query"]
+        key = query_hash(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                GRAPHQL_DOCUMENT_CACHE.labels("parse", "hit").inc()
+                return entry.document
+
+        GRAPHQL_DOCUMENT_CACHE.labels("parse", "miss").inc()
+        document = parse(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _CachedDocument(document)
+                self._by_document[id(document)] = entry
+                while len(self._entries) > self.max_size:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._by_document.pop(id(evicted.document), None)
+        return entry.document
+
+    def validate(self, schema, document_ast, rules=None, max_errors=None, type_info=None):
+        entry = self._by_document.get(id(document_ast))
+        if entry is None or entry.document is not document_ast or type_info is not None:
+            return validate(schema, document_ast, rules, max_errors, type_info)
+
+        uncached = [rule for rule in rules or () if not getattr(rule, "cacheable", True)]
+        if uncached:
+            rules = [rule for rule in rules if getattr(rule, "cacheable", True)]
+
+        key = (id(schema), tuple(rules) if rules is not None else None, max_errors)
+        errors = entry.validation.get(key)
+        if errors is None:
+            GRAPHQL_DOCUMENT_CACHE.labels("validate", "miss").inc()
+            errors = entry.validation[key] = validate(schema, document_ast, rules, max_errors)
+        else:
+            GRAPHQL_DOCUMENT_CACHE.labels("validate", "hit").inc()
+        if uncached and not errors:
+            errors = validate(schema, document_ast, uncached, max_errors)
+        return errors
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_document.clear()
+
+
+registry = PersistedQueryRegistry()
+document_cache = DocumentCache()
+
+
+def get_persisted_hash(data):
+    extensions = data.get("extensions") if isinstance(data, dict) else None
+    if not isinstance(extensions, dict):
+        return None
+    persisted = extensions.get("persistedQuery")
+    if not isinstance(persisted, dict):
+        return None
+    return persisted.get("sha256Hash")
+
+
+def apply_persisted_query(data):
+    """
+    Fill in the document of a hash-only request from the registry. Requests
+    that carry both a hash and a document must agree on the hash.
+    """
+    sha256_hash = get_persisted_hash(data)
+    if sha256_hash is None:
+        return data
+
+    query = data.get("query")
+    if query:
+        if not isinstance(query, str) or query_hash(query) != sha256_hash:
+            raise GraphQLError("provided sha does not match query")
+        return data
+
+    query = registry.get(sha256_hash)
+    if query is None:
+        raise PersistedQueryNotFound(sha256_hash)
+    return {**data, "query": query}
+
+
+def build_manifest(gql_dir):
+    documents = {}
+    for root, _, files in os.walk(gql_dir):
+        for filename in sorted(files):
+            if not filename.endswith(".gql"):
+                continue
+            # Read the file the same way frontend_service's load_query does,
+            # so both sides hash identical text.
+            with open(os.path.join(root, filename), "r") as file:
+                query = file.read()
+            documents[query_hash(query)] = query
+    return documents
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the persisted query manifest from a directory of .gql files.")
+    parser.add_argument("gql_dir", help="e.g. ../frontend_service/frontend_service/logic/gql")
+    parser.add_argument("-o", "--output", default=DEFAULT_MANIFEST)
+    args = parser.parse_args()
+
+    manifest = build_manifest(args.gql_dir)
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(manifest, output, indent=2, sort_keys=True)
+        output.write("\n")
+    print(f"Wrote {len(manifest)} persisted queries to {args.output}")
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from graphql import FieldNode, GraphQLError, get_operation_ast
+from graphql.execution.values import get_argument_values
+from prometheus_client import Counter
+
+from main_service.api.persisted_queries import document_cache
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_RESPONSE_CACHE = Counter(
+    "graphql_response_cache_total",
+    "Lookups in the GraphQL response cache",
+    ["result"],
+)
+GRAPHQL_RESPONSE_CACHE_INVALIDATIONS = Counter(
+    "graphql_response_cache_invalidations_total",
+    "Cache tags invalidated by mutations",
+    ["tag"],
+)
+
+
+class CachePlan:
+    __slots__ = ("key", "ttl", "tags", "versioned_key")
+
+    def __init__(self, key, ttl, tags):
+        self.key = key
+        self.ttl = ttl
+        self.tags = tags
+        # Set by ResponseCache.get from the tag versions read before the
+        # query runs, so set() never stores a result under a newer version.
+        self.versioned_key = None
+
+
+def format_tag(tag, viewer, arguments):
+    """Fill in a tag template, or return None if it uses a missing argument."""
+    try:
+        return tag.format(viewer=viewer, **arguments)
+    except KeyError:
+        return None
+
+
+class ResponseCache:
+    """
+    Caches results of read-only operations whose root fields are all listed
+    in GRAPHQL_RESPONSE_CACHE_FIELDS, keyed on document, operation, variables
+    and, unless every field is shared, the viewer.
+
+    Entries are stored in the Django cache named by GRAPHQL_RESPONSE_CACHE
+    (an in-process LocMemCache by default, Redis or Memcached to share it
+    between gateway processes). Tags are invalidated by bumping a version
+    that is part of every entry key, which works on any cache backend.
+    """
+
+    def __init__(self, alias=None):
+        self._alias = alias
+
+    @property
+    def cache(self):
+        return caches[self._alias or getattr(settings, "GRAPHQL_RESPONSE_CACHE", "default")]
+
+    @staticmethod
+    def _root_fields(schema, data):
+        # Malformed bodies are left to ariadne, which answers them with a 400
+        if not isinstance(data, dict) or not isinstance(data.get("query"), str):
+            return None, None
+        if not isinstance(data.get("variables") or {}, dict):
+            return None, None
+        try:
+            document = document_cache.parse(None, data)
+        except GraphQLError:
+            return None, None
+        operation = get_operation_ast(document, data.get("operationName"))
+        if operation is None:
+            return None, None
+
+        root_type = schema.get_root_type(operation.operation)
+        fields = []
+        for selection in operation.selection_set.selections:
+            if not isinstance(selection, FieldNode) or root_type is None:
+                return operation, None
+            field = root_type.fields.get(selection.name.value)
+            if field is None:
+                return operation, None
+            try:
+                arguments = get_argument_values(field, selection, data.get("variables"))
+            except GraphQLError:
+                return operation, None
+            fields.append((selection.name.value, arguments))
+        return operation, fields
+
+    def plan(self, schema, data, viewer):
+        """Return how to cache this operation, or None if it is not cacheable."""
+        operation, fields = self._root_fields(schema, data)
+        if operation is None or fields is None or operation.operation.value != "query":
+            return None
+
+        config = settings.GRAPHQL_RESPONSE_CACHE_FIELDS
+        if not fields or any(name not in config for name, _ in fields):
+            return None
+
+        ttl = min(config[name]["ttl"] for name, _ in fields)
+        tags = {
+            format_tag(tag, viewer, arguments)
+            for name, arguments in fields
+            for tag in config[name].get("tags", ())
+        }
+        if None in tags:
+            return None
+        tags = sorted(tags)
+        shared = all(config[name].get("shared") for name, _ in fields)
+        key = json.dumps({
+            "query": hashlib.sha256(data["query"].encode("utf-8")).hexdigest(),
+            "operationName": data.get("operationName"),
+            "variables": data.get("variables") or {},
+            "viewer": None if shared else viewer,
+        }, sort_keys=True, default=str)
+        return CachePlan(hashlib.sha256(key.encode("utf-8")).hexdigest(), ttl, tags)
+
+    async def _versioned_key(self, plan):
+        tag_keys = [f"graphql:tag:{tag}" for tag in plan.tags]
+        versions = await self.cache.aget_many(tag_keys) if tag_keys else {}
+        for tag_key in tag_keys:
+            if tag_key not in versions:
+                # Start from the clock so a tag evicted from the cache never
+                # falls back to a version that was used before.
+                await self.cache.aadd(tag_key, time.time_ns(), timeout=None)
+                versions[tag_key] = await self.cache.aget(tag_key)
+        suffix = ":".join(str(versions[tag_key]) for tag_key in tag_keys)
+        return f"graphql:response:{plan.key}:{suffix}"
+
+    async def get(self, plan):
+        plan.versioned_key = await self._versioned_key(plan)
+        result = await self.cache.aget(plan.versioned_key)
+        GRAPHQL_RESPONSE_CACHE.labels("hit" if result is not None else "miss").inc()
+        return result
+
+    async def set(self, plan, result):
+        await self.cache.aset(plan.versioned_key, result, timeout=plan.ttl)
+
+    async def invalidate(self, schema, data, viewer):
+        """Invalidate the tags of the mutations in GRAPHQL_RESPONSE_CACHE_INVALIDATION that this operation ran."""
+        operation, fields = self._root_fields(schema, data)
+        if operation is None or fields is None or operation.operation.value != "mutation":
+            return
+
+        config = settings.GRAPHQL_RESPONSE_CACHE_INVALIDATION
+        for name, arguments in fields:
+            for tag in config.get(name, ()):
+                formatted = format_tag(tag, viewer, arguments)
+                if formatted is None:
+                    logger.warning(f"Cache tag '{tag}' of {name} uses an argument it was not given")
+                    continue
+                tag_key = f"graphql:tag:{formatted}"
+                try:
+                    await self.cache.aincr(tag_key)
+                except ValueError:
+                    # Never read, nothing cached under it yet.
+                    pass
+                GRAPHQL_RESPONSE_CACHE_INVALIDATIONS.labels(tag.split(":")[0]).inc()
+
+
+response_cache = ResponseCache()
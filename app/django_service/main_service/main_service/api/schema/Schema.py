@@ -56,6 +56,23 @@ type_defs = """
         blocked: Boolean!
     }
 
+    type Friend {
+        userId: Int!
+        friendship: Friendship
+        profile: Profile
+    }
+
+    type FriendSuggestion {
+        userId: Int!
+        mutualFriends: Int!
+        profile: Profile
+    }
+
+    type FriendNetwork {
+        friends: [Friend!]!
+        suggestions: [FriendSuggestion!]!
+    }
+
     type Notification {
         id: Int!
         userId: Int!
@@ -83,11 +100,21 @@ type_defs = """
         totalCount: Int!
     }
 
+    type ProfilePage {
+        profiles: [Profile!]!
+        nextAfter: Int
+        totalCount: Int!
+    }
+
     type Query {
         user: User
         profile(userId: Int!): Profile
         getAllProfiles(limit: Int!, offset: Int!): GetAllProfilesResponse
+        profiles(after: Int, limit: Int): ProfilePage!
+        searchProfiles(prefix: String, query: String, limit: Int): [Profile!]!
         chat_rooms_for_user(user_id: Int!): [ChatRoom!]
+        chat_room_messages_before(chat_room_id: Int!, before_id: Int, limit: Int): [ChatRoomMessage!]!
+        chatUnreadCounts: [ChatRoomUnread!]!
         stat(id: Int!): Stat
         statsByUser(userId: Int!): [UserStat!]!
         calculateUserStats(userId: Int!): CalculateStatsResponse!
@@ -100,6 +127,8 @@ type_defs = """
                 tournament_users(tournament_id: Int!): [TournamentUser]
         tournament_games(tournament_id: Int!): [TournamentGame]
         friendships: [Friendship!]
+        friendNetwork(suggestions: Int): FriendNetwork!
+        mutualFriends(userId: Int!): [Friend!]!
             StatList: [StatsWithProfile!]!
 
     }
@@ -111,7 +140,9 @@ type_defs = """
     type Subscription {
         ping_test: Ping!
         chatRoomsForUser: ChatRoom!
-        chat_room_message(chat_room_id: Int!): ChatRoomMessage!
+        chatRoomChanges: ChatRoomChange!
+        chat_room_message(chat_room_id: Int!, after_id: Int, backlog: Int): ChatRoomMessage!
+        chatInbox(after_id: Int): ChatRoomMessage!
         notificationsForUser: Notification!
         onlineStatus(user_id: Int!): onlineStatus
     }
@@ -152,6 +183,8 @@ type_defs = """
         user_id: Int!
         chat_room_id: Int!
         joined_at: DateTime!
+        user: User
+        profile: Profile
     }
 
     type ChatRoom {
@@ -163,6 +196,19 @@ type_defs = """
         messages: [ChatRoomMessage!]
     }
 
+    type ChatRoomUnread {
+        chat_room_id: Int!
+        last_read_id: Int!
+        unread_count: Int!
+    }
+
+    type ChatRoomChange {
+        kind: String!
+        chat_room_id: Int!
+        room_deleted: Boolean!
+        chat_room: ChatRoom
+    }
+
    input FriendshipCreateInput {
        friendId: Int!
    }
@@ -278,6 +324,7 @@ type_defs = """
         add_user_to_chat_room(chat_room_id: Int!, user_id: Int!): ChatRoomUser
         startChatWithUser(user_id: Int!, game_id: Int): ChatRoom
         create_chat_room_message(chat_room_id: Int!, content: String!): ChatRoomMessage
+        markChatRoomRead(chat_room_id: Int!, last_read_id: Int): ChatRoomUnread!
     }
 
     type ProfileMutationResponse {
@@ -6,6 +6,7 @@ from main_service.protos.user_pb2_grpc import UserServiceStub
 from main_service.protos.user_pb2 import CreateUserRequest
 from main_service.protos.profile_pb2_grpc import ProfileServiceStub
 from main_service.protos.profile_pb2 import CreateProfileRequest
+from main_service.api.grpc_pool import get_stub
 
 type_defs = """
     type Mutation {
@@ -26,40 +27,33 @@ type_defs = """
     }
 """
 
-GRPC_HOST = "auth_service"
-GRPC_PORT = "50051"
-GRPC_TARGET = f"{GRPC_HOST}:{GRPC_PORT}"
-
 mutation = MutationType()
 
 @mutation.field("exchangeCodeForToken")
 def resolve_exchange_code_for_token(_, info, input):
     try:
-        with grpc.insecure_channel(GRPC_TARGET) as channel:
-            stub = AuthServiceStub(channel)
-            request = ExchangeCodeRequest(code=input["code"], state=input["state"])
-            response = stub.ExchangeCodeForToken(request)
+        stub = get_stub("auth_service", AuthServiceStub)
+        request = ExchangeCodeRequest(code=input["code"], state=input["state"])
+        response = stub.ExchangeCodeForToken(request)
 
-            # Create user
-            with grpc.insecure_channel("user_service:50051") as channel:
-                stub = UserServiceStub(channel)
-                grpc_request = CreateUserRequest(
-                    id=response.user_id, name=response.full_name, mail=response.mail
-                )
-                stub.CreateUser(grpc_request)
+        # Create user
+        stub = get_stub("user_service", UserServiceStub)
+        grpc_request = CreateUserRequest(
+            id=response.user_id, name=response.full_name, mail=response.mail
+        )
+        stub.CreateUser(grpc_request)
 
-            try:
-                # Create user profile
-                with grpc.insecure_channel("user_service:50051") as channel:
-                    stub = ProfileServiceStub(channel)
-                    grpc_request = CreateProfileRequest(
-                        user_id=response.user_id,
-                        avatar_url=response.avatar_url,
-                        nickname=response.name
-                    )
-                    stub.CreateProfile(grpc_request, timeout=5)
-            except Exception as e:
-                pass
+        try:
+            # Create user profile
+            stub = get_stub("user_service", ProfileServiceStub)
+            grpc_request = CreateProfileRequest(
+                user_id=response.user_id,
+                avatar_url=response.avatar_url,
+                nickname=response.name
+            )
+            stub.CreateProfile(grpc_request, timeout=5)
+        except Exception as e:
+            pass
 
         return {"jwtToken": response.jwt_token}
     except grpc.RpcError as e:
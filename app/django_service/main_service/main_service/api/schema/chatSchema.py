@@ -4,15 +4,45 @@ from datetime import datetime
 
 import grpc
 from ariadne import ObjectType
+from django.conf import settings
 from ariadne.asgi import GraphQL
 
 from main_service.protos import chat_pb2, chat_pb2_grpc
 from main_service.api.schema.objectTypes import query, mutation, subscription
+from main_service.api.grpc_pool import get_aio_stub
+from main_service.api.loaders import get_loaders
+from main_service.api.subscriptions.groups import chat_room_group, listen, merge, publish
+from main_service.api.subscriptions.hub import FanOutHub
 
-# Set up the gRPC target for Chat Service
-GRPC_CHAT_HOST = "chat_service"
-GRPC_CHAT_PORT = "50051"
-GRPC_CHAT_TARGET = f"{GRPC_CHAT_HOST}:{GRPC_CHAT_PORT}"
+def chat_room_to_dict(chat_room):
+    participants = [
+        {
+            "user_id": participant.user_id,
+            "chat_room_id": participant.chat_room,  # Ensure this matches the expected field name
+            "id": participant.id,
+            "joined_at": datetime.fromtimestamp(participant.joined_at.seconds).isoformat() if hasattr(participant.joined_at, 'seconds') else participant.joined_at,
+        }
+        for participant in chat_room.participants
+    ]
+    return {
+        "id": chat_room.id,
+        "name": chat_room.name,
+        "created_at": datetime.fromtimestamp(chat_room.created_at.seconds).isoformat() if hasattr(chat_room.created_at, 'seconds') else chat_room.created_at,
+        "game_id": chat_room.game_id,
+        "users": participants if participants else [],
+    }
+
+chat_room_user = ObjectType("ChatRoomUser")
+
+# Participant lists resolve their users and profiles through the request's
+# loaders, one batch RPC for all participants
+@chat_room_user.field("user")
+async def resolve_chat_room_user_user(participant, info):
+    return await get_loaders(info).user.load(participant["user_id"])
+
+@chat_room_user.field("profile")
+async def resolve_chat_room_user_profile(participant, info):
+    return await get_loaders(info).profile.load(participant["user_id"])
 
 @subscription.source("chatRoomsForUser")
 async def chat_rooms_for_user_source(_, info):
@@ -20,32 +50,49 @@ async def chat_rooms_for_user_source(_, info):
     if user_id is None:
         raise Exception("Authentication required")
     logger.info(f"User {user_id} is subscribing to chat rooms")
-    async with grpc.aio.insecure_channel(GRPC_CHAT_TARGET) as channel:
-        stub = chat_pb2_grpc.ChatRoomControllerStub(channel)
-        grpc_request = chat_pb2.ChatRoomGetChatRoomByUserIdRequest(user_id=user_id)
-        async for chat_room in stub.GetChatRoomByUserId(grpc_request):
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomControllerStub)
+    grpc_request = chat_pb2.ChatRoomGetChatRoomByUserIdRequest(user_id=user_id)
+    # The channel is shared, so the stream has to be cancelled explicitly
+    # once the websocket client goes away.
+    call = stub.GetChatRoomByUserId(grpc_request)
+    try:
+        async for chat_room in call:
             logger.info(f"Chat room {chat_room.id} found for user {user_id}")
-            participants = [
-                {
-                    "user_id": participant.user_id,
-                    "chat_room_id": participant.chat_room,  # Ensure this matches the expected field name
-                    "id": participant.id,
-                    "joined_at": datetime.fromtimestamp(participant.joined_at.seconds).isoformat() if hasattr(participant.joined_at, 'seconds') else participant.joined_at,
-                }
-                for participant in chat_room.participants
-            ]
-            yield {
-                "id": chat_room.id,
-                "name": chat_room.name,
-                "created_at": datetime.fromtimestamp(chat_room.created_at.seconds).isoformat() if hasattr(chat_room.created_at, 'seconds') else chat_room.created_at,
-                "game_id": chat_room.game_id,
-                "users": participants if participants else [],
-            }
+            yield chat_room_to_dict(chat_room)
+    finally:
+        call.cancel()
 
 @subscription.field("chatRoomsForUser")
 def chat_rooms_for_user_resolver(chat_room, info):
     return chat_room
 
+@subscription.source("chatRoomChanges")
+async def chat_room_changes_source(_, info):
+    """
+    The user's rooms as deltas: every current room as ``added``, then
+    rooms joined, updated (renamed, participants changed) and removed (left
+    or deleted). chat_service only does work when a membership changes.
+    """
+    user_id = info.context["request"].scope.get("user_id")
+    if user_id is None:
+        raise Exception("Authentication required")
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomControllerStub)
+    call = stub.SubscribeChatRoomChanges(chat_pb2.ChatRoomSubscribeChatRoomChangesRequest(user_id=user_id))
+    try:
+        async for change in call:
+            yield {
+                "kind": change.kind,
+                "chat_room_id": change.chat_room_id,
+                "room_deleted": change.room_deleted,
+                "chat_room": chat_room_to_dict(change.chat_room) if change.HasField("chat_room") else None,
+            }
+    finally:
+        call.cancel()
+
+@subscription.field("chatRoomChanges")
+def chat_room_changes_resolver(change, info):
+    return change
+
 @subscription.source("ping_test")
 async def ping_test_source(_, info):
     while True:
@@ -56,70 +103,225 @@ async def ping_test_source(_, info):
 def ping_test_resolver(message, info):
     return message
 
+def chat_room_message_to_dict(message):
+    return {
+        "id": message.id,
+        "chat_room_id": message.chat_room,
+        "sender_id": message.sender_id,
+        "content": message.content,
+        "timestamp": datetime.fromtimestamp(message.timestamp.seconds).isoformat() if hasattr(message.timestamp, 'seconds') else message.timestamp,
+    }
+
+def open_chat_room_message_stream(chat_room_id):
+    # Live messages only, every subscriber fetches its own backlog
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomMessageControllerStub)
+    grpc_request = chat_pb2.ChatRoomMessageSubscribeChatRoomMessagesRequest(chat_room_id=chat_room_id, backlog=0)
+    return stub.SubscribeChatRoomMessages(grpc_request)
+
+# One SubscribeChatRoomMessages stream per room, shared by all its viewers
+chat_room_messages = FanOutHub(
+    "chat_room_message", open_chat_room_message_stream, decode=chat_room_message_to_dict, replay_size=0
+)
+
+async def list_chat_room_messages_before(chat_room_id, before_id=0, limit=0):
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomMessageControllerStub)
+    grpc_request = chat_pb2.ChatRoomMessageListMessagesBeforeRequest(
+        chat_room_id=chat_room_id, before_id=before_id, limit=limit
+    )
+    response = await stub.ListMessagesBefore(grpc_request)
+    return [chat_room_message_to_dict(message) for message in response.results]
+
+async def list_chat_room_messages_after(chat_room_id, after_id, limit):
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomMessageControllerStub)
+    grpc_request = chat_pb2.ChatRoomMessageListMessagesAfterRequest(
+        chat_room_id=chat_room_id, after_id=after_id, limit=limit
+    )
+    response = await stub.ListMessagesAfter(grpc_request)
+    return [chat_room_message_to_dict(message) for message in response.results]
+
+async def chat_room_message_backlog(chat_room_id, backlog):
+    """The latest ``backlog`` messages of a room, oldest first, read in pages chat_service accepts."""
+    messages = []
+    before_id = 0
+    while len(messages) < backlog:
+        limit = min(backlog - len(messages), settings.CHAT_MESSAGE_PAGE_SIZE_MAX)
+        page = await list_chat_room_messages_before(chat_room_id, before_id=before_id, limit=limit)
+        messages[:0] = page
+        if len(page) < limit:
+            break
+        before_id = page[0]["id"]
+    return messages
+
+async def chat_room_messages_after(chat_room_id, after_id):
+    """Every message of a room after ``after_id``, oldest first, paged forward until caught up."""
+    page_size = settings.CHAT_MESSAGE_PAGE_SIZE_MAX
+    while True:
+        page = await list_chat_room_messages_after(chat_room_id, after_id, page_size)
+        for message in page:
+            yield message
+        if len(page) < page_size:
+            return
+        after_id = page[-1]["id"]
+
 @subscription.source("chat_room_message")
-async def chat_room_message_source(_, info, chat_room_id):
-    async with grpc.aio.insecure_channel(GRPC_CHAT_TARGET) as channel:
-        stub = chat_pb2_grpc.ChatRoomMessageControllerStub(channel)
-        grpc_request = chat_pb2.ChatRoomMessageSubscribeChatRoomMessagesRequest(chat_room_id=chat_room_id)
-        async for message in stub.SubscribeChatRoomMessages(grpc_request):
-            yield {
-                "id": message.id,
-                "chat_room_id": message.chat_room,
-                "sender_id": message.sender_id,
-                "content": message.content,
-                "timestamp": datetime.fromtimestamp(message.timestamp.seconds).isoformat() if hasattr(message.timestamp, 'seconds') else message.timestamp,
-            }
+async def chat_room_message_source(_, info, chat_room_id, after_id=0, backlog=None):
+    """
+    Messages of a room, then new ones. A fresh subscription starts with the
+    latest ``backlog`` messages; one resuming after a reconnect passes the
+    last id it got as ``after_id`` and is sent every message since, however
+    many it missed. Older history is paged with chat_room_messages_before.
+    """
+    after_id = after_id or 0
+    if backlog is None:
+        backlog = settings.CHAT_MESSAGE_BACKLOG
+    backlog = min(max(backlog, 0), settings.CHAT_MESSAGE_BACKLOG_MAX)
+
+    # History is sent before joining the shared stream: a subscriber falling
+    # more than GRAPHQL_SUBSCRIPTION_QUEUE_SIZE live messages behind while a
+    # long replay goes out to its websocket would be disconnected.
+    last_id = after_id
+    if after_id:
+        async for message in chat_room_messages_after(chat_room_id, after_id):
+            last_id = message["id"]
+            yield message
+    elif backlog > 0:
+        for message in await chat_room_message_backlog(chat_room_id, backlog):
+            last_id = message["id"]
+            yield message
+
+    async with chat_room_messages.subscription(chat_room_id) as live:
+        # The shared stream is established, so this short catch-up with what
+        # was posted during the replay overlaps with it instead of leaving a gap.
+        if after_id or backlog > 0:
+            async for message in chat_room_messages_after(chat_room_id, last_id):
+                last_id = message["id"]
+                yield message
+
+        # Messages posted through any gateway process arrive on the group right
+        # away; the shared upstream stream stays the source of truth and the
+        # message ids are used to skip what was already sent from the other one.
+        published_ahead = set()
+        async for from_group, message in merge(live, listen(chat_room_group(chat_room_id))):
+            message_id = message["id"]
+            if from_group:
+                if message_id <= last_id or message_id in published_ahead:
+                    continue
+                published_ahead.add(message_id)
+            else:
+                if message_id <= last_id:
+                    continue
+                last_id = message_id
+                if published_ahead:
+                    # Ids the stream went past will never be confirmed
+                    sent_ahead = message_id in published_ahead
+                    published_ahead = {i for i in published_ahead if i > last_id}
+                    if sent_ahead:
+                        continue
+            yield message
 
 @subscription.field("chat_room_message")
-def chat_room_message_resolver(message, info, chat_room_id):
+def chat_room_message_resolver(message, info, chat_room_id, after_id=0, backlog=None):
+    return message
+
+@subscription.source("chatInbox")
+async def chat_inbox_source(_, info, after_id=0):
+    """
+    New messages of every room the user is in, over a single upstream
+    stream; rooms joined or left meanwhile are followed by chat_service.
+    Pass the last id received to resume after a reconnect.
+    """
+    user_id = info.context["request"].scope.get("user_id")
+    if user_id is None:
+        raise Exception("Authentication required")
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomMessageControllerStub)
+    grpc_request = chat_pb2.ChatRoomMessageSubscribeUserInboxRequest(user_id=user_id, after_id=after_id or 0)
+    call = stub.SubscribeUserInbox(grpc_request)
+    try:
+        async for message in call:
+            yield chat_room_message_to_dict(message)
+    finally:
+        call.cancel()
+
+@subscription.field("chatInbox")
+def chat_inbox_resolver(message, info, after_id=0):
     return message
 
+@query.field("chat_room_messages_before")
+async def resolve_chat_room_messages_before(_, info, chat_room_id, before_id=0, limit=None):
+    return await list_chat_room_messages_before(chat_room_id, before_id or 0, limit or 0)
+
+def chat_room_unread_to_dict(unread):
+    return {
+        "chat_room_id": unread.chat_room,
+        "last_read_id": unread.last_read_id,
+        "unread_count": unread.unread_count,
+    }
+
+@query.field("chatUnreadCounts")
+async def resolve_chat_unread_counts(_, info):
+    """Unread messages of every room of the current user, for the chat badges."""
+    user_id = info.context["request"].user_id
+    if not user_id:
+        raise Exception("Authentication required: user_id is missing")
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomUserControllerStub)
+    response = await stub.GetUnreadCounts(chat_pb2.ChatRoomUserGetUnreadCountsRequest(user_id=user_id))
+    return [chat_room_unread_to_dict(unread) for unread in response.results]
+
+@mutation.field("markChatRoomRead")
+async def resolve_mark_chat_room_read(_, info, chat_room_id, last_read_id=None):
+    """Marks a room read up to ``last_read_id``, or entirely without it."""
+    user_id = info.context["request"].user_id
+    if not user_id:
+        raise Exception("Authentication required: user_id is missing")
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomUserControllerStub)
+    grpc_request = chat_pb2.ChatRoomUserMarkReadRequest(
+        user_id=user_id, chat_room_id=chat_room_id, last_read_id=last_read_id or 0
+    )
+    return chat_room_unread_to_dict(await stub.MarkRead(grpc_request))
+
 @mutation.field("startChatWithUser")
-def resolve_start_chat_with_user(_, info, user_id, game_id=None):
+async def resolve_start_chat_with_user(_, info, user_id, game_id=None):
     current_user_id = info.context["request"].user_id
     if not current_user_id:
         raise Exception("Authentication required: user_id is missing")
     try:
-        with grpc.insecure_channel(GRPC_CHAT_TARGET) as channel:
-            # Create the chat room
-            stub = chat_pb2_grpc.ChatRoomControllerStub(channel)
-            grpc_request = chat_pb2.ChatRoomRequest(name=f"User-to-User {current_user_id}and{user_id}", game_id=game_id)
-            response = stub.Create(grpc_request)
-
-            # Add the current user to the chat room
-            stub = chat_pb2_grpc.ChatRoomUserControllerStub(channel)
-            grpc_request = chat_pb2.ChatRoomUserRequest(chat_room=response.id, user_id=current_user_id)
-            current_user_response = stub.Create(grpc_request)
-
-            # Add the other user to the chat room
-            grpc_request = chat_pb2.ChatRoomUserRequest(chat_room=response.id, user_id=user_id)
-            other_user_response = stub.Create(grpc_request)
-
-            participants = [
-                {
-                    "user_id": current_user_response.user_id,
-                    "chat_room_id": current_user_response.chat_room,
-                    "id": current_user_response.id,
-                    "joined_at": datetime.fromtimestamp(current_user_response.joined_at.seconds).isoformat() if hasattr(current_user_response.joined_at, 'seconds') else current_user_response.joined_at,
-                },
-                {
-                    "user_id": other_user_response.user_id,
-                    "chat_room_id": other_user_response.chat_room,
-                    "id": other_user_response.id,
-                    "joined_at": datetime.fromtimestamp(other_user_response.joined_at.seconds).isoformat() if hasattr(other_user_response.joined_at, 'seconds') else other_user_response.joined_at,
-                }
-            ]
-
-            logger.info(f"Rpc response: {response}")
-            logger.info(f"Chat room {response.id} created and users {current_user_id} and {user_id} added")
-
-            return {
-                "id": response.id,
-                "name": response.name,
-                "created_at": datetime.fromtimestamp(response.created_at.seconds).isoformat() if hasattr(response.created_at, 'seconds') else response.created_at,
-                "game_id": response.game_id,
-                "users": participants
+        # Create the chat room
+        stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomControllerStub)
+        grpc_request = chat_pb2.ChatRoomRequest(name=f"User-to-User {current_user_id}and{user_id}", game_id=game_id)
+        response = await stub.Create(grpc_request)
+
+        # Add both users to the chat room
+        stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomUserControllerStub)
+        current_user_response, other_user_response = await asyncio.gather(
+            stub.Create(chat_pb2.ChatRoomUserRequest(chat_room=response.id, user_id=current_user_id)),
+            stub.Create(chat_pb2.ChatRoomUserRequest(chat_room=response.id, user_id=user_id)),
+        )
+
+        participants = [
+            {
+                "user_id": current_user_response.user_id,
+                "chat_room_id": current_user_response.chat_room,
+                "id": current_user_response.id,
+                "joined_at": datetime.fromtimestamp(current_user_response.joined_at.seconds).isoformat() if hasattr(current_user_response.joined_at, 'seconds') else current_user_response.joined_at,
+            },
+            {
+                "user_id": other_user_response.user_id,
+                "chat_room_id": other_user_response.chat_room,
+                "id": other_user_response.id,
+                "joined_at": datetime.fromtimestamp(other_user_response.joined_at.seconds).isoformat() if hasattr(other_user_response.joined_at, 'seconds') else other_user_response.joined_at,
             }
+        ]
+
+        logger.info(f"Rpc response: {response}")
+        logger.info(f"Chat room {response.id} created and users {current_user_id} and {user_id} added")
+
+        return {
+            "id": response.id,
+            "name": response.name,
+            "created_at": datetime.fromtimestamp(response.created_at.seconds).isoformat() if hasattr(response.created_at, 'seconds') else response.created_at,
+            "game_id": response.game_id,
+            "users": participants
+        }
     except grpc.RpcError as e:
         if e.code() == grpc.StatusCode.ALREADY_EXISTS:
             logger.error(f"Room with this Name already exists: {e}")
@@ -129,33 +331,32 @@ def resolve_start_chat_with_user(_, info, user_id, game_id=None):
             raise e
 
 @mutation.field("create_chat_room")
-def resolve_create_chat_room(_, info, name, game_id=None):
+async def resolve_create_chat_room(_, info, name, game_id=None):
     user_id = info.context["request"].user_id
     if not user_id:
         raise Exception("Authentication required: user_id is missing")
     try:
-        with grpc.insecure_channel(GRPC_CHAT_TARGET) as channel:
-            stub = chat_pb2_grpc.ChatRoomControllerStub(channel)
-            grpc_request = chat_pb2.ChatRoomRequest(name=name, game_id=game_id)
-            response = stub.Create(grpc_request)
-            stub = chat_pb2_grpc.ChatRoomUserControllerStub(channel)
-            grpc_request = chat_pb2.ChatRoomUserRequest(chat_room=response.id, user_id=user_id)
-            user_response = stub.Create(grpc_request)
-            participants = [{
-                "user_id": user_response.user_id,
-                "chat_room_id": user_response.chat_room,
-                "id": user_response.id,
-                "joined_at": datetime.fromtimestamp(user_response.joined_at.seconds).isoformat() if hasattr(user_response.joined_at, 'seconds') else user_response.joined_at,
-            }]
-            logger.info(f"Rpc response: {response}")
-            logger.info(f"Chat room {response.id} created")
-            return {
-                "id": response.id,
-                "name": response.name,
-                "created_at": datetime.fromtimestamp(response.created_at.seconds).isoformat() if hasattr(response.created_at, 'seconds') else response.created_at,
-                "game_id": response.game_id,
-                "users": participants
-            }
+        stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomControllerStub)
+        grpc_request = chat_pb2.ChatRoomRequest(name=name, game_id=game_id)
+        response = await stub.Create(grpc_request)
+        stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomUserControllerStub)
+        grpc_request = chat_pb2.ChatRoomUserRequest(chat_room=response.id, user_id=user_id)
+        user_response = await stub.Create(grpc_request)
+        participants = [{
+            "user_id": user_response.user_id,
+            "chat_room_id": user_response.chat_room,
+            "id": user_response.id,
+            "joined_at": datetime.fromtimestamp(user_response.joined_at.seconds).isoformat() if hasattr(user_response.joined_at, 'seconds') else user_response.joined_at,
+        }]
+        logger.info(f"Rpc response: {response}")
+        logger.info(f"Chat room {response.id} created")
+        return {
+            "id": response.id,
+            "name": response.name,
+            "created_at": datetime.fromtimestamp(response.created_at.seconds).isoformat() if hasattr(response.created_at, 'seconds') else response.created_at,
+            "game_id": response.game_id,
+            "users": participants
+        }
     except grpc.RpcError as e:
         if e.code() == grpc.StatusCode.ALREADY_EXISTS:
             logger.error(f"Room with this Name already exists: {e}")
@@ -165,52 +366,45 @@ def resolve_create_chat_room(_, info, name, game_id=None):
             raise e
 
 @mutation.field("add_user_to_chat_room")
-def resolve_add_user_to_chat_room(_, info, chat_room_id, user_id):
-    with grpc.insecure_channel(GRPC_CHAT_TARGET) as channel:
-        stub = chat_pb2_grpc.ChatRoomUserControllerStub(channel)
-        grpc_request = chat_pb2.ChatRoomUserRequest(chat_room=chat_room_id, user_id=user_id)
-        response = stub.Create(grpc_request)
-        return {
-            "id": response.id,
-            "user_id": response.user_id,
-            "chat_room_id": response.chat_room,
-            "joined_at": datetime.fromtimestamp(response.joined_at.seconds).isoformat() if hasattr(response.joined_at, 'seconds') else response.joined_at,
-        }
+async def resolve_add_user_to_chat_room(_, info, chat_room_id, user_id):
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomUserControllerStub)
+    grpc_request = chat_pb2.ChatRoomUserRequest(chat_room=chat_room_id, user_id=user_id)
+    response = await stub.Create(grpc_request)
+    return {
+        "id": response.id,
+        "user_id": response.user_id,
+        "chat_room_id": response.chat_room,
+        "joined_at": datetime.fromtimestamp(response.joined_at.seconds).isoformat() if hasattr(response.joined_at, 'seconds') else response.joined_at,
+    }
 
 @mutation.field("remove_user_from_chat_room")
-def resolve_remove_user_from_chat_room(_, info, chat_room_id):
+async def resolve_remove_user_from_chat_room(_, info, chat_room_id):
     """
     Removes a user from a chat room via gRPC call.
     """
     user_id = info.context["request"].user_id
-    with grpc.insecure_channel(GRPC_CHAT_TARGET) as channel:
-        stub = chat_pb2_grpc.ChatRoomUserControllerStub(channel)
-        grpc_request = chat_pb2.ChatRoomUserRequest(id=chat_room_id)
-        response = stub.Destroy(grpc_request)  # Use the Delete method for removal
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomUserControllerStub)
+    grpc_request = chat_pb2.ChatRoomUserRequest(id=chat_room_id)
+    response = await stub.Destroy(grpc_request)  # Use the Delete method for removal
 
-        return {
-            "id": response.id,
-            "user_id": response.user_id,
-            "chat_room_id": response.chat_room,
-            "removed_at": datetime.fromtimestamp(response.updated_at.seconds).isoformat() if hasattr(
-                response.updated_at, 'seconds') else response.updated_at,
-        }
+    return {
+        "id": response.id,
+        "user_id": response.user_id,
+        "chat_room_id": response.chat_room,
+        "removed_at": datetime.fromtimestamp(response.updated_at.seconds).isoformat() if hasattr(
+            response.updated_at, 'seconds') else response.updated_at,
+    }
 
 @mutation.field("create_chat_room_message")
-def resolve_create_chat_room_message(_, info, chat_room_id, content):
+async def resolve_create_chat_room_message(_, info, chat_room_id, content):
     sender_id = info.context["request"].user_id
-    with grpc.insecure_channel(GRPC_CHAT_TARGET) as channel:
-        stub = chat_pb2_grpc.ChatRoomMessageControllerStub(channel)
-        grpc_request = chat_pb2.ChatRoomMessageRequest(chat_room=chat_room_id, content=content, sender_id=sender_id)
-        response = stub.Create(grpc_request)
-        return {
-            "id": response.id,
-            "content": response.content,
-            "sender_id": response.sender_id,
-            "timestamp": datetime.fromtimestamp(response.timestamp.seconds).isoformat() if hasattr(response.timestamp, 'seconds') else response.timestamp,
-            "chat_room_id": response.chat_room
-        }
+    stub = get_aio_stub("chat_service", chat_pb2_grpc.ChatRoomMessageControllerStub)
+    grpc_request = chat_pb2.ChatRoomMessageRequest(chat_room=chat_room_id, content=content, sender_id=sender_id)
+    response = await stub.Create(grpc_request)
+    message = chat_room_message_to_dict(response)
+    await publish(chat_room_group(response.chat_room), message)
+    return message
 
 # Add the mutation to the resolver list
-resolver = [query, mutation, subscription]
+resolver = [query, mutation, subscription, chat_room_user]
 
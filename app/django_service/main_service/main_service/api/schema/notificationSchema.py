@@ -7,7 +7,6 @@ import grpc
 from google.protobuf.timestamp_pb2 import Timestamp
 
 from ariadne import ObjectType, SubscriptionType
-from channels.layers import get_channel_layer
 from main_service.api.schema.objectTypes import query, mutation, subscription
 
 from main_service.api.schema.userSchema import resolver as user_resolver
@@ -15,10 +14,8 @@ import main_service.protos.notification_pb2 as notification_pb2
 import main_service.protos.notification_pb2_grpc as notification_pb2_grpc
 import main_service.protos.user_pb2 as user_pb2
 import main_service.protos.user_pb2_grpc as user_pb2_grpc
-
-GRPC_HOST = "user_service"
-GRPC_PORT = "50051"
-GRPC_TARGET = f"{GRPC_HOST}:{GRPC_PORT}"
+from main_service.api.grpc_pool import get_aio_stub
+from main_service.api.subscriptions.groups import listen, merge, notifications_group, online_status_group, publish
 
 logger = logging.getLogger(__name__)
 
@@ -30,41 +27,59 @@ async def notifications_for_user_source(_, info):
 
     async def fetch_notifications():
         last_sent_at = None
-        async with grpc.aio.insecure_channel(GRPC_TARGET) as channel:
-            notification_stub = notification_pb2_grpc.NotificationServiceStub(channel)
-            user_stub = user_pb2_grpc.UserServiceStub(channel)
-            grpc_request = notification_pb2.GetNotificationsByUserIdRequest(user_id=user_id)
-            while True:
-                # Fetch notifications
-                response = await notification_stub.GetNotificationsByUserId(grpc_request)
-                new_notifications = []
-                for notification in response.notifications:
-                    sent_at = notification.sent_at.ToDatetime()
-                    if last_sent_at is None or sent_at > last_sent_at:
-                        new_notifications.append({
-                            "id": notification.id,
-                            "userId": notification.user_id,
-                            "message": notification.message,
-                            "read": notification.read,
-                            "sentAt": sent_at.isoformat(),
-                        })
-                if new_notifications:
-                    last_sent_at = max(datetime.fromisoformat(notification["sentAt"]) for notification in new_notifications)
-                    for notification in new_notifications:
-                        yield notification
-
-                # Update lastLogin
-                last_login_timestamp = Timestamp()
-                last_login_timestamp.FromDatetime(datetime.utcnow())
-                update_request = user_pb2.UpdateUserLastLoginRequest(
-                    id=user_id,
-                    last_login=last_login_timestamp
-                )
-                await user_stub.UpdateUserLastLogin(update_request)
-
-                await asyncio.sleep(10)  # Poll every 10 seconds
-
-    return fetch_notifications()
+        notification_stub = get_aio_stub("user_service", notification_pb2_grpc.NotificationServiceStub)
+        user_stub = get_aio_stub("user_service", user_pb2_grpc.UserServiceStub)
+        grpc_request = notification_pb2.GetNotificationsByUserIdRequest(user_id=user_id)
+        announced = False
+        while True:
+            # Fetch notifications
+            response = await notification_stub.GetNotificationsByUserId(grpc_request)
+            new_notifications = []
+            for notification in response.notifications:
+                sent_at = notification.sent_at.ToDatetime()
+                if last_sent_at is None or sent_at > last_sent_at:
+                    new_notifications.append({
+                        "id": notification.id,
+                        "userId": notification.user_id,
+                        "message": notification.message,
+                        "read": notification.read,
+                        "sentAt": sent_at.isoformat(),
+                    })
+            if new_notifications:
+                last_sent_at = max(datetime.fromisoformat(notification["sentAt"]) for notification in new_notifications)
+                for notification in new_notifications:
+                    yield notification
+
+            # Update lastLogin
+            last_login_timestamp = Timestamp()
+            last_login_timestamp.FromDatetime(datetime.utcnow())
+            update_request = user_pb2.UpdateUserLastLoginRequest(
+                id=user_id,
+                last_login=last_login_timestamp
+            )
+            await user_stub.UpdateUserLastLogin(update_request)
+            if not announced:
+                await publish(online_status_group(user_id), {"userId": user_id, "status": True})
+                announced = True
+
+            await asyncio.sleep(10)  # Poll every 10 seconds
+
+    async def notifications():
+        # Notifications created through any gateway process are pushed on
+        # the group; the poll above catches the rest and keeps lastLogin
+        # fresh. Pushed ids are skipped when the poll gets to them.
+        pushed = set()
+        async for from_group, notification in merge(fetch_notifications(), listen(notifications_group(user_id))):
+            if from_group:
+                if notification["id"] in pushed:
+                    continue
+                pushed.add(notification["id"])
+            elif notification["id"] in pushed:
+                pushed.discard(notification["id"])
+                continue
+            yield notification
+
+    return notifications()
 
 @subscription.field("notificationsForUser")
 async def resolve_notifications_for_user(notification, info):
@@ -73,8 +88,8 @@ async def resolve_notifications_for_user(notification, info):
 
 @subscription.source("onlineStatus")
 async def online_status_source(_, info, user_id):
-    async with grpc.aio.insecure_channel(GRPC_TARGET) as channel:
-        user_stub = user_pb2_grpc.UserServiceStub(channel)
+    async def poll_status():
+        user_stub = get_aio_stub("user_service", user_pb2_grpc.UserServiceStub)
         grpc_request = user_pb2.GetUserRequest(id=user_id)
         while True:
             response = await user_stub.GetUser(grpc_request)
@@ -85,6 +100,12 @@ async def online_status_source(_, info, user_id):
             yield {"userId": user_id, "status": is_online}
             await asyncio.sleep(11)  # Check every 10 seconds
 
+    # Users coming online are announced on the group by their
+    # notificationsForUser subscription; going offline is only noticed by
+    # the poll, once lastLogin is older than a minute.
+    async for _, status in merge(poll_status(), listen(online_status_group(user_id))):
+        yield status
+
 @subscription.field("onlineStatus")
 async def resolve_online_status(status, info, user_id):
     return status
@@ -1,3 +1,4 @@
+import asyncio
 from asyncio.log import logger
 import logging
 from math import log
@@ -11,13 +12,13 @@ from datetime import datetime
 from main_service.protos.user_pb2_grpc import UserServiceStub
 from main_service.protos.user_pb2 import GetUserRequest, CreateUserRequest
 from main_service.protos.friendship_pb2_grpc import FriendshipServiceStub
-from main_service.protos.friendship_pb2 import GetFriendshipsByUserIdRequest, CreateFriendshipRequest, UpdateFriendshipRequest, DeleteFriendshipRequest
+from main_service.protos.friendship_pb2 import GetFriendshipsByUserIdRequest, GetFriendNetworkRequest, GetMutualFriendsRequest, CreateFriendshipRequest, UpdateFriendshipRequest, DeleteFriendshipRequest
 from main_service.protos.notification_pb2_grpc import NotificationServiceStub
 from main_service.protos.notification_pb2 import GetNotificationsByUserIdRequest, CreateNotificationRequest, DeleteNotificationRequest, UpdateNotificationRequest
 from main_service.protos.permission_pb2_grpc import PermissionServiceStub
 from main_service.protos.permission_pb2 import GetPermissionByIdRequest
 from main_service.protos.profile_pb2_grpc import ProfileServiceStub
-from main_service.protos.profile_pb2 import GetProfileByUserIdRequest, CreateProfileRequest, UpdateProfileRequest, GetAllProfilesRequest
+from main_service.protos.profile_pb2 import GetProfileByUserIdRequest, CreateProfileRequest, UpdateProfileRequest, GetAllProfilesRequest, ListProfilesRequest, SearchProfilesRequest
 from main_service.protos.role_pb2_grpc import RoleServiceStub
 from main_service.protos.role_pb2 import GetRoleByIdRequest
 from main_service.protos.rolePermission_pb2_grpc import RolePermissionServiceStub
@@ -27,10 +28,9 @@ from main_service.protos.settings_pb2 import GetSettingsByUserIdRequest, CreateS
 from main_service.protos.userAchievement_pb2_grpc import UserAchievementServiceStub
 from main_service.protos.userAchievement_pb2 import GetUserAchievementsByUserIdRequest, CreateUserAchievementRequest, UpdateUserAchievementRequest
 from main_service.api.schema.objectTypes import query, mutation, subscription
-
-GRPC_HOST = "user_service"
-GRPC_PORT = "50051"
-GRPC_TARGET = f"{GRPC_HOST}:{GRPC_PORT}"
+from main_service.api.grpc_pool import get_aio_stub
+from main_service.api.subscriptions.groups import publish_notification
+from main_service.api.loaders import get_loaders, profile_to_dict, user_to_dict
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -39,28 +39,17 @@ logger = logging.getLogger(__name__)
 #mutation = MutationType()
 
 @query.field("user")
-def resolve_user(_, info):
+async def resolve_user(_, info):
     logger.info("Fetching user")
     try:
         user_id = info.context["request"].user_id
         if not user_id:
             raise Exception("Authentication required: user_id is missing")
 
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        client = UserServiceStub(channel)
+        client = get_aio_stub("user_service", UserServiceStub)
         request = GetUserRequest(id=user_id)
-        response = client.GetUser(request)
-        return {
-            "id": response.id,
-            "name": response.name,
-            "mail": response.mail,
-            "blocked": response.blocked,
-            "createdAt": datetime.fromtimestamp(response.created_at.seconds) if response.HasField("created_at") else None,
-            "updatedAt": datetime.fromtimestamp(response.updated_at.seconds) if response.HasField("updated_at") else None,
-            "roleId": response.role_id,
-            "lastLogin": datetime.fromtimestamp(response.last_login.seconds) if response.HasField("last_login") else None,
-            "lastLoginIp": response.last_login_ip
-        }
+        response = await client.GetUser(request)
+        return user_to_dict(response)
     except grpc.RpcError as e:
         if e.code() == grpc.StatusCode.NOT_FOUND:
             return None
@@ -70,71 +59,28 @@ def resolve_user(_, info):
 user = ObjectType("User")
 
 @user.field("profile")
-def resolve_user_profile(obj, *_):
+async def resolve_user_profile(obj, info):
     logger.info(f"Fetching profile for user {obj['id']}")
-    user_id = obj['id']
-    try:
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        client = ProfileServiceStub(channel)
-        request = GetProfileByUserIdRequest(user_id=user_id)
-        response = client.GetProfileByUserId(request)
-        return {
-            "id": response.id,
-            "userId": response.user_id,
-            "avatarUrl": response.avatar_url,
-            "nickname": response.nickname,
-            "bio": response.bio,
-            "additionalInfo": response.additional_info,
-        }
-    except grpc.RpcError as e:
-        if e.code() == grpc.StatusCode.NOT_FOUND:
-            logger.error(f"Profile not found for user {user_id}")
-            return None
-        else:
-            raise e
+    profile = await get_loaders(info).profile.load(obj['id'])
+    if profile is None:
+        logger.error(f"Profile not found for user {obj['id']}")
+    return profile
 
 @user.field("notifications")
-def resolve_notifications_for_user(obj, *_):
-    user_id = obj['id']
-    try:
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        client = NotificationServiceStub(channel)
-        request = GetNotificationsByUserIdRequest(user_id=user_id)
-        response = client.GetNotificationsByUserId(request)
-
-        return [
-            {
-                    "id": notification.id,
-                "userId": notification.user_id,
-                "message": notification.message,
-                "read": notification.read,
-                "sentAt": datetime.fromtimestamp(notification.sent_at.seconds) if notification.HasField(
-                    "sent_at") else None,
-            }
-            for notification in response.notifications
-        ]
-    except grpc.RpcError as e:
-        if e.code() == grpc.StatusCode.NOT_FOUND:
-            logger.error(f"No notifications found for user {user_id}")
-            return []
-        else:
-            raise e
-    except Exception as e:
-        logger.error(f"Unexpected error fetching notifications for user {user_id}: {e}")
-        raise e
+async def resolve_notifications_for_user(obj, info):
+    return await get_loaders(info).notifications.load(obj['id'])
 
 @query.field("profile")
-def resolve_profile(_, info, userId):
+async def resolve_profile(_, info, userId):
     logger.info(f"Fetching profile for user ID {userId}")
     try:
         userId = int(userId)
         if not userId:
             raise Exception("Authentication required: user_id is missing")
 
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        client = ProfileServiceStub(channel)
+        client = get_aio_stub("user_service", ProfileServiceStub)
         request = GetProfileByUserIdRequest(user_id=userId)
-        response = client.GetProfileByUserId(request)
+        response = await client.GetProfileByUserId(request)
         return {
             "id": response.id,
             "userId": response.user_id,
@@ -150,38 +96,109 @@ def resolve_profile(_, info, userId):
             raise e
 
 @query.field("getAllProfiles")
-def resolve_get_all_profiles(_, info, limit, offset):
+async def resolve_get_all_profiles(_, info, limit, offset):
     del info
     try:
-        with grpc.insecure_channel(GRPC_TARGET) as channel:
-            stub = ProfileServiceStub(channel)
-            grpc_request = GetAllProfilesRequest(limit=limit, offset=offset)
-            grpc_response = stub.GetAllProfiles(grpc_request)
-
-            profiles = [
-                {
-                    "id": profile.id,
-                    "userId": profile.user_id,
-                    "avatarUrl": profile.avatar_url,
-                    "nickname": profile.nickname,
-                    "bio": profile.bio,
-                    "additionalInfo": profile.additional_info,
-                }
-                for profile in grpc_response.profiles
-            ]
-
-            return {
-                "profiles": profiles,
-                "totalCount": grpc_response.total_count,
+        stub = get_aio_stub("user_service", ProfileServiceStub)
+        grpc_request = GetAllProfilesRequest(limit=limit, offset=offset)
+        grpc_response = await stub.GetAllProfiles(grpc_request)
+
+        profiles = [
+            {
+                "id": profile.id,
+                "userId": profile.user_id,
+                "avatarUrl": profile.avatar_url,
+                "nickname": profile.nickname,
+                "bio": profile.bio,
+                "additionalInfo": profile.additional_info,
             }
+            for profile in grpc_response.profiles
+        ]
+
+        return {
+            "profiles": profiles,
+            "totalCount": grpc_response.total_count,
+        }
 
     except grpc.RpcError as e:
         raise Exception(f"gRPC error: {e.details()} (Code: {e.code()})")
     except Exception as ex:
         raise Exception(f"Error occurred while fetching profiles: {str(ex)}")
 
+@query.field("profiles")
+async def resolve_profiles(_, info, after=None, limit=None):
+    """A page of profiles by id; pass the page's nextAfter as ``after`` to get the next one."""
+    del info
+    stub = get_aio_stub("user_service", ProfileServiceStub)
+    response = await stub.ListProfiles(ListProfilesRequest(after_id=after or 0, limit=limit or 0))
+    return {
+        "profiles": [profile_to_dict(profile) for profile in response.profiles],
+        "nextAfter": response.next_after_id or None,
+        "totalCount": response.total_count,
+    }
+
+@query.field("searchProfiles")
+async def resolve_search_profiles(_, info, prefix=None, query=None, limit=None):
+    """Profiles by nickname, case-insensitive: starting with ``prefix`` (autocomplete) or containing ``query``."""
+    del info
+    stub = get_aio_stub("user_service", ProfileServiceStub)
+    response = await stub.SearchProfiles(SearchProfilesRequest(prefix=prefix or "", query=query or "", limit=limit or 0))
+    return [profile_to_dict(profile) for profile in response.profiles]
+
+def friendship_to_dict(friendship):
+    return {
+        "id": friendship.id,
+        "userId": friendship.user_id,
+        "friendId": friendship.friend_id,
+        "establishedAt": datetime.fromtimestamp(friendship.established_at.seconds) if friendship.HasField(
+        "established_at") else None,
+        "accepted": friendship.accepted,
+        "blocked": friendship.blocked,
+    }
+
+@query.field("friendNetwork")
+async def resolve_friend_network(_, info, suggestions=None):
+    """Friends (both directions) and friend suggestions of the current user, in one RPC."""
+    user_id = info.context["request"].user_id
+    if not user_id:
+        raise Exception("Authentication required: user_id is missing")
+    client = get_aio_stub("user_service", FriendshipServiceStub)
+    response = await client.GetFriendNetwork(
+        GetFriendNetworkRequest(user_id=user_id, suggestion_limit=suggestions or 0)
+    )
+    return {
+        "friends": [
+            {
+                "userId": friendship.friend_id if friendship.user_id == user_id else friendship.user_id,
+                "friendship": friendship_to_dict(friendship),
+            }
+            for friendship in response.friendships
+        ],
+        "suggestions": [
+            {"userId": suggestion.user_id, "mutualFriends": suggestion.mutual_friends}
+            for suggestion in response.suggestions
+        ],
+    }
+
+@query.field("mutualFriends")
+async def resolve_mutual_friends(_, info, userId):
+    user_id = info.context["request"].user_id
+    if not user_id:
+        raise Exception("Authentication required: user_id is missing")
+    client = get_aio_stub("user_service", FriendshipServiceStub)
+    response = await client.GetMutualFriends(GetMutualFriendsRequest(user_id=user_id, other_user_id=userId))
+    return [{"userId": friend_id} for friend_id in response.user_ids]
+
+friend = ObjectType("Friend")
+friend_suggestion = ObjectType("FriendSuggestion")
+
+@friend.field("profile")
+@friend_suggestion.field("profile")
+async def resolve_friend_profile(obj, info):
+    return await get_loaders(info).profile.load(obj["userId"])
+
 @query.field("friendships")
-def resolve_friendships(_, info):
+async def resolve_friendships(_, info):
     # Extract `user_id` from the request context (set via middleware)
     user_id = info.context["request"].user_id
     if not user_id:
@@ -189,27 +206,14 @@ def resolve_friendships(_, info):
 
     logger.info(f"Fetching friendships for user with ID: {user_id}")
     try:
-        # Set up gRPC connection with the Friendship service
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        client = FriendshipServiceStub(channel)
+        client = get_aio_stub("user_service", FriendshipServiceStub)
 
         # Make a GetFriendshipsByUserIdRequest via gRPC
         request = GetFriendshipsByUserIdRequest(user_id=user_id)
-        response = client.GetFriendshipsByUserId(request)
+        response = await client.GetFriendshipsByUserId(request)
 
         # Map the gRPC response to the expected GraphQL response format
-        friendships = [
-            {
-                "id": friendship.id,
-                "userId": friendship.user_id,
-                "friendId": friendship.friend_id,
-                "establishedAt": datetime.fromtimestamp(friendship.established_at.seconds) if friendship.HasField(
-                "established_at") else None,
-                "accepted": friendship.accepted,
-                "blocked": friendship.blocked,
-            }
-            for friendship in response.friendships
-        ]
+        friendships = [friendship_to_dict(friendship) for friendship in response.friendships]
 
         return friendships  # Return the friendships list
 
@@ -222,45 +226,41 @@ def resolve_friendships(_, info):
 
 
 @mutation.field("createUser")
-def resolve_create_user(_, info, input):
-    service_endpoint = GRPC_TARGET
-
+async def resolve_create_user(_, info, input):
     try:
-        with grpc.insecure_channel(service_endpoint) as channel:
-            stub = UserServiceStub(channel)
-            grpc_request = CreateUserRequest(
-                id=input.get("id"),
-                name=input["name"],
-                mail=input["mail"],
-                blocked=input.get("blocked"),
-                role_id=input.get("roleId"),
-                last_login_ip=input.get("lastLoginIp", "")
-            )
-            grpc_response = stub.CreateUser(grpc_request)
-            return {
-                "id": grpc_response.id,
-                "name": grpc_response.name,
-                "mail": grpc_response.mail,
-                "blocked": grpc_response.blocked,
-                "roleId": grpc_response.role_id,
-                "lastLoginIp": grpc_response.last_login_ip,
-                "createdAt": datetime.fromtimestamp(grpc_response.created_at.seconds) if grpc_response.HasField("created_at") else None,
-                "updatedAt": datetime.fromtimestamp(grpc_response.updated_at.seconds) if grpc_response.HasField("updated_at") else None,
-            }
+        stub = get_aio_stub("user_service", UserServiceStub)
+        grpc_request = CreateUserRequest(
+            id=input.get("id"),
+            name=input["name"],
+            mail=input["mail"],
+            blocked=input.get("blocked"),
+            role_id=input.get("roleId"),
+            last_login_ip=input.get("lastLoginIp", "")
+        )
+        grpc_response = await stub.CreateUser(grpc_request)
+        return {
+            "id": grpc_response.id,
+            "name": grpc_response.name,
+            "mail": grpc_response.mail,
+            "blocked": grpc_response.blocked,
+            "roleId": grpc_response.role_id,
+            "lastLoginIp": grpc_response.last_login_ip,
+            "createdAt": datetime.fromtimestamp(grpc_response.created_at.seconds) if grpc_response.HasField("created_at") else None,
+            "updatedAt": datetime.fromtimestamp(grpc_response.updated_at.seconds) if grpc_response.HasField("updated_at") else None,
+        }
     except grpc.RpcError as e:
         raise Exception(f"gRPC error: {e.details()} (Code: {e.code()})")
     except Exception as ex:
         raise Exception(f"Error occurred while creating user: {str(ex)}")
 
 @mutation.field("manageProfile")
-def resolve_manage_profile(_, info, bio=None, nickname=None, avatarUrl=None, additionalInfo=None):
+async def resolve_manage_profile(_, info, bio=None, nickname=None, avatarUrl=None, additionalInfo=None):
     user_id = info.context["request"].user_id
     if not user_id:
         raise Exception("Authentication required: user_id is missing")
     logger.info(f"Manage profile data: bio={bio}, nickname={nickname}, avatarUrl={avatarUrl}, additionalInfo={additionalInfo}")
     try:
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        profile_stub = ProfileServiceStub(channel)
+        profile_stub = get_aio_stub("user_service", ProfileServiceStub)
 
         update_request = UpdateProfileRequest(user_id=user_id)
 
@@ -273,7 +273,7 @@ def resolve_manage_profile(_, info, bio=None, nickname=None, avatarUrl=None, add
         if additionalInfo is not None:
             update_request.additional_info = additionalInfo
 
-        profile_stub.UpdateProfile(update_request)
+        await profile_stub.UpdateProfile(update_request)
 
         return {"success": True, "message": "Profile updated successfully."}
 
@@ -283,15 +283,14 @@ def resolve_manage_profile(_, info, bio=None, nickname=None, avatarUrl=None, add
         return {"success": False, "message": f"Unexpected error during profile update: {str(e)}"}
 
 @mutation.field("manageFriendship")
-def resolve_manage_friendship(_, info, friendshipData):
+async def resolve_manage_friendship(_, info, friendshipData):
     user_id = info.context["request"].user_id
     if not user_id:
         raise Exception("Authentication required: user_id is missing")
 
     try:
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        friendship_stub = FriendshipServiceStub(channel)
-        notification_stub = NotificationServiceStub(channel)
+        friendship_stub = get_aio_stub("user_service", FriendshipServiceStub)
+        notification_stub = get_aio_stub("user_service", NotificationServiceStub)
 
         if friendshipData.get("create"):
             create_request = CreateFriendshipRequest(
@@ -299,10 +298,12 @@ def resolve_manage_friendship(_, info, friendshipData):
                 friend_id=friendshipData["create"]["friendId"],
                 blocked=False,
             )
-            response = friendship_stub.CreateFriendship(create_request)
+            response, profile = await asyncio.gather(
+                friendship_stub.CreateFriendship(create_request),
+                get_loaders(info).profile.load(user_id),
+            )
             if not response.id:
                 raise Exception("Failed to create friendship.")
-            profile = resolve_profile(_, info, user_id)
             nickname= profile["nickname"]
             logger.info(f"add notification created by {nickname}")
 
@@ -312,7 +313,8 @@ def resolve_manage_friendship(_, info, friendshipData):
                 read=False,
                 sent_at=datetime.utcnow()
             )
-            notification_stub.CreateNotification(notification_request)
+            notification = await notification_stub.CreateNotification(notification_request)
+            await publish_notification(notification)
 
         if friendshipData.get("block"):
             try:
@@ -321,7 +323,7 @@ def resolve_manage_friendship(_, info, friendshipData):
                     friend_id=friendshipData["block"]["friendId"],
                     blocked=friendshipData["block"]["blocked"],
                 )
-                response = friendship_stub.CreateFriendship(block_request)
+                response = await friendship_stub.CreateFriendship(block_request)
                 if not response.id:
                     raise Exception("Failed to block friendship.")
             except grpc.RpcError as e:
@@ -331,7 +333,7 @@ def resolve_manage_friendship(_, info, friendshipData):
                         accepted=False,
                         blocked=friendshipData["block"]["blocked"],
                     )
-                    reponse = friendship_stub.UpdateFriendship(update_request)
+                    reponse = await friendship_stub.UpdateFriendship(update_request)
                 else:
                     raise e
 
@@ -345,13 +347,13 @@ def resolve_manage_friendship(_, info, friendshipData):
             if friendshipData["update"]["blocked"] is not None:
                 update_request.blocked = friendshipData["update"]["blocked"]
 
-            friendship_stub.UpdateFriendship(update_request)
+            await friendship_stub.UpdateFriendship(update_request)
 
         if friendshipData.get("delete"):
             delete_request = DeleteFriendshipRequest(
                 id=friendshipData["delete"]["id"]
             )
-            delete_response = friendship_stub.DeleteFriendship(delete_request)
+            delete_response = await friendship_stub.DeleteFriendship(delete_request)
             if not delete_response.success:
                 raise Exception("Failed to delete friendship.")
 
@@ -363,14 +365,13 @@ def resolve_manage_friendship(_, info, friendshipData):
         return {"success": False, "message": f"Unexpected error: {str(e)}"}
 
 @mutation.field("manageNotification")
-def resolve_manage_notification(_, info, notificationData):
+async def resolve_manage_notification(_, info, notificationData):
     user_id = info.context["request"].user_id
     if not user_id:
         raise Exception("Authentication required: user_id is missing")
 
     try:
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        notification_stub = NotificationServiceStub(channel)
+        notification_stub = get_aio_stub("user_service", NotificationServiceStub)
 
         if notificationData.get("create"):
             create_request = CreateNotificationRequest(
@@ -379,7 +380,8 @@ def resolve_manage_notification(_, info, notificationData):
                 read=notificationData["create"]["read"],
                 sent_at=datetime.fromisoformat(notificationData["create"]["sentAt"]) if notificationData["create"].get("sentAt") else None,
             )
-            notification_stub.CreateNotification(create_request)
+            notification = await notification_stub.CreateNotification(create_request)
+            await publish_notification(notification)
 
         if notificationData.get("update"):
             update_request = UpdateNotificationRequest(
@@ -387,13 +389,13 @@ def resolve_manage_notification(_, info, notificationData):
                 message=notificationData["update"]["message"],
                 read=notificationData["update"]["read"],
             )
-            notification_stub.UpdateNotification(update_request)
+            await notification_stub.UpdateNotification(update_request)
 
         if notificationData.get("delete"):
             delete_request = DeleteNotificationRequest(
                 id=notificationData["delete"]["id"]
             )
-            delete_response = notification_stub.DeleteNotification(delete_request)
+            delete_response = await notification_stub.DeleteNotification(delete_request)
             if not delete_response.success:
                 raise Exception("Failed to delete notification.")
 
@@ -405,14 +407,13 @@ def resolve_manage_notification(_, info, notificationData):
         return {"success": False, "message": f"Unexpected error: {str(e)}"}
 
 @mutation.field("manageSetting")
-def resolve_manage_setting(_, info, settingData):
+async def resolve_manage_setting(_, info, settingData):
     user_id = info.context["request"].user_id
     if not user_id:
         raise Exception("Authentication required: user_id is missing")
 
     try:
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        setting_stub = SettingServiceStub(channel)
+        setting_stub = get_aio_stub("user_service", SettingServiceStub)
 
         if settingData.get("create"):
             create_request = CreateSettingRequest(
@@ -420,7 +421,7 @@ def resolve_manage_setting(_, info, settingData):
                 name=settingData["create"]["name"],
                 data=settingData["create"]["data"],
             )
-            setting_stub.CreateSetting(create_request)
+            await setting_stub.CreateSetting(create_request)
 
         if settingData.get("update"):
             update_request = UpdateSettingRequest(
@@ -428,7 +429,7 @@ def resolve_manage_setting(_, info, settingData):
                 name=settingData["update"]["name"],
                 data=settingData["update"]["data"],
             )
-            setting_stub.UpdateSetting(update_request)
+            await setting_stub.UpdateSetting(update_request)
 
         return {"success": True, "message": "Setting operations completed successfully."}
 
@@ -438,14 +439,13 @@ def resolve_manage_setting(_, info, settingData):
         return {"success": False, "message": f"Unexpected error: {str(e)}"}
 
 @mutation.field("manageUserAchievement")
-def resolve_manage_user_achievement(_, info, achievementData):
+async def resolve_manage_user_achievement(_, info, achievementData):
     user_id = info.context["request"].user_id
     if not user_id:
         raise Exception("Authentication required: user_id is missing")
 
     try:
-        channel = grpc.insecure_channel(GRPC_TARGET)
-        achievement_stub = UserAchievementServiceStub(channel)
+        achievement_stub = get_aio_stub("user_service", UserAchievementServiceStub)
 
         if achievementData.get("create"):
             create_request = CreateUserAchievementRequest(
@@ -453,7 +453,7 @@ def resolve_manage_user_achievement(_, info, achievementData):
                 achievement_id=achievementData["create"]["achievementId"],
                 unlocked_at=achievementData["create"]["unlockedAt"],
             )
-            achievement_stub.CreateUserAchievement(create_request)
+            await achievement_stub.CreateUserAchievement(create_request)
 
         if achievementData.get("update"):
             update_request = UpdateUserAchievementRequest(
@@ -461,7 +461,7 @@ def resolve_manage_user_achievement(_, info, achievementData):
                 achievement_id=achievementData["update"]["achievementId"],
                 unlocked_at=achievementData["update"]["unlockedAt"],
             )
-            achievement_stub.UpdateUserAchievement(update_request)
+            await achievement_stub.UpdateUserAchievement(update_request)
 
         return {"success": True, "message": "User Achievement operations completed successfully."}
 
@@ -470,4 +470,4 @@ def resolve_manage_user_achievement(_, info, achievementData):
     except Exception as e:
         return {"success": False, "message": f"Unexpected error: {str(e)}"}
 
-resolver = [query, mutation, subscription, user]
+resolver = [query, mutation, subscription, user, friend, friend_suggestion]
@@ -0,0 +1,194 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import grpc
+import jwt
+from django.conf import settings
+from prometheus_client import Counter
+
+from main_service.api.grpc_pool import get_aio_stub, get_stub
+from main_service.protos.auth_pb2 import GetUserIDFromJwtTokenRequest, WatchRevokedSessionsRequest
+from main_service.protos.auth_pb2_grpc import AuthServiceStub
+
+logger = logging.getLogger(__name__)
+
+AUTH_SESSION_CACHE = Counter(
+    "auth_session_cache_total",
+    "Session lookups by the auth middleware",
+    ["result"],
+)
+AUTH_SESSION_REVOCATIONS = Counter(
+    "auth_session_revocations_total",
+    "Revoked sessions pushed by auth_service",
+)
+
+
+class AuthenticationFailed(Exception):
+    pass
+
+
+class SessionCache:
+    """
+    Bounded LRU of auth_ids auth_service has confirmed, each trusted for
+    AUTH_SESSION_CACHE_TTL seconds.
+
+    Entries are only added while the revocation stream is connected: a
+    session revoked while nobody is listening would otherwise stay cached
+    until it expires. Revoked ids are remembered so a validation that raced
+    with the revocation cannot put the session back.
+    """
+
+    def __init__(self, max_size=None, ttl=None):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._revoked = OrderedDict()
+        self.trusted = False
+
+    @property
+    def max_size(self):
+        if self._max_size is None:
+            self._max_size = getattr(settings, "AUTH_SESSION_CACHE_SIZE", 10000)
+        return self._max_size
+
+    @property
+    def ttl(self):
+        if self._ttl is None:
+            self._ttl = getattr(settings, "AUTH_SESSION_CACHE_TTL", 300)
+        return self._ttl
+
+    def get(self, auth_id):
+        with self._lock:
+            entry = self._entries.get(auth_id)
+            if entry is None:
+                return None
+            user_id, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[auth_id]
+                return None
+            self._entries.move_to_end(auth_id)
+            return user_id
+
+    def add(self, auth_id, user_id):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if not self.trusted or auth_id in self._revoked:
+                return
+            self._entries[auth_id] = (user_id, time.monotonic() + self.ttl)
+            self._entries.move_to_end(auth_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def revoke(self, auth_id):
+        with self._lock:
+            self._entries.pop(auth_id, None)
+            self._revoked[auth_id] = None
+            while len(self._revoked) > self.max_size:
+                self._revoked.popitem(last=False)
+
+    def set_trusted(self, trusted):
+        with self._lock:
+            self._entries.clear()
+            self.trusted = trusted
+
+
+class RevocationWatcher(threading.Thread):
+    """Keeps a WatchRevokedSessions stream open and applies it to the cache."""
+
+    def __init__(self, cache):
+        super().__init__(name="auth-revocation-watcher", daemon=True)
+        self.cache = cache
+
+    def run(self):
+        backoff = 1
+        while True:
+            try:
+                stream = get_stub("auth_service", AuthServiceStub).WatchRevokedSessions(WatchRevokedSessionsRequest())
+                stream.initial_metadata()
+                self.cache.set_trusted(True)
+                backoff = 1
+                for revoked in stream:
+                    self.cache.revoke(revoked.auth_id)
+                    AUTH_SESSION_REVOCATIONS.inc()
+            except grpc.RpcError as e:
+                logger.warning(f"Revocation stream from auth_service lost: {e.code()}")
+            except Exception:
+                logger.exception("Revocation watcher failed")
+            finally:
+                self.cache.set_trusted(False)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+
+session_cache = SessionCache()
+_watcher = None
+_watcher_lock = threading.Lock()
+
+
+def _ensure_watcher():
+    global _watcher
+    if _watcher is None:
+        with _watcher_lock:
+            if _watcher is None:
+                _watcher = RevocationWatcher(session_cache)
+                _watcher.start()
+
+
+def _decode(jwt_token):
+    """Verify the token locally. Returns its auth_id, or None without JWT_SECRET."""
+    secret = getattr(settings, "JWT_SECRET", None)
+    if not secret:
+        return None
+    try:
+        payload = jwt.decode(jwt_token, secret, algorithms=["HS256"], options={"require": ["auth_id", "user_id"]})
+    except jwt.ExpiredSignatureError:
+        AUTH_SESSION_CACHE.labels("invalid").inc()
+        raise AuthenticationFailed("Token has expired")
+    except jwt.InvalidTokenError:
+        AUTH_SESSION_CACHE.labels("invalid").inc()
+        raise AuthenticationFailed("Invalid token")
+    return payload["auth_id"]
+
+
+def _lookup(jwt_token):
+    auth_id = _decode(jwt_token)
+    if auth_id is None:
+        AUTH_SESSION_CACHE.labels("bypass").inc()
+        return None, None
+    _ensure_watcher()
+    user_id = session_cache.get(auth_id)
+    AUTH_SESSION_CACHE.labels("hit" if user_id is not None else "miss").inc()
+    return auth_id, user_id
+
+
+def authenticate(jwt_token):
+    """
+    Return the user_id of a session cookie. Signatures are checked locally;
+    auth_service is only asked whether the session still exists when it is
+    not in the cache.
+    """
+    auth_id, user_id = _lookup(jwt_token)
+    if user_id is not None:
+        return user_id
+    response = get_stub("auth_service", AuthServiceStub).GetUserIDFromJwtToken(
+        GetUserIDFromJwtTokenRequest(jwt_token=jwt_token)
+    )
+    if auth_id is not None:
+        session_cache.add(auth_id, response.user_id)
+    return response.user_id
+
+
+async def aauthenticate(jwt_token):
+    auth_id, user_id = _lookup(jwt_token)
+    if user_id is not None:
+        return user_id
+    response = await get_aio_stub("auth_service", AuthServiceStub).GetUserIDFromJwtToken(
+        GetUserIDFromJwtTokenRequest(jwt_token=jwt_token)
+    )
+    if auth_id is not None:
+        session_cache.add(auth_id, response.user_id)
+    return response.user_id
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+
+from channels.layers import get_channel_layer
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+GROUP_PUBLISHED = Counter(
+    "graphql_group_published_total",
+    "Events published to subscription groups on the channel layer",
+    ["kind"],
+)
+GROUP_DELIVERED = Counter(
+    "graphql_group_delivered_total",
+    "Group events delivered to local subscribers",
+    ["kind"],
+)
+
+GROUP_LISTEN_ERRORS = Counter(
+    "graphql_group_listen_errors_total",
+    "Channel layer errors while listening to subscription groups",
+    ["kind"],
+)
+
+GROUP_MESSAGE_TYPE = "group.publish"
+# Seconds before listening again after a channel layer error, doubled per failure
+LISTEN_RETRY_MIN = 1
+LISTEN_RETRY_MAX = 30
+
+
+def chat_room_group(chat_room_id):
+    return f"chat_room.{chat_room_id}"
+
+
+def notifications_group(user_id):
+    return f"notifications.{user_id}"
+
+
+def online_status_group(user_id):
+    return f"online_status.{user_id}"
+
+
+async def publish(group, payload):
+    """
+    Deliver ``payload`` to every subscriber of ``group`` in every gateway
+    process sharing the channel layer (CHANNEL_LAYERS). Payloads must be
+    msgpack-serializable for the Redis layer, i.e. no datetimes.
+
+    Publishing is best effort: subscribers still poll their source of truth,
+    so a failed publish only delays delivery.
+    """
+    kind = group.split(".", 1)[0]
+    try:
+        await get_channel_layer().group_send(group, {"type": GROUP_MESSAGE_TYPE, "payload": payload})
+    except Exception as e:
+        logger.warning(f"Publishing to {group} failed: {e}")
+        return
+    GROUP_PUBLISHED.labels(kind).inc()
+
+
+async def publish_notification(notification):
+    """Publish a created notification to its recipient's notificationsForUser subscriptions."""
+    await publish(notifications_group(notification.user_id), {
+        "id": notification.id,
+        "userId": notification.user_id,
+        "message": notification.message,
+        "read": notification.read,
+        "sentAt": notification.sent_at.ToDatetime().isoformat(),
+    })
+
+
+async def listen(group):
+    """
+    Yield the payloads published to ``group`` until the consumer stops
+    iterating.
+
+    Like publishing, listening is best effort: channel layer errors are
+    logged and listening resumes with backoff, while the subscriber keeps
+    being served by the source of truth it polls or streams.
+    """
+    kind = group.split(".", 1)[0]
+    layer = get_channel_layer()
+    backoff = LISTEN_RETRY_MIN
+    while True:
+        channel = None
+        try:
+            channel = await layer.new_channel()
+            await layer.group_add(group, channel)
+            while True:
+                message = await layer.receive(channel)
+                backoff = LISTEN_RETRY_MIN
+                if message.get("type") == GROUP_MESSAGE_TYPE:
+                    GROUP_DELIVERED.labels(kind).inc()
+                    yield message["payload"]
+        except Exception as e:
+            GROUP_LISTEN_ERRORS.labels(kind).inc()
+            logger.warning(f"Listening to {group} failed, retrying in {backoff}s: {e}")
+        finally:
+            if channel is not None:
+                try:
+                    await layer.group_discard(group, channel)
+                except Exception:
+                    pass
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, LISTEN_RETRY_MAX)
+
+
+async def merge(*streams):
+    """
+    Iterate several async iterators at once, yielding ``(index, item)``.
+    Stops when the first one, the source of truth, is exhausted (the others,
+    such as ``listen``, may never end) and re-raises the first error.
+    """
+    queue = asyncio.Queue()
+    done = object()
+
+    async def drain(index, stream):
+        try:
+            async for item in stream:
+                await queue.put((index, item))
+        except Exception as e:
+            await queue.put((index, e))
+        else:
+            await queue.put((index, done))
+
+    tasks = [asyncio.create_task(drain(index, stream)) for index, stream in enumerate(streams)]
+    try:
+        while True:
+            index, item = await queue.get()
+            if item is done:
+                if index == 0:
+                    return
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield index, item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
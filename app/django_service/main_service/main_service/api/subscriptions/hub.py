@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import weakref
+from collections import deque
+
+from django.conf import settings
+from prometheus_client import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIPTION_UPSTREAMS = Gauge(
+    "graphql_subscription_upstreams",
+    "Upstream gRPC streams held by a subscription hub",
+    ["hub"],
+)
+SUBSCRIPTION_SUBSCRIBERS = Gauge(
+    "graphql_subscription_subscribers",
+    "Local subscribers attached to a subscription hub",
+    ["hub"],
+)
+SUBSCRIPTION_DROPPED = Counter(
+    "graphql_subscription_dropped_total",
+    "Subscribers disconnected because their queue was full",
+    ["hub"],
+)
+
+_END = object()
+
+
+class SubscriberOverflow(Exception):
+    pass
+
+
+class UpstreamClosed(Exception):
+    pass
+
+
+class _Upstream:
+    __slots__ = ("subscribers", "replay", "ready", "task")
+
+    def __init__(self, replay_size):
+        # queue -> items it may hold before it is dropped
+        self.subscribers = {}
+        self.replay = deque(maxlen=replay_size)
+        # Set once the upstream server has accepted the stream (or it failed)
+        self.ready = asyncio.Event()
+        self.task = None
+
+
+class Subscription:
+    """
+    One subscriber of a FanOutHub key. Entering it waits until the upstream
+    stream is established, so anything that happens upstream afterwards is
+    delivered; iterate it for the items.
+    """
+
+    def __init__(self, hub, key):
+        self.hub = hub
+        self.key = key
+        self.upstream = None
+        # Unbounded so the end of the stream can always be queued; the size
+        # limit is enforced in _publish.
+        self.queue = asyncio.Queue()
+
+    async def __aenter__(self):
+        self.upstream = self.hub._attach(self.key, self.queue)
+        try:
+            await self.upstream.ready.wait()
+        except BaseException:
+            self.hub._detach(self.key, self.upstream, self.queue)
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.hub._detach(self.key, self.upstream, self.queue)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.queue.get()
+        if item is _END:
+            raise StopAsyncIteration
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+class FanOutHub:
+    """
+    Shares one upstream stream per key between every local subscriber.
+
+    ``open_stream(key)`` returns the upstream call (a ``grpc.aio`` response
+    stream); each item is decoded once with ``decode`` and handed to every
+    subscriber through its own queue. A subscriber that falls more than
+    ``queue_size`` items behind is disconnected instead of holding up the
+    others. The upstream is cancelled when its last subscriber leaves.
+
+    The last ``replay_size`` items (GRAPHQL_SUBSCRIPTION_REPLAY_SIZE by
+    default) are replayed to subscribers that join an already open stream,
+    so they see the same history as the first one.
+
+    Upstreams are kept per event loop, like grpc.aio channels.
+    """
+
+    def __init__(self, name, open_stream, decode=None, queue_size=None, replay_size=None):
+        self.name = name
+        self.open_stream = open_stream
+        self.decode = decode
+        self._queue_size = queue_size
+        self._replay_size = replay_size
+        self._upstreams = weakref.WeakKeyDictionary()
+
+    @property
+    def queue_size(self):
+        if self._queue_size is None:
+            self._queue_size = getattr(settings, "GRAPHQL_SUBSCRIPTION_QUEUE_SIZE", 100)
+        return self._queue_size
+
+    @property
+    def replay_size(self):
+        if self._replay_size is None:
+            self._replay_size = getattr(settings, "GRAPHQL_SUBSCRIPTION_REPLAY_SIZE", 1000)
+        return self._replay_size
+
+    def subscription(self, key):
+        return Subscription(self, key)
+
+    async def subscribe(self, key):
+        async with self.subscription(key) as items:
+            async for item in items:
+                yield item
+
+    def _attach(self, key, queue):
+        upstreams = self._upstreams.setdefault(asyncio.get_running_loop(), {})
+        upstream = upstreams.get(key)
+        if upstream is None:
+            upstream = upstreams[key] = _Upstream(self.replay_size)
+            upstream.task = asyncio.create_task(self._pump(key, upstream))
+            SUBSCRIPTION_UPSTREAMS.labels(self.name).inc()
+            # Not in _pump: a task cancelled before it first runs never enters it
+            upstream.task.add_done_callback(lambda _: SUBSCRIPTION_UPSTREAMS.labels(self.name).dec())
+
+        for item in upstream.replay:
+            queue.put_nowait(item)
+        upstream.subscribers[queue] = self.queue_size + queue.qsize()
+        SUBSCRIPTION_SUBSCRIBERS.labels(self.name).inc()
+        return upstream
+
+    def _detach(self, key, upstream, queue):
+        SUBSCRIPTION_SUBSCRIBERS.labels(self.name).dec()
+        upstream.subscribers.pop(queue, None)
+        upstreams = self._upstreams.get(asyncio.get_running_loop(), {})
+        if not upstream.subscribers and upstreams.get(key) is upstream:
+            del upstreams[key]
+            upstream.task.cancel()
+
+    async def _pump(self, key, upstream):
+        call = self.open_stream(key)
+        try:
+            await call.initial_metadata()
+            upstream.ready.set()
+            async for item in call:
+                self._publish(upstream, self.decode(item) if self.decode else item)
+            self._close(upstream, _END)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Upstream {self.name} stream for {key} failed: {e}")
+            self._close(upstream, UpstreamClosed(f"{self.name} stream closed"))
+        finally:
+            upstream.ready.set()
+            call.cancel()
+            upstreams = self._upstreams.get(asyncio.get_running_loop(), {})
+            if upstreams.get(key) is upstream:
+                del upstreams[key]
+
+    def _publish(self, upstream, item):
+        upstream.replay.append(item)
+        for queue, limit in list(upstream.subscribers.items()):
+            if queue.qsize() >= limit:
+                del upstream.subscribers[queue]
+                queue.put_nowait(SubscriberOverflow("Subscriber is too slow"))
+                SUBSCRIPTION_DROPPED.labels(self.name).inc()
+            else:
+                queue.put_nowait(item)
+
+    @staticmethod
+    def _close(upstream, item):
+        for queue in upstream.subscribers:
+            queue.put_nowait(item)
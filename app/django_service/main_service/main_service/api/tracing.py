@@ -0,0 +1,174 @@
+import logging
+import time
+
+from ariadne.resolvers import is_default_resolver
+from ariadne.types import Extension
+from django.conf import settings
+from graphql.pyutils import is_awaitable
+from prometheus_client import Counter, Histogram
+
+from main_service.api.grpc_pool import rpc_trace
+from main_service.api.persisted_queries import registry
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_OPERATION_DURATION = Histogram(
+    "graphql_operation_duration_seconds",
+    "Wall time of executed GraphQL operations",
+    ["operation"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+GRAPHQL_OPERATION_GRPC_CALLS = Counter(
+    "graphql_operation_grpc_calls_total",
+    "Unary gRPC calls issued while executing GraphQL operations",
+    ["operation"],
+)
+GRAPHQL_RESOLVER_DURATION = Histogram(
+    "graphql_resolver_duration_seconds",
+    "Wall time of custom GraphQL resolvers",
+    ["parent_type", "field"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+
+class ResolverSpan:
+    __slots__ = ("path", "parent_type", "field", "start", "duration", "rpc_calls")
+
+    def __init__(self, path, parent_type, field, start):
+        self.path = path
+        self.parent_type = parent_type
+        self.field = field
+        self.start = start
+        self.duration = None
+        self.rpc_calls = []
+
+
+class OperationTrace:
+    """Resolver spans and RPCs of one operation; RPCs issued outside any resolver land on the trace itself."""
+
+    def __init__(self):
+        # Set once the first field resolves; the raw operation name only goes to the slow log
+        self.name = None
+        self.resolved = False
+        self.start = time.perf_counter()
+        self.duration = None
+        self.spans = []
+        self.rpc_calls = []
+
+    def rpc_call_count(self):
+        return len(self.rpc_calls) + sum(len(span.rpc_calls) for span in self.spans)
+
+    def format(self):
+        lines = [
+            f"Slow GraphQL operation {self.name or 'anonymous'}: "
+            f"{self.duration * 1000:.1f} ms, {self.rpc_call_count()} gRPC calls"
+        ]
+        for call in self.rpc_calls:
+            lines.append(f"  -> {call.target} {call.method} {call.status} {call.duration * 1000:.1f} ms")
+        # Sorting by path puts every resolver right below its parent field.
+        for span in sorted(self.spans, key=lambda span: [(isinstance(key, str), key) for key in span.path]):
+            indent = "  " * len(span.path)
+            offset = (span.start - self.start) * 1000
+            duration = f"{span.duration * 1000:.1f} ms" if span.duration is not None else "unfinished"
+            lines.append(
+                f"{indent}{'.'.join(map(str, span.path))} ({span.parent_type}) +{offset:.1f} ms {duration}"
+            )
+            for call in span.rpc_calls:
+                lines.append(f"{indent}  -> {call.target} {call.method} {call.status} {call.duration * 1000:.1f} ms")
+        return "\n".join(lines)
+
+
+def operation_label(name):
+    """
+    Metric label of an operation. Names are chosen by the client, so only
+    those of persisted queries are used as labels; any other named
+    operation is counted as "other".
+    """
+    if name is None:
+        return "anonymous"
+    return name if name in registry.operation_names else "other"
+
+
+def _path(info):
+    keys = []
+    path = info.path
+    while path is not None:
+        keys.append(path.key)
+        path = path.prev
+    return tuple(reversed(keys))
+
+
+def _should_trace(info):
+    field = info.parent_type.fields.get(info.field_name)
+    if field is None or info.field_name.startswith("__"):
+        return False
+    return field.resolve is not None and not is_default_resolver(field.resolve)
+
+
+class TracingExtension(Extension):
+    """
+    Times every custom resolver and the gRPC calls made inside it, and
+    exports them per field and per operation (see ``operation_label``).
+    Operations slower than GRAPHQL_SLOW_OPERATION_SECONDS are logged with
+    their resolver tree, under the operation's own name.
+
+    RPCs of a DataLoader batch are counted on the resolver that started it.
+    """
+
+    def __init__(self):
+        self.trace = OperationTrace()
+        self.token = None
+
+    def request_started(self, context):
+        self.token = rpc_trace.set(self.trace)
+
+    def request_finished(self, context):
+        rpc_trace.reset(self.token)
+        trace = self.trace
+        if not trace.resolved:
+            # Rejected before any field was resolved.
+            return
+        trace.duration = time.perf_counter() - trace.start
+        label = operation_label(trace.name)
+        GRAPHQL_OPERATION_DURATION.labels(label).observe(trace.duration)
+        GRAPHQL_OPERATION_GRPC_CALLS.labels(label).inc(trace.rpc_call_count())
+
+        threshold = getattr(settings, "GRAPHQL_SLOW_OPERATION_SECONDS", None)
+        if threshold is not None and trace.duration >= threshold:
+            logger.warning(trace.format())
+
+    def resolve(self, next_, obj, info, **kwargs):
+        if not self.trace.resolved:
+            self.trace.resolved = True
+            self.trace.name = info.operation.name.value if info.operation.name else None
+        if not _should_trace(info):
+            return next_(obj, info, **kwargs)
+
+        span = ResolverSpan(_path(info), info.parent_type.name, info.field_name, time.perf_counter())
+        self.trace.spans.append(span)
+        token = rpc_trace.set(span)
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            self.finish(span)
+            raise
+        finally:
+            rpc_trace.reset(token)
+
+        if is_awaitable(result):
+            return self.resolve_async(span, result)
+        self.finish(span)
+        return result
+
+    async def resolve_async(self, span, result):
+        token = rpc_trace.set(span)
+        try:
+            return await result
+        finally:
+            rpc_trace.reset(token)
+            self.finish(span)
+
+    @staticmethod
+    def finish(span):
+        span.duration = time.perf_counter() - span.start
+        GRAPHQL_RESOLVER_DURATION.labels(span.parent_type, span.field).observe(span.duration)
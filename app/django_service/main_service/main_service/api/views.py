@@ -0,0 +1,127 @@
+import hashlib
+import json
+from typing import cast
+
+from ariadne.exceptions import HttpBadRequestError
+from ariadne.graphql import graphql
+from ariadne_django.views import GraphQLAsyncView
+from django.conf import settings
+from django.http import HttpResponseBadRequest, HttpResponseNotModified, JsonResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from graphql import FieldNode, GraphQLError, GraphQLSchema, get_operation_ast
+
+from main_service.api.persisted_queries import (
+    PersistedQueryNotFound,
+    apply_persisted_query,
+    document_cache,
+    get_persisted_hash,
+)
+from main_service.api.response_cache import response_cache
+
+
+def is_public_operation(data):
+    """True if every root field of the operation is in GRAPHQL_PUBLIC_FIELDS."""
+    public_fields = getattr(settings, "GRAPHQL_PUBLIC_FIELDS", ())
+    document = document_cache.parse(None, data)
+    operation = get_operation_ast(document, data.get("operationName"))
+    if operation is None or operation.operation.value != "query":
+        return False
+    return all(
+        isinstance(selection, FieldNode) and selection.name.value in public_fields
+        for selection in operation.selection_set.selections
+    )
+
+
+class PersistedQueryGraphQLView(GraphQLAsyncView):
+    """
+    GraphQLAsyncView with persisted queries, cached document parsing and
+    the response cache.
+
+    POST accepts full documents as before, or only the hash of a registered
+    document in ``extensions.persistedQuery.sha256Hash``. GET executes
+    registered query documents by hash and answers with Cache-Control and
+    ETag headers, so responses of public queries can be cached by nginx.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        if not request.GET:
+            return self._get(request, *args, **kwargs)
+        try:
+            data = self.extract_data_from_get_request(request)
+        except HttpBadRequestError as error:
+            return HttpResponseBadRequest(error.message)
+        return await self.execute_query(request, data, require_query=True)
+
+    async def post(self, request, *args, **kwargs):
+        try:
+            data = self.extract_data_from_request(request)
+        except HttpBadRequestError as error:
+            return HttpResponseBadRequest(error.message)
+        return await self.execute_query(request, data)
+
+    def extract_data_from_get_request(self, request):
+        data = {"operationName": request.GET.get("operationName")}
+        for name in ("variables", "extensions"):
+            value = request.GET.get(name)
+            if value:
+                try:
+                    data[name] = json.loads(value)
+                except ValueError as ex:
+                    raise HttpBadRequestError(f"Query parameter '{name}' is not a valid JSON") from ex
+        if "query" in request.GET or get_persisted_hash(data) is None:
+            raise HttpBadRequestError("GET requests must reference a persisted query by its sha256Hash")
+        return data
+
+    async def execute_query(self, request, data, require_query=False):
+        try:
+            data = apply_persisted_query(data)
+        except PersistedQueryNotFound:
+            response = JsonResponse({"errors": [{
+                "message": "PersistedQueryNotFound",
+                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+            }]})
+            patch_cache_control(response, no_store=True)
+            return response
+        except GraphQLError as error:
+            return JsonResponse({"errors": [{"message": error.message}]}, status=400)
+
+        viewer = getattr(request, "user_id", None)
+        cache_plan = response_cache.plan(self.schema, data, viewer)
+        result = await response_cache.get(cache_plan) if cache_plan else None
+        if result is not None:
+            success = True
+        else:
+            success, result = await graphql(
+                cast(GraphQLSchema, self.schema),
+                data,
+                query_parser=document_cache.parse,
+                query_validator=document_cache.validate,
+                require_query=require_query,
+                **self.get_kwargs_graphql(request),
+            )
+            if success and cache_plan is None:
+                await response_cache.invalidate(self.schema, data, viewer)
+            elif success and not result.get("errors"):
+                await response_cache.set(cache_plan, result)
+        response = JsonResponse(result, status=200 if success else 400)
+        if request.method != "GET":
+            return response
+        if not success or result.get("errors"):
+            patch_cache_control(response, no_store=True)
+            return response
+        return self.conditional_response(request, data, response)
+
+    def conditional_response(self, request, data, response):
+        etag = f'"{hashlib.sha256(response.content).hexdigest()}"'
+        if is_public_operation(data):
+            cache_control = {"public": True, "max_age": settings.GRAPHQL_GET_MAX_AGE}
+        else:
+            cache_control = {"private": True, "max_age": 0, "must_revalidate": True}
+
+        if etag in request.headers.get("If-None-Match", ""):
+            response = HttpResponseNotModified()
+        response["ETag"] = etag
+        patch_cache_control(response, **cache_control)
+        if "private" in cache_control:
+            patch_vary_headers(response, ["Cookie"])
+        return response
@@ -5,6 +5,8 @@ from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.auth import AuthMiddlewareStack
 from django.urls import path
 from main_service.api.schema import Schema
+from main_service.api.cost import get_validation_rules
+from main_service.api.metrics import start_metrics_server
 from main_service.api.middleware.authMiddleware import AuthMiddlewareStack
 from ariadne.asgi import GraphQL
 
@@ -14,12 +16,14 @@ django_asgi_app = get_asgi_application()
 
 django.setup()
 
+start_metrics_server()
+
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
     "websocket": AuthMiddlewareStack(
         URLRouter([
-            path("graphql/", GraphQL(Schema.schema)),
-            path("graphql", GraphQL(Schema.schema)),
+            path("graphql/", GraphQL(Schema.schema, validation_rules=get_validation_rules)),
+            path("graphql", GraphQL(Schema.schema, validation_rules=get_validation_rules)),
         ])
     ),
 })
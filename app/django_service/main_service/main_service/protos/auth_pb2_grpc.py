@@ -1,9 +1,29 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
 """Client and server classes corresponding to protobuf-defined services."""
 import grpc
+import warnings
 
 from . import auth_pb2 as auth__pb2
 
+GRPC_GENERATED_VERSION = '1.69.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in auth_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
 
 class AuthServiceStub(object):
     """Missing associated documentation comment in .proto file."""
@@ -18,12 +38,17 @@ class AuthServiceStub(object):
                 '/auth.AuthService/ExchangeCodeForToken',
                 request_serializer=auth__pb2.ExchangeCodeRequest.SerializeToString,
                 response_deserializer=auth__pb2.ExchangeCodeResponse.FromString,
-                )
+                _registered_method=True)
         self.GetUserIDFromJwtToken = channel.unary_unary(
                 '/auth.AuthService/GetUserIDFromJwtToken',
                 request_serializer=auth__pb2.GetUserIDFromJwtTokenRequest.SerializeToString,
                 response_deserializer=auth__pb2.GetUserIDFromJwtTokenResponse.FromString,
-                )
+                _registered_method=True)
+        self.WatchRevokedSessions = channel.unary_stream(
+                '/auth.AuthService/WatchRevokedSessions',
+                request_serializer=auth__pb2.WatchRevokedSessionsRequest.SerializeToString,
+                response_deserializer=auth__pb2.RevokedSession.FromString,
+                _registered_method=True)
 
 
 class AuthServiceServicer(object):
@@ -41,6 +66,12 @@ class AuthServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchRevokedSessions(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AuthServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -54,10 +85,16 @@ def add_AuthServiceServicer_to_server(servicer, server):
                     request_deserializer=auth__pb2.GetUserIDFromJwtTokenRequest.FromString,
                     response_serializer=auth__pb2.GetUserIDFromJwtTokenResponse.SerializeToString,
             ),
+            'WatchRevokedSessions': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchRevokedSessions,
+                    request_deserializer=auth__pb2.WatchRevokedSessionsRequest.FromString,
+                    response_serializer=auth__pb2.RevokedSession.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'auth.AuthService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('auth.AuthService', rpc_method_handlers)
 
 
  # This class is part of an EXPERIMENTAL API.
@@ -75,11 +112,21 @@ class AuthService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/auth.AuthService/ExchangeCodeForToken',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/auth.AuthService/ExchangeCodeForToken',
             auth__pb2.ExchangeCodeRequest.SerializeToString,
             auth__pb2.ExchangeCodeResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def GetUserIDFromJwtToken(request,
@@ -92,8 +139,45 @@ class AuthService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/auth.AuthService/GetUserIDFromJwtToken',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/auth.AuthService/GetUserIDFromJwtToken',
             auth__pb2.GetUserIDFromJwtTokenRequest.SerializeToString,
             auth__pb2.GetUserIDFromJwtTokenResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchRevokedSessions(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/auth.AuthService/WatchRevokedSessions',
+            auth__pb2.WatchRevokedSessionsRequest.SerializeToString,
+            auth__pb2.RevokedSession.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
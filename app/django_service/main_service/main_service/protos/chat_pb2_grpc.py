@@ -45,6 +45,11 @@ class ChatRoomControllerStub(object):
                 request_serializer=chat__pb2.ChatRoomDestroyRequest.SerializeToString,
                 response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                 _registered_method=True)
+        self.DestroyByGameId = channel.unary_unary(
+                '/chat_service.chat.ChatRoomController/DestroyByGameId',
+                request_serializer=chat__pb2.ChatRoomDestroyByGameIdRequest.SerializeToString,
+                response_deserializer=chat__pb2.ChatRoomDestroyByGameIdResponse.FromString,
+                _registered_method=True)
         self.GetChatRoomByUserId = channel.unary_stream(
                 '/chat_service.chat.ChatRoomController/GetChatRoomByUserId',
                 request_serializer=chat__pb2.ChatRoomGetChatRoomByUserIdRequest.SerializeToString,
@@ -65,6 +70,11 @@ class ChatRoomControllerStub(object):
                 request_serializer=chat__pb2.ChatRoomRetrieveRequest.SerializeToString,
                 response_deserializer=chat__pb2.ChatRoomResponse.FromString,
                 _registered_method=True)
+        self.SubscribeChatRoomChanges = channel.unary_stream(
+                '/chat_service.chat.ChatRoomController/SubscribeChatRoomChanges',
+                request_serializer=chat__pb2.ChatRoomSubscribeChatRoomChangesRequest.SerializeToString,
+                response_deserializer=chat__pb2.ChatRoomSubscribeChatRoomChangesResponse.FromString,
+                _registered_method=True)
         self.Update = channel.unary_unary(
                 '/chat_service.chat.ChatRoomController/Update',
                 request_serializer=chat__pb2.ChatRoomRequest.SerializeToString,
@@ -87,6 +97,12 @@ class ChatRoomControllerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DestroyByGameId(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetChatRoomByUserId(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -111,6 +127,12 @@ class ChatRoomControllerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SubscribeChatRoomChanges(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Update(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -130,6 +152,11 @@ def add_ChatRoomControllerServicer_to_server(servicer, server):
                     request_deserializer=chat__pb2.ChatRoomDestroyRequest.FromString,
                     response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
             ),
+            'DestroyByGameId': grpc.unary_unary_rpc_method_handler(
+                    servicer.DestroyByGameId,
+                    request_deserializer=chat__pb2.ChatRoomDestroyByGameIdRequest.FromString,
+                    response_serializer=chat__pb2.ChatRoomDestroyByGameIdResponse.SerializeToString,
+            ),
             'GetChatRoomByUserId': grpc.unary_stream_rpc_method_handler(
                     servicer.GetChatRoomByUserId,
                     request_deserializer=chat__pb2.ChatRoomGetChatRoomByUserIdRequest.FromString,
@@ -150,6 +177,11 @@ def add_ChatRoomControllerServicer_to_server(servicer, server):
                     request_deserializer=chat__pb2.ChatRoomRetrieveRequest.FromString,
                     response_serializer=chat__pb2.ChatRoomResponse.SerializeToString,
             ),
+            'SubscribeChatRoomChanges': grpc.unary_stream_rpc_method_handler(
+                    servicer.SubscribeChatRoomChanges,
+                    request_deserializer=chat__pb2.ChatRoomSubscribeChatRoomChangesRequest.FromString,
+                    response_serializer=chat__pb2.ChatRoomSubscribeChatRoomChangesResponse.SerializeToString,
+            ),
             'Update': grpc.unary_unary_rpc_method_handler(
                     servicer.Update,
                     request_deserializer=chat__pb2.ChatRoomRequest.FromString,
@@ -220,6 +252,33 @@ class ChatRoomController(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def DestroyByGameId(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat_service.chat.ChatRoomController/DestroyByGameId',
+            chat__pb2.ChatRoomDestroyByGameIdRequest.SerializeToString,
+            chat__pb2.ChatRoomDestroyByGameIdResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetChatRoomByUserId(request,
             target,
@@ -328,6 +387,33 @@ class ChatRoomController(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SubscribeChatRoomChanges(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/chat_service.chat.ChatRoomController/SubscribeChatRoomChanges',
+            chat__pb2.ChatRoomSubscribeChatRoomChangesRequest.SerializeToString,
+            chat__pb2.ChatRoomSubscribeChatRoomChangesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Update(request,
             target,
@@ -380,6 +466,16 @@ class ChatRoomMessageControllerStub(object):
                 request_serializer=chat__pb2.ChatRoomMessageListRequest.SerializeToString,
                 response_deserializer=chat__pb2.ChatRoomMessageListResponse.FromString,
                 _registered_method=True)
+        self.ListMessagesAfter = channel.unary_unary(
+                '/chat_service.chat.ChatRoomMessageController/ListMessagesAfter',
+                request_serializer=chat__pb2.ChatRoomMessageListMessagesAfterRequest.SerializeToString,
+                response_deserializer=chat__pb2.ChatRoomMessageListResponse.FromString,
+                _registered_method=True)
+        self.ListMessagesBefore = channel.unary_unary(
+                '/chat_service.chat.ChatRoomMessageController/ListMessagesBefore',
+                request_serializer=chat__pb2.ChatRoomMessageListMessagesBeforeRequest.SerializeToString,
+                response_deserializer=chat__pb2.ChatRoomMessageListResponse.FromString,
+                _registered_method=True)
         self.PartialUpdate = channel.unary_unary(
                 '/chat_service.chat.ChatRoomMessageController/PartialUpdate',
                 request_serializer=chat__pb2.ChatRoomMessagePartialUpdateRequest.SerializeToString,
@@ -395,6 +491,11 @@ class ChatRoomMessageControllerStub(object):
                 request_serializer=chat__pb2.ChatRoomMessageSubscribeChatRoomMessagesRequest.SerializeToString,
                 response_deserializer=chat__pb2.ChatRoomMessageResponse.FromString,
                 _registered_method=True)
+        self.SubscribeUserInbox = channel.unary_stream(
+                '/chat_service.chat.ChatRoomMessageController/SubscribeUserInbox',
+                request_serializer=chat__pb2.ChatRoomMessageSubscribeUserInboxRequest.SerializeToString,
+                response_deserializer=chat__pb2.ChatRoomMessageResponse.FromString,
+                _registered_method=True)
         self.Update = channel.unary_unary(
                 '/chat_service.chat.ChatRoomMessageController/Update',
                 request_serializer=chat__pb2.ChatRoomMessageRequest.SerializeToString,
@@ -423,6 +524,18 @@ class ChatRoomMessageControllerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ListMessagesAfter(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListMessagesBefore(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def PartialUpdate(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -441,6 +554,12 @@ class ChatRoomMessageControllerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SubscribeUserInbox(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Update(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -465,6 +584,16 @@ def add_ChatRoomMessageControllerServicer_to_server(servicer, server):
                     request_deserializer=chat__pb2.ChatRoomMessageListRequest.FromString,
                     response_serializer=chat__pb2.ChatRoomMessageListResponse.SerializeToString,
             ),
+            'ListMessagesAfter': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListMessagesAfter,
+                    request_deserializer=chat__pb2.ChatRoomMessageListMessagesAfterRequest.FromString,
+                    response_serializer=chat__pb2.ChatRoomMessageListResponse.SerializeToString,
+            ),
+            'ListMessagesBefore': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListMessagesBefore,
+                    request_deserializer=chat__pb2.ChatRoomMessageListMessagesBeforeRequest.FromString,
+                    response_serializer=chat__pb2.ChatRoomMessageListResponse.SerializeToString,
+            ),
             'PartialUpdate': grpc.unary_unary_rpc_method_handler(
                     servicer.PartialUpdate,
                     request_deserializer=chat__pb2.ChatRoomMessagePartialUpdateRequest.FromString,
@@ -480,6 +609,11 @@ def add_ChatRoomMessageControllerServicer_to_server(servicer, server):
                     request_deserializer=chat__pb2.ChatRoomMessageSubscribeChatRoomMessagesRequest.FromString,
                     response_serializer=chat__pb2.ChatRoomMessageResponse.SerializeToString,
             ),
+            'SubscribeUserInbox': grpc.unary_stream_rpc_method_handler(
+                    servicer.SubscribeUserInbox,
+                    request_deserializer=chat__pb2.ChatRoomMessageSubscribeUserInboxRequest.FromString,
+                    response_serializer=chat__pb2.ChatRoomMessageResponse.SerializeToString,
+            ),
             'Update': grpc.unary_unary_rpc_method_handler(
                     servicer.Update,
                     request_deserializer=chat__pb2.ChatRoomMessageRequest.FromString,
@@ -577,6 +711,60 @@ class ChatRoomMessageController(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ListMessagesAfter(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat_service.chat.ChatRoomMessageController/ListMessagesAfter',
+            chat__pb2.ChatRoomMessageListMessagesAfterRequest.SerializeToString,
+            chat__pb2.ChatRoomMessageListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListMessagesBefore(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat_service.chat.ChatRoomMessageController/ListMessagesBefore',
+            chat__pb2.ChatRoomMessageListMessagesBeforeRequest.SerializeToString,
+            chat__pb2.ChatRoomMessageListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def PartialUpdate(request,
             target,
@@ -658,6 +846,33 @@ class ChatRoomMessageController(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SubscribeUserInbox(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/chat_service.chat.ChatRoomMessageController/SubscribeUserInbox',
+            chat__pb2.ChatRoomMessageSubscribeUserInboxRequest.SerializeToString,
+            chat__pb2.ChatRoomMessageResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Update(request,
             target,
@@ -705,11 +920,21 @@ class ChatRoomUserControllerStub(object):
                 request_serializer=chat__pb2.ChatRoomUserDestroyRequest.SerializeToString,
                 response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                 _registered_method=True)
+        self.GetUnreadCounts = channel.unary_unary(
+                '/chat_service.chat.ChatRoomUserController/GetUnreadCounts',
+                request_serializer=chat__pb2.ChatRoomUserGetUnreadCountsRequest.SerializeToString,
+                response_deserializer=chat__pb2.ChatRoomUnreadListResponse.FromString,
+                _registered_method=True)
         self.List = channel.unary_unary(
                 '/chat_service.chat.ChatRoomUserController/List',
                 request_serializer=chat__pb2.ChatRoomUserListRequest.SerializeToString,
                 response_deserializer=chat__pb2.ChatRoomUserListResponse.FromString,
                 _registered_method=True)
+        self.MarkRead = channel.unary_unary(
+                '/chat_service.chat.ChatRoomUserController/MarkRead',
+                request_serializer=chat__pb2.ChatRoomUserMarkReadRequest.SerializeToString,
+                response_deserializer=chat__pb2.ChatRoomUnreadResponse.FromString,
+                _registered_method=True)
         self.PartialUpdate = channel.unary_unary(
                 '/chat_service.chat.ChatRoomUserController/PartialUpdate',
                 request_serializer=chat__pb2.ChatRoomUserPartialUpdateRequest.SerializeToString,
@@ -742,12 +967,24 @@ class ChatRoomUserControllerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetUnreadCounts(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def List(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def MarkRead(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def PartialUpdate(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -779,11 +1016,21 @@ def add_ChatRoomUserControllerServicer_to_server(servicer, server):
                     request_deserializer=chat__pb2.ChatRoomUserDestroyRequest.FromString,
                     response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
             ),
+            'GetUnreadCounts': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUnreadCounts,
+                    request_deserializer=chat__pb2.ChatRoomUserGetUnreadCountsRequest.FromString,
+                    response_serializer=chat__pb2.ChatRoomUnreadListResponse.SerializeToString,
+            ),
             'List': grpc.unary_unary_rpc_method_handler(
                     servicer.List,
                     request_deserializer=chat__pb2.ChatRoomUserListRequest.FromString,
                     response_serializer=chat__pb2.ChatRoomUserListResponse.SerializeToString,
             ),
+            'MarkRead': grpc.unary_unary_rpc_method_handler(
+                    servicer.MarkRead,
+                    request_deserializer=chat__pb2.ChatRoomUserMarkReadRequest.FromString,
+                    response_serializer=chat__pb2.ChatRoomUnreadResponse.SerializeToString,
+            ),
             'PartialUpdate': grpc.unary_unary_rpc_method_handler(
                     servicer.PartialUpdate,
                     request_deserializer=chat__pb2.ChatRoomUserPartialUpdateRequest.FromString,
@@ -864,6 +1111,33 @@ class ChatRoomUserController(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetUnreadCounts(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat_service.chat.ChatRoomUserController/GetUnreadCounts',
+            chat__pb2.ChatRoomUserGetUnreadCountsRequest.SerializeToString,
+            chat__pb2.ChatRoomUnreadListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def List(request,
             target,
@@ -891,6 +1165,33 @@ class ChatRoomUserController(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def MarkRead(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat_service.chat.ChatRoomUserController/MarkRead',
+            chat__pb2.ChatRoomUserMarkReadRequest.SerializeToString,
+            chat__pb2.ChatRoomUnreadResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def PartialUpdate(request,
             target,
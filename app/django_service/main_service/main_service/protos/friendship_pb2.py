@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x66riendship.proto\x12\x06models\x1a\x1fgoogle/protobuf/timestamp.proto\"\x93\x01\n\nFriendship\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x11\n\tfriend_id\x18\x03 \x01(\x05\x12\x32\n\x0e\x65stablished_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x05 \x01(\x08\x12\x0f\n\x07\x62locked\x18\x06 \x01(\x08\"%\n\x17\x44\x65leteFriendshipRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"+\n\x18\x44\x65leteFriendshipResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"|\n\x17UpdateFriendshipRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x02 \x01(\x08\x12\x0f\n\x07\x62locked\x18\x03 \x01(\x08\x12\x32\n\x0e\x65stablished_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x94\x01\n\x17\x43reateFriendshipRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x11\n\tfriend_id\x18\x02 \x01(\x05\x12\x32\n\x0e\x65stablished_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x04 \x01(\x08\x12\x0f\n\x07\x62locked\x18\x05 \x01(\x08\"&\n\x18GetFriendshipByIdRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"0\n\x1dGetFriendshipsByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"4\n\x1fGetFriendshipsByFriendIdRequest\x12\x11\n\tfriend_id\x18\x01 \x01(\x05\">\n\x13\x46riendshipsResponse\x12\'\n\x0b\x66riendships\x18\x01 \x03(\x0b\x32\x12.models.Friendship2\x87\x04\n\x11\x46riendshipService\x12G\n\x10\x43reateFriendship\x12\x1f.models.CreateFriendshipRequest\x1a\x12.models.Friendship\x12I\n\x11GetFriendshipById\x12 .models.GetFriendshipByIdRequest\x1a\x12.models.Friendship\x12\\\n\x16GetFriendshipsByUserId\x12%.models.GetFriendshipsByUserIdRequest\x1a\x1b.models.FriendshipsResponse\x12`\n\x18GetFriendshipsByFriendId\x12\'.models.GetFriendshipsByFriendIdRequest\x1a\x1b.models.FriendshipsResponse\x12G\n\x10UpdateFriendship\x12\x1f.models.UpdateFriendshipRequest\x1a\x12.models.Friendship\x12U\n\x10\x44\x65leteFriendship\x12\x1f.models.DeleteFriendshipRequest\x1a .models.DeleteFriendshipResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x66riendship.proto\x12\x06models\x1a\x1fgoogle/protobuf/timestamp.proto\"\x93\x01\n\nFriendship\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x11\n\tfriend_id\x18\x03 \x01(\x05\x12\x32\n\x0e\x65stablished_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x05 \x01(\x08\x12\x0f\n\x07\x62locked\x18\x06 \x01(\x08\"%\n\x17\x44\x65leteFriendshipRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"+\n\x18\x44\x65leteFriendshipResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"|\n\x17UpdateFriendshipRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x02 \x01(\x08\x12\x0f\n\x07\x62locked\x18\x03 \x01(\x08\x12\x32\n\x0e\x65stablished_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x94\x01\n\x17\x43reateFriendshipRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x11\n\tfriend_id\x18\x02 \x01(\x05\x12\x32\n\x0e\x65stablished_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x04 \x01(\x08\x12\x0f\n\x07\x62locked\x18\x05 \x01(\x08\"&\n\x18GetFriendshipByIdRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"0\n\x1dGetFriendshipsByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"4\n\x1fGetFriendshipsByFriendIdRequest\x12\x11\n\tfriend_id\x18\x01 \x01(\x05\">\n\x13\x46riendshipsResponse\x12\'\n\x0b\x66riendships\x18\x01 \x03(\x0b\x32\x12.models.Friendship\"$\n\x11GetFriendsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"A\n\x17GetMutualFriendsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x15\n\rother_user_id\x18\x02 \x01(\x05\"%\n\x11\x46riendIdsResponse\x12\x10\n\x08user_ids\x18\x01 \x03(\x05\"=\n\x1bGetFriendSuggestionsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\";\n\x10\x46riendSuggestion\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x16\n\x0emutual_friends\x18\x02 \x01(\x05\"J\n\x19\x46riendSuggestionsResponse\x12-\n\x0bsuggestions\x18\x01 \x03(\x0b\x32\x18.models.FriendSuggestion\"D\n\x17GetFriendNetworkRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x18\n\x10suggestion_limit\x18\x02 \x01(\x05\"o\n\x15\x46riendNetworkResponse\x12\'\n\x0b\x66riendships\x18\x01 \x03(\x0b\x32\x12.models.Friendship\x12-\n\x0bsuggestions\x18\x02 \x03(\x0b\x32\x18.models.FriendSuggestion2\xd1\x06\n\x11\x46riendshipService\x12G\n\x10\x43reateFriendship\x12\x1f.models.CreateFriendshipRequest\x1a\x12.models.Friendship\x12I\n\x11GetFriendshipById\x12 .models.GetFriendshipByIdRequest\x1a\x12.models.Friendship\x12\\\n\x16GetFriendshipsByUserId\x12%.models.GetFriendshipsByUserIdRequest\x1a\x1b.models.FriendshipsResponse\x12`\n\x18GetFriendshipsByFriendId\x12\'.models.GetFriendshipsByFriendIdRequest\x1a\x1b.models.FriendshipsResponse\x12G\n\x10UpdateFriendship\x12\x1f.models.UpdateFriendshipRequest\x1a\x12.models.Friendship\x12U\n\x10\x44\x65leteFriendship\x12\x1f.models.DeleteFriendshipRequest\x1a .models.DeleteFriendshipResponse\x12\x44\n\nGetFriends\x12\x19.models.GetFriendsRequest\x1a\x1b.models.FriendshipsResponse\x12N\n\x10GetMutualFriends\x12\x1f.models.GetMutualFriendsRequest\x1a\x19.models.FriendIdsResponse\x12^\n\x14GetFriendSuggestions\x12#.models.GetFriendSuggestionsRequest\x1a!.models.FriendSuggestionsResponse\x12R\n\x10GetFriendNetwork\x12\x1f.models.GetFriendNetworkRequest\x1a\x1d.models.FriendNetworkResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -50,6 +50,22 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETFRIENDSHIPSBYFRIENDIDREQUEST']._serialized_end=714
   _globals['_FRIENDSHIPSRESPONSE']._serialized_start=716
   _globals['_FRIENDSHIPSRESPONSE']._serialized_end=778
-  _globals['_FRIENDSHIPSERVICE']._serialized_start=781
-  _globals['_FRIENDSHIPSERVICE']._serialized_end=1300
+  _globals['_GETFRIENDSREQUEST']._serialized_start=780
+  _globals['_GETFRIENDSREQUEST']._serialized_end=816
+  _globals['_GETMUTUALFRIENDSREQUEST']._serialized_start=818
+  _globals['_GETMUTUALFRIENDSREQUEST']._serialized_end=883
+  _globals['_FRIENDIDSRESPONSE']._serialized_start=885
+  _globals['_FRIENDIDSRESPONSE']._serialized_end=922
+  _globals['_GETFRIENDSUGGESTIONSREQUEST']._serialized_start=924
+  _globals['_GETFRIENDSUGGESTIONSREQUEST']._serialized_end=985
+  _globals['_FRIENDSUGGESTION']._serialized_start=987
+  _globals['_FRIENDSUGGESTION']._serialized_end=1046
+  _globals['_FRIENDSUGGESTIONSRESPONSE']._serialized_start=1048
+  _globals['_FRIENDSUGGESTIONSRESPONSE']._serialized_end=1122
+  _globals['_GETFRIENDNETWORKREQUEST']._serialized_start=1124
+  _globals['_GETFRIENDNETWORKREQUEST']._serialized_end=1192
+  _globals['_FRIENDNETWORKRESPONSE']._serialized_start=1194
+  _globals['_FRIENDNETWORKRESPONSE']._serialized_end=1305
+  _globals['_FRIENDSHIPSERVICE']._serialized_start=1308
+  _globals['_FRIENDSHIPSERVICE']._serialized_end=2157
 # @@protoc_insertion_point(module_scope)
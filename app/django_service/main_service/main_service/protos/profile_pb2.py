@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
 # source: profile.proto
+# Protobuf Python Version: 5.29.0
 """Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
 from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    0,
+    '',
+    'profile.proto'
+)
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -13,27 +24,39 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rprofile.proto\x12\x06models\"r\n\x07Profile\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x12\n\navatar_url\x18\x03 \x01(\t\x12\x10\n\x08nickname\x18\x04 \x01(\t\x12\x0b\n\x03\x62io\x18\x05 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_info\x18\x06 \x01(\t\"s\n\x14\x43reateProfileRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x12\n\navatar_url\x18\x02 \x01(\t\x12\x10\n\x08nickname\x18\x03 \x01(\t\x12\x0b\n\x03\x62io\x18\x04 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_info\x18\x05 \x01(\t\"\x7f\n\x14UpdateProfileRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x12\n\navatar_url\x18\x03 \x01(\t\x12\x10\n\x08nickname\x18\x04 \x01(\t\x12\x0b\n\x03\x62io\x18\x05 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_info\x18\x06 \x01(\t\"#\n\x15GetProfileByIdRequest\x12\n\n\x02id\x18\x01 \x01(\x05\",\n\x19GetProfileByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"6\n\x15GetAllProfilesRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06offset\x18\x02 \x01(\x05\"P\n\x16GetAllProfilesResponse\x12!\n\x08profiles\x18\x01 \x03(\x0b\x32\x0f.models.Profile\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\x32\xed\x02\n\x0eProfileService\x12>\n\rCreateProfile\x12\x1c.models.CreateProfileRequest\x1a\x0f.models.Profile\x12>\n\rUpdateProfile\x12\x1c.models.UpdateProfileRequest\x1a\x0f.models.Profile\x12@\n\x0eGetProfileById\x12\x1d.models.GetProfileByIdRequest\x1a\x0f.models.Profile\x12H\n\x12GetProfileByUserId\x12!.models.GetProfileByUserIdRequest\x1a\x0f.models.Profile\x12O\n\x0eGetAllProfiles\x12\x1d.models.GetAllProfilesRequest\x1a\x1e.models.GetAllProfilesResponseb\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'profile_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rprofile.proto\x12\x06models\"r\n\x07Profile\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x12\n\navatar_url\x18\x03 \x01(\t\x12\x10\n\x08nickname\x18\x04 \x01(\t\x12\x0b\n\x03\x62io\x18\x05 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_info\x18\x06 \x01(\t\"s\n\x14\x43reateProfileRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x12\n\navatar_url\x18\x02 \x01(\t\x12\x10\n\x08nickname\x18\x03 \x01(\t\x12\x0b\n\x03\x62io\x18\x04 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_info\x18\x05 \x01(\t\"\x7f\n\x14UpdateProfileRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x12\n\navatar_url\x18\x03 \x01(\t\x12\x10\n\x08nickname\x18\x04 \x01(\t\x12\x0b\n\x03\x62io\x18\x05 \x01(\t\x12\x17\n\x0f\x61\x64\x64itional_info\x18\x06 \x01(\t\"#\n\x15GetProfileByIdRequest\x12\n\n\x02id\x18\x01 \x01(\x05\",\n\x19GetProfileByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"6\n\x15GetAllProfilesRequest\x12\r\n\x05limit\x18\x01 \x01(\x05\x12\x0e\n\x06offset\x18\x02 \x01(\x05\"P\n\x16GetAllProfilesResponse\x12!\n\x08profiles\x18\x01 \x03(\x0b\x32\x0f.models.Profile\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\"/\n\x1bGetProfilesByUserIdsRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\x05\"O\n\x10ProfilesResponse\x12!\n\x08profiles\x18\x01 \x03(\x0b\x32\x0f.models.Profile\x12\x18\n\x10missing_user_ids\x18\x02 \x03(\x05\"6\n\x13ListProfilesRequest\x12\x10\n\x08\x61\x66ter_id\x18\x01 \x01(\x05\x12\r\n\x05limit\x18\x02 \x01(\x05\"e\n\x14ListProfilesResponse\x12!\n\x08profiles\x18\x01 \x03(\x0b\x32\x0f.models.Profile\x12\x15\n\rnext_after_id\x18\x02 \x01(\x05\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"=\n\x15StreamProfilesRequest\x12\x10\n\x08\x61\x66ter_id\x18\x01 \x01(\x05\x12\x12\n\nbatch_size\x18\x02 \x01(\x05\"E\n\x15SearchProfilesRequest\x12\x0e\n\x06prefix\x18\x01 \x01(\t\x12\r\n\x05query\x18\x02 \x01(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\x32\x9e\x05\n\x0eProfileService\x12>\n\rCreateProfile\x12\x1c.models.CreateProfileRequest\x1a\x0f.models.Profile\x12>\n\rUpdateProfile\x12\x1c.models.UpdateProfileRequest\x1a\x0f.models.Profile\x12@\n\x0eGetProfileById\x12\x1d.models.GetProfileByIdRequest\x1a\x0f.models.Profile\x12H\n\x12GetProfileByUserId\x12!.models.GetProfileByUserIdRequest\x1a\x0f.models.Profile\x12O\n\x0eGetAllProfiles\x12\x1d.models.GetAllProfilesRequest\x1a\x1e.models.GetAllProfilesResponse\x12U\n\x14GetProfilesByUserIds\x12#.models.GetProfilesByUserIdsRequest\x1a\x18.models.ProfilesResponse\x12I\n\x0cListProfiles\x12\x1b.models.ListProfilesRequest\x1a\x1c.models.ListProfilesResponse\x12\x42\n\x0eStreamProfiles\x12\x1d.models.StreamProfilesRequest\x1a\x0f.models.Profile0\x01\x12I\n\x0eSearchProfiles\x12\x1d.models.SearchProfilesRequest\x1a\x18.models.ProfilesResponseb\x06proto3')
 
-  DESCRIPTOR._options = None
-  _PROFILE._serialized_start=25
-  _PROFILE._serialized_end=139
-  _CREATEPROFILEREQUEST._serialized_start=141
-  _CREATEPROFILEREQUEST._serialized_end=256
-  _UPDATEPROFILEREQUEST._serialized_start=258
-  _UPDATEPROFILEREQUEST._serialized_end=385
-  _GETPROFILEBYIDREQUEST._serialized_start=387
-  _GETPROFILEBYIDREQUEST._serialized_end=422
-  _GETPROFILEBYUSERIDREQUEST._serialized_start=424
-  _GETPROFILEBYUSERIDREQUEST._serialized_end=468
-  _GETALLPROFILESREQUEST._serialized_start=470
-  _GETALLPROFILESREQUEST._serialized_end=524
-  _GETALLPROFILESRESPONSE._serialized_start=526
-  _GETALLPROFILESRESPONSE._serialized_end=606
-  _PROFILESERVICE._serialized_start=609
-  _PROFILESERVICE._serialized_end=974
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'profile_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_PROFILE']._serialized_start=25
+  _globals['_PROFILE']._serialized_end=139
+  _globals['_CREATEPROFILEREQUEST']._serialized_start=141
+  _globals['_CREATEPROFILEREQUEST']._serialized_end=256
+  _globals['_UPDATEPROFILEREQUEST']._serialized_start=258
+  _globals['_UPDATEPROFILEREQUEST']._serialized_end=385
+  _globals['_GETPROFILEBYIDREQUEST']._serialized_start=387
+  _globals['_GETPROFILEBYIDREQUEST']._serialized_end=422
+  _globals['_GETPROFILEBYUSERIDREQUEST']._serialized_start=424
+  _globals['_GETPROFILEBYUSERIDREQUEST']._serialized_end=468
+  _globals['_GETALLPROFILESREQUEST']._serialized_start=470
+  _globals['_GETALLPROFILESREQUEST']._serialized_end=524
+  _globals['_GETALLPROFILESRESPONSE']._serialized_start=526
+  _globals['_GETALLPROFILESRESPONSE']._serialized_end=606
+  _globals['_GETPROFILESBYUSERIDSREQUEST']._serialized_start=608
+  _globals['_GETPROFILESBYUSERIDSREQUEST']._serialized_end=655
+  _globals['_PROFILESRESPONSE']._serialized_start=657
+  _globals['_PROFILESRESPONSE']._serialized_end=736
+  _globals['_LISTPROFILESREQUEST']._serialized_start=738
+  _globals['_LISTPROFILESREQUEST']._serialized_end=792
+  _globals['_LISTPROFILESRESPONSE']._serialized_start=794
+  _globals['_LISTPROFILESRESPONSE']._serialized_end=895
+  _globals['_STREAMPROFILESREQUEST']._serialized_start=897
+  _globals['_STREAMPROFILESREQUEST']._serialized_end=958
+  _globals['_SEARCHPROFILESREQUEST']._serialized_start=960
+  _globals['_SEARCHPROFILESREQUEST']._serialized_end=1029
+  _globals['_PROFILESERVICE']._serialized_start=1032
+  _globals['_PROFILESERVICE']._serialized_end=1702
 # @@protoc_insertion_point(module_scope)
@@ -1,9 +1,29 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
 """Client and server classes corresponding to protobuf-defined services."""
 import grpc
+import warnings
 
 from . import profile_pb2 as profile__pb2
 
+GRPC_GENERATED_VERSION = '1.69.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in profile_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
 
 class ProfileServiceStub(object):
     """Missing associated documentation comment in .proto file."""
@@ -18,27 +38,47 @@ class ProfileServiceStub(object):
                 '/models.ProfileService/CreateProfile',
                 request_serializer=profile__pb2.CreateProfileRequest.SerializeToString,
                 response_deserializer=profile__pb2.Profile.FromString,
-                )
+                _registered_method=True)
         self.UpdateProfile = channel.unary_unary(
                 '/models.ProfileService/UpdateProfile',
                 request_serializer=profile__pb2.UpdateProfileRequest.SerializeToString,
                 response_deserializer=profile__pb2.Profile.FromString,
-                )
+                _registered_method=True)
         self.GetProfileById = channel.unary_unary(
                 '/models.ProfileService/GetProfileById',
                 request_serializer=profile__pb2.GetProfileByIdRequest.SerializeToString,
                 response_deserializer=profile__pb2.Profile.FromString,
-                )
+                _registered_method=True)
         self.GetProfileByUserId = channel.unary_unary(
                 '/models.ProfileService/GetProfileByUserId',
                 request_serializer=profile__pb2.GetProfileByUserIdRequest.SerializeToString,
                 response_deserializer=profile__pb2.Profile.FromString,
-                )
+                _registered_method=True)
         self.GetAllProfiles = channel.unary_unary(
                 '/models.ProfileService/GetAllProfiles',
                 request_serializer=profile__pb2.GetAllProfilesRequest.SerializeToString,
                 response_deserializer=profile__pb2.GetAllProfilesResponse.FromString,
-                )
+                _registered_method=True)
+        self.GetProfilesByUserIds = channel.unary_unary(
+                '/models.ProfileService/GetProfilesByUserIds',
+                request_serializer=profile__pb2.GetProfilesByUserIdsRequest.SerializeToString,
+                response_deserializer=profile__pb2.ProfilesResponse.FromString,
+                _registered_method=True)
+        self.ListProfiles = channel.unary_unary(
+                '/models.ProfileService/ListProfiles',
+                request_serializer=profile__pb2.ListProfilesRequest.SerializeToString,
+                response_deserializer=profile__pb2.ListProfilesResponse.FromString,
+                _registered_method=True)
+        self.StreamProfiles = channel.unary_stream(
+                '/models.ProfileService/StreamProfiles',
+                request_serializer=profile__pb2.StreamProfilesRequest.SerializeToString,
+                response_deserializer=profile__pb2.Profile.FromString,
+                _registered_method=True)
+        self.SearchProfiles = channel.unary_unary(
+                '/models.ProfileService/SearchProfiles',
+                request_serializer=profile__pb2.SearchProfilesRequest.SerializeToString,
+                response_deserializer=profile__pb2.ProfilesResponse.FromString,
+                _registered_method=True)
 
 
 class ProfileServiceServicer(object):
@@ -74,6 +114,34 @@ class ProfileServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetProfilesByUserIds(self, request, context):
+        """At most USER_BATCH_MAX_IDS ids
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListProfiles(self, request, context):
+        """Keyset pagination by profile id
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamProfiles(self, request, context):
+        """Every profile after after_id, by id
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchProfiles(self, request, context):
+        """Case-insensitive nickname search
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ProfileServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -102,10 +170,31 @@ def add_ProfileServiceServicer_to_server(servicer, server):
                     request_deserializer=profile__pb2.GetAllProfilesRequest.FromString,
                     response_serializer=profile__pb2.GetAllProfilesResponse.SerializeToString,
             ),
+            'GetProfilesByUserIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetProfilesByUserIds,
+                    request_deserializer=profile__pb2.GetProfilesByUserIdsRequest.FromString,
+                    response_serializer=profile__pb2.ProfilesResponse.SerializeToString,
+            ),
+            'ListProfiles': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListProfiles,
+                    request_deserializer=profile__pb2.ListProfilesRequest.FromString,
+                    response_serializer=profile__pb2.ListProfilesResponse.SerializeToString,
+            ),
+            'StreamProfiles': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamProfiles,
+                    request_deserializer=profile__pb2.StreamProfilesRequest.FromString,
+                    response_serializer=profile__pb2.Profile.SerializeToString,
+            ),
+            'SearchProfiles': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchProfiles,
+                    request_deserializer=profile__pb2.SearchProfilesRequest.FromString,
+                    response_serializer=profile__pb2.ProfilesResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'models.ProfileService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('models.ProfileService', rpc_method_handlers)
 
 
  # This class is part of an EXPERIMENTAL API.
@@ -123,11 +212,21 @@ class ProfileService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.ProfileService/CreateProfile',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.ProfileService/CreateProfile',
             profile__pb2.CreateProfileRequest.SerializeToString,
             profile__pb2.Profile.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def UpdateProfile(request,
@@ -140,11 +239,21 @@ class ProfileService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.ProfileService/UpdateProfile',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.ProfileService/UpdateProfile',
             profile__pb2.UpdateProfileRequest.SerializeToString,
             profile__pb2.Profile.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def GetProfileById(request,
@@ -157,11 +266,21 @@ class ProfileService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.ProfileService/GetProfileById',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.ProfileService/GetProfileById',
             profile__pb2.GetProfileByIdRequest.SerializeToString,
             profile__pb2.Profile.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def GetProfileByUserId(request,
@@ -174,11 +293,21 @@ class ProfileService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.ProfileService/GetProfileByUserId',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.ProfileService/GetProfileByUserId',
             profile__pb2.GetProfileByUserIdRequest.SerializeToString,
             profile__pb2.Profile.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def GetAllProfiles(request,
@@ -191,8 +320,126 @@ class ProfileService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.ProfileService/GetAllProfiles',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.ProfileService/GetAllProfiles',
             profile__pb2.GetAllProfilesRequest.SerializeToString,
             profile__pb2.GetAllProfilesResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetProfilesByUserIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.ProfileService/GetProfilesByUserIds',
+            profile__pb2.GetProfilesByUserIdsRequest.SerializeToString,
+            profile__pb2.ProfilesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListProfiles(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.ProfileService/ListProfiles',
+            profile__pb2.ListProfilesRequest.SerializeToString,
+            profile__pb2.ListProfilesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamProfiles(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/models.ProfileService/StreamProfiles',
+            profile__pb2.StreamProfilesRequest.SerializeToString,
+            profile__pb2.Profile.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchProfiles(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.ProfileService/SearchProfiles',
+            profile__pb2.SearchProfilesRequest.SerializeToString,
+            profile__pb2.ProfilesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -41,11 +41,134 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     "ariadne_django",
 ]
-CHANNEL_LAYERS = {
-    "default": {
-        "BACKEND": "channels.layers.InMemoryChannelLayer",
+# Subscription groups (main_service.api.subscriptions.groups) are published
+# on the channel layer. With CHANNEL_LAYER_URL (e.g. redis://redis:6379/0)
+# every Daphne worker sharing the Redis server receives them; the in-memory
+# layer only reaches subscribers of the same process.
+if os.environ.get('CHANNEL_LAYER_URL'):
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels_redis.pubsub.RedisPubSubChannelLayer",
+            "CONFIG": {
+                "hosts": [os.environ['CHANNEL_LAYER_URL']],
+            },
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels.layers.InMemoryChannelLayer",
+        },
+    }
+
+# gRPC backends used by the gateway, keyed by service name
+GRPC_TARGETS = {
+    'user_service': os.environ.get('USER_SERVICE_TARGET', 'user_service:50051'),
+    'game_service': os.environ.get('GAME_SERVICE_TARGET', 'game_service:50051'),
+    'chat_service': os.environ.get('CHAT_SERVICE_TARGET', 'chat_service:50051'),
+    'stat_service': os.environ.get('STAT_SERVICE_TARGET', 'stat_service:50051'),
+    'auth_service': os.environ.get('AUTH_SERVICE_TARGET', 'auth_service:50051'),
+}
+
+# Keepalive stays above the servers' default minimum ping interval (5 min),
+# otherwise they answer with GOAWAY "too_many_pings".
+GRPC_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 300000),
+    ('grpc.keepalive_timeout_ms', 20000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.initial_reconnect_backoff_ms', 500),
+    ('grpc.min_reconnect_backoff_ms', 500),
+    ('grpc.max_reconnect_backoff_ms', 10000),
+    ('grpc.enable_retries', 1),
+]
+
+# Session cookies are HS256 JWTs signed by auth_service. With JWT_SECRET set
+# the gateway verifies them itself and only asks auth_service about auth_ids
+# it has not seen in the last AUTH_SESSION_CACHE_TTL seconds; revoked
+# sessions are pushed back over WatchRevokedSessions.
+JWT_SECRET = os.environ.get('JWT_SECRET')
+AUTH_SESSION_CACHE_SIZE = int(os.environ.get('AUTH_SESSION_CACHE_SIZE', 10000))
+AUTH_SESSION_CACHE_TTL = int(os.environ.get('AUTH_SESSION_CACHE_TTL', 300))
+
+# Persisted GraphQL documents (sha256 -> document). Regenerate after changing
+# frontend_service/logic/gql:
+#   python -m main_service.api.persisted_queries ../frontend_service/frontend_service/logic/gql
+PERSISTED_QUERIES_MANIFEST = os.path.join(BASE_DIR, 'main_service', 'persisted_queries.json')
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.environ.get('GRAPHQL_DOCUMENT_CACHE_SIZE', 256))
+
+# Hash-only GET queries that only select these root fields are sent with
+# "Cache-Control: public" and may be served by nginx to any client, so list
+# only fields that are safe to show to anonymous users.
+GRAPHQL_PUBLIC_FIELDS = ['hello']
+GRAPHQL_GET_MAX_AGE = int(os.environ.get('GRAPHQL_GET_MAX_AGE', 30))
+
+# Operations are rejected before execution above these budgets. Cost is the
+# estimated number of downstream RPCs (see main_service.api.cost); list
+# fields without a limit argument count as GRAPHQL_DEFAULT_LIST_SIZE items.
+GRAPHQL_MAX_DEPTH = int(os.environ.get('GRAPHQL_MAX_DEPTH', 10))
+GRAPHQL_MAX_COST = int(os.environ.get('GRAPHQL_MAX_COST', 50))
+GRAPHQL_DEFAULT_LIST_SIZE = int(os.environ.get('GRAPHQL_DEFAULT_LIST_SIZE', 10))
+
+# Operations slower than this are logged with their resolver timing tree
+# (main_service.api.tracing). Unset to disable the slow-operation log.
+GRAPHQL_SLOW_OPERATION_SECONDS = (
+    float(os.environ['GRAPHQL_SLOW_OPERATION_SECONDS']) if os.environ.get('GRAPHQL_SLOW_OPERATION_SECONDS') else None
+)
+
+# Subscriptions sharing one upstream stream (main_service.api.subscriptions.hub):
+# a subscriber more than GRAPHQL_SUBSCRIPTION_QUEUE_SIZE items behind is
+# disconnected, late joiners get the last GRAPHQL_SUBSCRIPTION_REPLAY_SIZE items.
+GRAPHQL_SUBSCRIPTION_QUEUE_SIZE = int(os.environ.get('GRAPHQL_SUBSCRIPTION_QUEUE_SIZE', 100))
+GRAPHQL_SUBSCRIPTION_REPLAY_SIZE = int(os.environ.get('GRAPHQL_SUBSCRIPTION_REPLAY_SIZE', 1000))
+# Messages a chat_room_message subscription starts with unless it asks for a
+# backlog, and the largest backlog it may ask for. History is fetched in pages
+# of CHAT_MESSAGE_PAGE_SIZE_MAX, which has to match chat_service's setting.
+CHAT_MESSAGE_BACKLOG = int(os.environ.get('CHAT_MESSAGE_BACKLOG', 50))
+CHAT_MESSAGE_BACKLOG_MAX = int(os.environ.get('CHAT_MESSAGE_BACKLOG_MAX', 1000))
+CHAT_MESSAGE_PAGE_SIZE_MAX = int(os.environ.get('CHAT_MESSAGE_PAGE_SIZE_MAX', 200))
+
+# Prometheus metrics are served on METRICS_PORT (off when unset), apart from
+# the public HTTP port.
+METRICS_PORT = int(os.environ.get('METRICS_PORT', 0))
+
+# Response cache for hot read-only queries. In-process LRU by default; point
+# GRAPHQL_CACHE_BACKEND/GRAPHQL_CACHE_LOCATION at e.g.
+# django.core.cache.backends.redis.RedisCache / redis://redis:6379/1 to share
+# it between gateway processes.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'graphql': {
+        'BACKEND': os.environ.get('GRAPHQL_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('GRAPHQL_CACHE_LOCATION', 'graphql'),
+        'OPTIONS': {'MAX_ENTRIES': 1000} if 'GRAPHQL_CACHE_BACKEND' not in os.environ else {},
     },
 }
+GRAPHQL_RESPONSE_CACHE = 'graphql'
+
+# Root query fields whose results may be cached: ttl in seconds, tags that
+# mutations invalidate (formatted with the field arguments and the viewer),
+# and whether the result is the same for every viewer.
+GRAPHQL_RESPONSE_CACHE_FIELDS = {
+    'ongoing_games': {'ttl': 5, 'tags': ['games'], 'shared': True},
+    'tournaments': {'ttl': 30, 'tags': ['tournaments'], 'shared': True},
+    'StatList': {'ttl': 60, 'tags': ['stats', 'profiles'], 'shared': True},
+    'getAllProfiles': {'ttl': 60, 'tags': ['profiles'], 'shared': True},
+    'profile': {'ttl': 60, 'tags': ['profile:{userId}'], 'shared': True},
+}
+
+# Tags invalidated by each mutation
+GRAPHQL_RESPONSE_CACHE_INVALIDATION = {
+    'create_game': ['games'],
+    'create_friend_game': ['games'],
+    'start_game': ['games'],
+    'update_game_state': ['games'],
+    'create_tournament': ['tournaments'],
+    'createStat': ['stats'],
+    'manageProfile': ['profiles', 'profile:{viewer}'],
+}
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
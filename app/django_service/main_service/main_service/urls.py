@@ -25,6 +25,11 @@ from main_service.api.schema import Schema
 from main_service.api.schema.authSchema import schemaAuth
 #from .views import CustomGraphQLView, graphiql
 from ariadne_django.views import GraphQLView
+from main_service.api.cost import QueryCostExtension, get_validation_rules
+from main_service.api.loaders import get_context_value
+from main_service.api.middleware.resolverMiddleware import offload_sync_resolvers
+from main_service.api.tracing import TracingExtension
+from main_service.api.views import PersistedQueryGraphQLView
 
 from . import settings
 
@@ -40,6 +45,12 @@ from . import settings
 #    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
 urlpatterns = [
-    path('graphql/', GraphQLView.as_view(schema=Schema.schema), name='graphql'),
+    path('graphql/', PersistedQueryGraphQLView.as_view(
+        schema=Schema.schema,
+        context_value=get_context_value,
+        validation_rules=get_validation_rules,
+        extensions=[QueryCostExtension, TracingExtension],
+        middleware=[offload_sync_resolvers],
+    ), name='graphql'),
     path('auth/', csrf_exempt(GraphQLView.as_view(schema=schemaAuth))),  # Auth GraphQL API endpoint
 ]
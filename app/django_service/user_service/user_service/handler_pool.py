@@ -0,0 +1,162 @@
+"""
+Execution of the synchronous gRPC handlers under grpcrunaioserver.
+
+The handlers are plain Django ORM code. ``nonblocking`` wraps a servicer so
+each of its synchronous RPC methods becomes a coroutine that runs the
+original method on ``handler_pool``: a pool of GRPC_HANDLER_THREADS threads,
+sized to the database connections the service may hold (with CONN_MAX_AGE,
+every thread keeps at most one). Handlers that are already coroutines keep
+running natively on the event loop. Django's async ORM is no alternative for
+ORM handlers: outside of a request it runs every query on one shared thread.
+
+Like Django does around a request, every handler starts and ends with
+``close_old_connections``, so connections past CONN_MAX_AGE or broken ones
+are replaced instead of failing the next request on that thread.
+
+At most GRPC_HANDLER_QUEUE calls wait for a thread, further ones are
+rejected with RESOURCE_EXHAUSTED instead of queueing without bound. Queue
+wait, run time, occupancy and rejections are exported as Prometheus metrics
+(on METRICS_PORT, see ``start_metrics_server``).
+"""
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+from django.conf import settings
+from django.db import close_old_connections
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+logger = logging.getLogger(__name__)
+
+GRPC_HANDLER_QUEUE_SECONDS = Histogram(
+    "grpc_handler_queue_seconds",
+    "Time synchronous handlers waited for a pool thread",
+    ["method"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+GRPC_HANDLER_DURATION = Histogram(
+    "grpc_handler_duration_seconds",
+    "Run time of synchronous handlers on their pool thread",
+    ["method"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+GRPC_HANDLER_QUEUED = Gauge(
+    "grpc_handler_queued",
+    "Synchronous handler calls waiting for a pool thread",
+)
+GRPC_HANDLER_RUNNING = Gauge(
+    "grpc_handler_running",
+    "Synchronous handler calls running on a pool thread",
+)
+GRPC_HANDLER_REJECTED = Counter(
+    "grpc_handler_rejected_total",
+    "Handler calls rejected because GRPC_HANDLER_QUEUE calls were already waiting",
+    ["method"],
+)
+
+
+class HandlerPool:
+    """Bounded thread pool for synchronous handlers, see the module docstring."""
+
+    def __init__(self, threads=None, queue=None):
+        self._threads = threads
+        self._queue = queue
+        self._executor = None
+        self._pending = 0
+
+    @property
+    def threads(self):
+        if self._threads is None:
+            self._threads = settings.GRPC_HANDLER_THREADS
+        return self._threads
+
+    @property
+    def queue(self):
+        if self._queue is None:
+            self._queue = settings.GRPC_HANDLER_QUEUE
+        return self._queue
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="grpc-handler")
+        return self._executor
+
+    async def run(self, method, handler, request, context):
+        """Run ``handler(request, context)`` on a pool thread, or reject it if too many calls wait already."""
+        if self._pending >= self.threads + self.queue:
+            GRPC_HANDLER_REJECTED.labels(method).inc()
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Server busy, retry later")
+        self._pending += 1
+        GRPC_HANDLER_QUEUED.inc()
+        started = []
+        # Handlers see the context variables of their call, as on the event loop
+        call = functools.partial(
+            contextvars.copy_context().run, self._call, method, time.perf_counter(), started, handler, request, context
+        )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+        finally:
+            self._pending -= 1
+            if not started:
+                # Cancelled while waiting, it never gets a thread
+                GRPC_HANDLER_QUEUED.dec()
+
+    @staticmethod
+    def _call(method, submitted, started, handler, request, context):
+        started.append(time.perf_counter())
+        GRPC_HANDLER_QUEUED.dec()
+        GRPC_HANDLER_QUEUE_SECONDS.labels(method).observe(started[0] - submitted)
+        GRPC_HANDLER_RUNNING.inc()
+        close_old_connections()
+        try:
+            return handler(request, context)
+        finally:
+            close_old_connections()
+            GRPC_HANDLER_RUNNING.dec()
+            GRPC_HANDLER_DURATION.labels(method).observe(time.perf_counter() - started[0])
+
+
+handler_pool = HandlerPool()
+
+
+def _rpc_names(servicer):
+    """The RPC methods of ``servicer``: those declared by its generated *Servicer base class."""
+    return {
+        name
+        for base in type(servicer).__mro__
+        if base.__module__.endswith("_pb2_grpc")
+        for name in vars(base)
+        if not name.startswith("_")
+    }
+
+
+def nonblocking(servicer, pool=handler_pool):
+    """Have the synchronous RPC methods of ``servicer`` run on ``pool``; returns the servicer."""
+    for name in _rpc_names(servicer):
+        handler = getattr(servicer, name)
+        if inspect.iscoroutinefunction(handler) or inspect.isasyncgenfunction(handler):
+            continue
+        if inspect.isgeneratorfunction(handler):
+            # Would hold a pool thread for as long as the stream is open
+            logger.warning(f"Streaming handler {type(servicer).__name__}.{name} is left to the server's thread pool")
+            continue
+        method = f"{type(servicer).__name__}.{name}"
+
+        async def run(request, context, method=method, handler=handler):
+            return await pool.run(method, handler, request, context)
+
+        setattr(servicer, name, run)
+    return servicer
+
+
+def start_metrics_server():
+    """Serve the Prometheus metrics on METRICS_PORT, if set."""
+    if settings.METRICS_PORT:
+        start_http_server(settings.METRICS_PORT)
+        logger.info(f"Serving metrics on port {settings.METRICS_PORT}")
@@ -64,6 +64,26 @@ class FriendshipServiceStub(object):
                 request_serializer=friendship__pb2.DeleteFriendshipRequest.SerializeToString,
                 response_deserializer=friendship__pb2.DeleteFriendshipResponse.FromString,
                 _registered_method=True)
+        self.GetFriends = channel.unary_unary(
+                '/models.FriendshipService/GetFriends',
+                request_serializer=friendship__pb2.GetFriendsRequest.SerializeToString,
+                response_deserializer=friendship__pb2.FriendshipsResponse.FromString,
+                _registered_method=True)
+        self.GetMutualFriends = channel.unary_unary(
+                '/models.FriendshipService/GetMutualFriends',
+                request_serializer=friendship__pb2.GetMutualFriendsRequest.SerializeToString,
+                response_deserializer=friendship__pb2.FriendIdsResponse.FromString,
+                _registered_method=True)
+        self.GetFriendSuggestions = channel.unary_unary(
+                '/models.FriendshipService/GetFriendSuggestions',
+                request_serializer=friendship__pb2.GetFriendSuggestionsRequest.SerializeToString,
+                response_deserializer=friendship__pb2.FriendSuggestionsResponse.FromString,
+                _registered_method=True)
+        self.GetFriendNetwork = channel.unary_unary(
+                '/models.FriendshipService/GetFriendNetwork',
+                request_serializer=friendship__pb2.GetFriendNetworkRequest.SerializeToString,
+                response_deserializer=friendship__pb2.FriendNetworkResponse.FromString,
+                _registered_method=True)
 
 
 class FriendshipServiceServicer(object):
@@ -107,6 +127,32 @@ class FriendshipServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetFriends(self, request, context):
+        """Accepted friendships in both directions
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetMutualFriends(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetFriendSuggestions(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetFriendNetwork(self, request, context):
+        """Friends and suggestions at once
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_FriendshipServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -140,6 +186,26 @@ def add_FriendshipServiceServicer_to_server(servicer, server):
                     request_deserializer=friendship__pb2.DeleteFriendshipRequest.FromString,
                     response_serializer=friendship__pb2.DeleteFriendshipResponse.SerializeToString,
             ),
+            'GetFriends': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFriends,
+                    request_deserializer=friendship__pb2.GetFriendsRequest.FromString,
+                    response_serializer=friendship__pb2.FriendshipsResponse.SerializeToString,
+            ),
+            'GetMutualFriends': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMutualFriends,
+                    request_deserializer=friendship__pb2.GetMutualFriendsRequest.FromString,
+                    response_serializer=friendship__pb2.FriendIdsResponse.SerializeToString,
+            ),
+            'GetFriendSuggestions': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFriendSuggestions,
+                    request_deserializer=friendship__pb2.GetFriendSuggestionsRequest.FromString,
+                    response_serializer=friendship__pb2.FriendSuggestionsResponse.SerializeToString,
+            ),
+            'GetFriendNetwork': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFriendNetwork,
+                    request_deserializer=friendship__pb2.GetFriendNetworkRequest.FromString,
+                    response_serializer=friendship__pb2.FriendNetworkResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'models.FriendshipService', rpc_method_handlers)
@@ -312,3 +378,111 @@ class FriendshipService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetFriends(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.FriendshipService/GetFriends',
+            friendship__pb2.GetFriendsRequest.SerializeToString,
+            friendship__pb2.FriendshipsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetMutualFriends(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.FriendshipService/GetMutualFriends',
+            friendship__pb2.GetMutualFriendsRequest.SerializeToString,
+            friendship__pb2.FriendIdsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetFriendSuggestions(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.FriendshipService/GetFriendSuggestions',
+            friendship__pb2.GetFriendSuggestionsRequest.SerializeToString,
+            friendship__pb2.FriendSuggestionsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetFriendNetwork(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.FriendshipService/GetFriendNetwork',
+            friendship__pb2.GetFriendNetworkRequest.SerializeToString,
+            friendship__pb2.FriendNetworkResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
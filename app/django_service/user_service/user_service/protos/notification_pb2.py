@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
 # source: notification.proto
+# Protobuf Python Version: 5.29.0
 """Generated protocol buffer code."""
-from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
 from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    0,
+    '',
+    'notification.proto'
+)
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -14,29 +25,31 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12notification.proto\x12\x06models\x1a\x1fgoogle/protobuf/timestamp.proto\"w\n\x0cNotification\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0c\n\x04read\x18\x04 \x01(\x08\x12+\n\x07sent_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"s\n\x19UpdateNotificationRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0c\n\x04read\x18\x03 \x01(\x08\x12+\n\x07sent_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\'\n\x19\x44\x65leteNotificationRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"-\n\x1a\x44\x65leteNotificationResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"x\n\x19\x43reateNotificationRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0c\n\x04read\x18\x03 \x01(\x08\x12+\n\x07sent_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"(\n\x1aGetNotificationByIdRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"2\n\x1fGetNotificationsByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"D\n\x15NotificationsResponse\x12+\n\rnotifications\x18\x01 \x03(\x0b\x32\x14.models.Notification2\xc5\x03\n\x13NotificationService\x12M\n\x12\x43reateNotification\x12!.models.CreateNotificationRequest\x1a\x14.models.Notification\x12O\n\x13GetNotificationById\x12\".models.GetNotificationByIdRequest\x1a\x14.models.Notification\x12\x62\n\x18GetNotificationsByUserId\x12\'.models.GetNotificationsByUserIdRequest\x1a\x1d.models.NotificationsResponse\x12M\n\x12UpdateNotification\x12!.models.UpdateNotificationRequest\x1a\x14.models.Notification\x12[\n\x12\x44\x65leteNotification\x12!.models.DeleteNotificationRequest\x1a\".models.DeleteNotificationResponseb\x06proto3')
-
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'notification_pb2', globals())
-if _descriptor._USE_C_DESCRIPTORS == False:
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12notification.proto\x12\x06models\x1a\x1fgoogle/protobuf/timestamp.proto\"w\n\x0cNotification\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x0c\n\x04read\x18\x04 \x01(\x08\x12+\n\x07sent_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"s\n\x19UpdateNotificationRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0c\n\x04read\x18\x03 \x01(\x08\x12+\n\x07sent_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\'\n\x19\x44\x65leteNotificationRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"-\n\x1a\x44\x65leteNotificationResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"x\n\x19\x43reateNotificationRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0c\n\x04read\x18\x03 \x01(\x08\x12+\n\x07sent_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"(\n\x1aGetNotificationByIdRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"2\n\x1fGetNotificationsByUserIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"4\n GetNotificationsByUserIdsRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\x05\"D\n\x15NotificationsResponse\x12+\n\rnotifications\x18\x01 \x03(\x0b\x32\x14.models.Notification2\xab\x04\n\x13NotificationService\x12M\n\x12\x43reateNotification\x12!.models.CreateNotificationRequest\x1a\x14.models.Notification\x12O\n\x13GetNotificationById\x12\".models.GetNotificationByIdRequest\x1a\x14.models.Notification\x12\x62\n\x18GetNotificationsByUserId\x12\'.models.GetNotificationsByUserIdRequest\x1a\x1d.models.NotificationsResponse\x12\x64\n\x19GetNotificationsByUserIds\x12(.models.GetNotificationsByUserIdsRequest\x1a\x1d.models.NotificationsResponse\x12M\n\x12UpdateNotification\x12!.models.UpdateNotificationRequest\x1a\x14.models.Notification\x12[\n\x12\x44\x65leteNotification\x12!.models.DeleteNotificationRequest\x1a\".models.DeleteNotificationResponseb\x06proto3')
 
-  DESCRIPTOR._options = None
-  _NOTIFICATION._serialized_start=63
-  _NOTIFICATION._serialized_end=182
-  _UPDATENOTIFICATIONREQUEST._serialized_start=184
-  _UPDATENOTIFICATIONREQUEST._serialized_end=299
-  _DELETENOTIFICATIONREQUEST._serialized_start=301
-  _DELETENOTIFICATIONREQUEST._serialized_end=340
-  _DELETENOTIFICATIONRESPONSE._serialized_start=342
-  _DELETENOTIFICATIONRESPONSE._serialized_end=387
-  _CREATENOTIFICATIONREQUEST._serialized_start=389
-  _CREATENOTIFICATIONREQUEST._serialized_end=509
-  _GETNOTIFICATIONBYIDREQUEST._serialized_start=511
-  _GETNOTIFICATIONBYIDREQUEST._serialized_end=551
-  _GETNOTIFICATIONSBYUSERIDREQUEST._serialized_start=553
-  _GETNOTIFICATIONSBYUSERIDREQUEST._serialized_end=603
-  _NOTIFICATIONSRESPONSE._serialized_start=605
-  _NOTIFICATIONSRESPONSE._serialized_end=673
-  _NOTIFICATIONSERVICE._serialized_start=676
-  _NOTIFICATIONSERVICE._serialized_end=1129
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'notification_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_NOTIFICATION']._serialized_start=63
+  _globals['_NOTIFICATION']._serialized_end=182
+  _globals['_UPDATENOTIFICATIONREQUEST']._serialized_start=184
+  _globals['_UPDATENOTIFICATIONREQUEST']._serialized_end=299
+  _globals['_DELETENOTIFICATIONREQUEST']._serialized_start=301
+  _globals['_DELETENOTIFICATIONREQUEST']._serialized_end=340
+  _globals['_DELETENOTIFICATIONRESPONSE']._serialized_start=342
+  _globals['_DELETENOTIFICATIONRESPONSE']._serialized_end=387
+  _globals['_CREATENOTIFICATIONREQUEST']._serialized_start=389
+  _globals['_CREATENOTIFICATIONREQUEST']._serialized_end=509
+  _globals['_GETNOTIFICATIONBYIDREQUEST']._serialized_start=511
+  _globals['_GETNOTIFICATIONBYIDREQUEST']._serialized_end=551
+  _globals['_GETNOTIFICATIONSBYUSERIDREQUEST']._serialized_start=553
+  _globals['_GETNOTIFICATIONSBYUSERIDREQUEST']._serialized_end=603
+  _globals['_GETNOTIFICATIONSBYUSERIDSREQUEST']._serialized_start=605
+  _globals['_GETNOTIFICATIONSBYUSERIDSREQUEST']._serialized_end=657
+  _globals['_NOTIFICATIONSRESPONSE']._serialized_start=659
+  _globals['_NOTIFICATIONSRESPONSE']._serialized_end=727
+  _globals['_NOTIFICATIONSERVICE']._serialized_start=730
+  _globals['_NOTIFICATIONSERVICE']._serialized_end=1285
 # @@protoc_insertion_point(module_scope)
@@ -1,9 +1,29 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
 """Client and server classes corresponding to protobuf-defined services."""
 import grpc
+import warnings
 
 from . import notification_pb2 as notification__pb2
 
+GRPC_GENERATED_VERSION = '1.69.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in notification_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
 
 class NotificationServiceStub(object):
     """Missing associated documentation comment in .proto file."""
@@ -18,27 +38,32 @@ class NotificationServiceStub(object):
                 '/models.NotificationService/CreateNotification',
                 request_serializer=notification__pb2.CreateNotificationRequest.SerializeToString,
                 response_deserializer=notification__pb2.Notification.FromString,
-                )
+                _registered_method=True)
         self.GetNotificationById = channel.unary_unary(
                 '/models.NotificationService/GetNotificationById',
                 request_serializer=notification__pb2.GetNotificationByIdRequest.SerializeToString,
                 response_deserializer=notification__pb2.Notification.FromString,
-                )
+                _registered_method=True)
         self.GetNotificationsByUserId = channel.unary_unary(
                 '/models.NotificationService/GetNotificationsByUserId',
                 request_serializer=notification__pb2.GetNotificationsByUserIdRequest.SerializeToString,
                 response_deserializer=notification__pb2.NotificationsResponse.FromString,
-                )
+                _registered_method=True)
+        self.GetNotificationsByUserIds = channel.unary_unary(
+                '/models.NotificationService/GetNotificationsByUserIds',
+                request_serializer=notification__pb2.GetNotificationsByUserIdsRequest.SerializeToString,
+                response_deserializer=notification__pb2.NotificationsResponse.FromString,
+                _registered_method=True)
         self.UpdateNotification = channel.unary_unary(
                 '/models.NotificationService/UpdateNotification',
                 request_serializer=notification__pb2.UpdateNotificationRequest.SerializeToString,
                 response_deserializer=notification__pb2.Notification.FromString,
-                )
+                _registered_method=True)
         self.DeleteNotification = channel.unary_unary(
                 '/models.NotificationService/DeleteNotification',
                 request_serializer=notification__pb2.DeleteNotificationRequest.SerializeToString,
                 response_deserializer=notification__pb2.DeleteNotificationResponse.FromString,
-                )
+                _registered_method=True)
 
 
 class NotificationServiceServicer(object):
@@ -62,6 +87,12 @@ class NotificationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetNotificationsByUserIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def UpdateNotification(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -92,6 +123,11 @@ def add_NotificationServiceServicer_to_server(servicer, server):
                     request_deserializer=notification__pb2.GetNotificationsByUserIdRequest.FromString,
                     response_serializer=notification__pb2.NotificationsResponse.SerializeToString,
             ),
+            'GetNotificationsByUserIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetNotificationsByUserIds,
+                    request_deserializer=notification__pb2.GetNotificationsByUserIdsRequest.FromString,
+                    response_serializer=notification__pb2.NotificationsResponse.SerializeToString,
+            ),
             'UpdateNotification': grpc.unary_unary_rpc_method_handler(
                     servicer.UpdateNotification,
                     request_deserializer=notification__pb2.UpdateNotificationRequest.FromString,
@@ -106,6 +142,7 @@ def add_NotificationServiceServicer_to_server(servicer, server):
     generic_handler = grpc.method_handlers_generic_handler(
             'models.NotificationService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('models.NotificationService', rpc_method_handlers)
 
 
  # This class is part of an EXPERIMENTAL API.
@@ -123,11 +160,21 @@ class NotificationService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.NotificationService/CreateNotification',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.NotificationService/CreateNotification',
             notification__pb2.CreateNotificationRequest.SerializeToString,
             notification__pb2.Notification.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def GetNotificationById(request,
@@ -140,11 +187,21 @@ class NotificationService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.NotificationService/GetNotificationById',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.NotificationService/GetNotificationById',
             notification__pb2.GetNotificationByIdRequest.SerializeToString,
             notification__pb2.Notification.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def GetNotificationsByUserId(request,
@@ -157,11 +214,48 @@ class NotificationService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.NotificationService/GetNotificationsByUserId',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.NotificationService/GetNotificationsByUserId',
             notification__pb2.GetNotificationsByUserIdRequest.SerializeToString,
             notification__pb2.NotificationsResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetNotificationsByUserIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.NotificationService/GetNotificationsByUserIds',
+            notification__pb2.GetNotificationsByUserIdsRequest.SerializeToString,
+            notification__pb2.NotificationsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def UpdateNotification(request,
@@ -174,11 +268,21 @@ class NotificationService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.NotificationService/UpdateNotification',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.NotificationService/UpdateNotification',
             notification__pb2.UpdateNotificationRequest.SerializeToString,
             notification__pb2.Notification.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
 
     @staticmethod
     def DeleteNotification(request,
@@ -191,8 +295,18 @@ class NotificationService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/models.NotificationService/DeleteNotification',
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.NotificationService/DeleteNotification',
             notification__pb2.DeleteNotificationRequest.SerializeToString,
             notification__pb2.DeleteNotificationResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
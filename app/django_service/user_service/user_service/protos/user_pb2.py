@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nuser.proto\x12\x06models\x1a\x1fgoogle/protobuf/timestamp.proto\"\xf7\x01\n\x04User\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04mail\x18\x03 \x01(\t\x12\x0f\n\x07\x62locked\x18\x05 \x01(\x08\x12.\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07role_id\x18\x08 \x01(\x05\x12.\n\nlast_login\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x15\n\rlast_login_ip\x18\n \x01(\t\"t\n\x11\x43reateUserRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04mail\x18\x03 \x01(\t\x12\x0f\n\x07\x62locked\x18\x05 \x01(\x08\x12\x0f\n\x07role_id\x18\x06 \x01(\x05\x12\x15\n\rlast_login_ip\x18\x07 \x01(\t\"\x1c\n\x0eGetUserRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"*\n\x17GetUsersByRoleIdRequest\x12\x0f\n\x07role_id\x18\x01 \x01(\x05\"X\n\x1aUpdateUserLastLoginRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12.\n\nlast_login\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\",\n\rUsersResponse\x12\x1b\n\x05users\x18\x01 \x03(\x0b\x32\x0c.models.User2\x8a\x02\n\x0bUserService\x12\x35\n\nCreateUser\x12\x19.models.CreateUserRequest\x1a\x0c.models.User\x12/\n\x07GetUser\x12\x16.models.GetUserRequest\x1a\x0c.models.User\x12J\n\x10GetUsersByRoleId\x12\x1f.models.GetUsersByRoleIdRequest\x1a\x15.models.UsersResponse\x12G\n\x13UpdateUserLastLogin\x12\".models.UpdateUserLastLoginRequest\x1a\x0c.models.Userb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nuser.proto\x12\x06models\x1a\x1fgoogle/protobuf/timestamp.proto\"\xf7\x01\n\x04User\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04mail\x18\x03 \x01(\t\x12\x0f\n\x07\x62locked\x18\x05 \x01(\x08\x12.\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07role_id\x18\x08 \x01(\x05\x12.\n\nlast_login\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x15\n\rlast_login_ip\x18\n \x01(\t\"t\n\x11\x43reateUserRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04mail\x18\x03 \x01(\t\x12\x0f\n\x07\x62locked\x18\x05 \x01(\x08\x12\x0f\n\x07role_id\x18\x06 \x01(\x05\x12\x15\n\rlast_login_ip\x18\x07 \x01(\t\"\x1c\n\x0eGetUserRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"*\n\x17GetUsersByRoleIdRequest\x12\x0f\n\x07role_id\x18\x01 \x01(\x05\"X\n\x1aUpdateUserLastLoginRequest\x12\n\n\x02id\x18\x01 \x01(\x05\x12.\n\nlast_login\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\",\n\rUsersResponse\x12\x1b\n\x05users\x18\x01 \x03(\x0b\x32\x0c.models.User\"#\n\x14GetUsersByIdsRequest\x12\x0b\n\x03ids\x18\x01 \x03(\x05\"F\n\x12UsersByIdsResponse\x12\x1b\n\x05users\x18\x01 \x03(\x0b\x32\x0c.models.User\x12\x13\n\x0bmissing_ids\x18\x02 \x03(\x05\x32\xd5\x02\n\x0bUserService\x12\x35\n\nCreateUser\x12\x19.models.CreateUserRequest\x1a\x0c.models.User\x12/\n\x07GetUser\x12\x16.models.GetUserRequest\x1a\x0c.models.User\x12J\n\x10GetUsersByRoleId\x12\x1f.models.GetUsersByRoleIdRequest\x1a\x15.models.UsersResponse\x12I\n\rGetUsersByIds\x12\x1c.models.GetUsersByIdsRequest\x1a\x1a.models.UsersByIdsResponse\x12G\n\x13UpdateUserLastLogin\x12\".models.UpdateUserLastLoginRequest\x1a\x0c.models.Userb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -44,6 +44,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_UPDATEUSERLASTLOGINREQUEST']._serialized_end=585
   _globals['_USERSRESPONSE']._serialized_start=587
   _globals['_USERSRESPONSE']._serialized_end=631
-  _globals['_USERSERVICE']._serialized_start=634
-  _globals['_USERSERVICE']._serialized_end=900
+  _globals['_GETUSERSBYIDSREQUEST']._serialized_start=633
+  _globals['_GETUSERSBYIDSREQUEST']._serialized_end=668
+  _globals['_USERSBYIDSRESPONSE']._serialized_start=670
+  _globals['_USERSBYIDSRESPONSE']._serialized_end=740
+  _globals['_USERSERVICE']._serialized_start=743
+  _globals['_USERSERVICE']._serialized_end=1084
 # @@protoc_insertion_point(module_scope)
@@ -49,6 +49,11 @@ class UserServiceStub(object):
                 request_serializer=user__pb2.GetUsersByRoleIdRequest.SerializeToString,
                 response_deserializer=user__pb2.UsersResponse.FromString,
                 _registered_method=True)
+        self.GetUsersByIds = channel.unary_unary(
+                '/models.UserService/GetUsersByIds',
+                request_serializer=user__pb2.GetUsersByIdsRequest.SerializeToString,
+                response_deserializer=user__pb2.UsersByIdsResponse.FromString,
+                _registered_method=True)
         self.UpdateUserLastLogin = channel.unary_unary(
                 '/models.UserService/UpdateUserLastLogin',
                 request_serializer=user__pb2.UpdateUserLastLoginRequest.SerializeToString,
@@ -77,6 +82,13 @@ class UserServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetUsersByIds(self, request, context):
+        """At most USER_BATCH_MAX_IDS ids
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def UpdateUserLastLogin(self, request, context):
         """Added specific service method
         """
@@ -102,6 +114,11 @@ def add_UserServiceServicer_to_server(servicer, server):
                     request_deserializer=user__pb2.GetUsersByRoleIdRequest.FromString,
                     response_serializer=user__pb2.UsersResponse.SerializeToString,
             ),
+            'GetUsersByIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUsersByIds,
+                    request_deserializer=user__pb2.GetUsersByIdsRequest.FromString,
+                    response_serializer=user__pb2.UsersByIdsResponse.SerializeToString,
+            ),
             'UpdateUserLastLogin': grpc.unary_unary_rpc_method_handler(
                     servicer.UpdateUserLastLogin,
                     request_deserializer=user__pb2.UpdateUserLastLoginRequest.FromString,
@@ -199,6 +216,33 @@ class UserService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetUsersByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/models.UserService/GetUsersByIds',
+            user__pb2.GetUsersByIdsRequest.SerializeToString,
+            user__pb2.UsersByIdsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def UpdateUserLastLogin(request,
             target,
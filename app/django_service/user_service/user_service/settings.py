@@ -82,13 +82,47 @@ DATABASES = {
         'PASSWORD': url.password,
         'HOST': url.hostname,
         'PORT': url.port,
+        # Every handler thread keeps its connection (see user_service.handler_pool)
+        'CONN_MAX_AGE': int(os.environ.get('DATABASE_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 # python
 DJANGO_GRPC_FRAMEWORK = {
-    'ROOT_HANDLERS_HOOK': 'user_service.urls.grpc_handler',
+    'ROOT_HANDLERS_HOOK': 'user_service.urls.grpc_handlers',
 }
+
+# Synchronous gRPC handlers run on GRPC_HANDLER_THREADS threads, one database
+# connection each, so keep it within the connections the database allows this
+# service. Beyond GRPC_HANDLER_QUEUE waiting calls, calls are rejected with
+# RESOURCE_EXHAUSTED. Metrics are served on METRICS_PORT (off when unset).
+GRPC_HANDLER_THREADS = int(os.environ.get('GRPC_HANDLER_THREADS', 20))
+GRPC_HANDLER_QUEUE = int(os.environ.get('GRPC_HANDLER_QUEUE', 200))
+METRICS_PORT = int(os.environ.get('METRICS_PORT', 0))
+
+# Largest id list GetUsersByIds and GetProfilesByUserIds accept
+USER_BATCH_MAX_IDS = int(os.environ.get('USER_BATCH_MAX_IDS', 500))
+
+# Friend graph (user.friend_graph): users whose friendships are kept in
+# memory, and the default and largest number of friend suggestions
+FRIEND_GRAPH_MAX_USERS = int(os.environ.get('FRIEND_GRAPH_MAX_USERS', 100000))
+FRIEND_SUGGESTIONS = int(os.environ.get('FRIEND_SUGGESTIONS', 10))
+FRIEND_SUGGESTIONS_MAX = int(os.environ.get('FRIEND_SUGGESTIONS_MAX', 50))
+
+# ListProfiles page size (default and largest) and how long row counts
+# reported with listings are cached (user.counts)
+PROFILE_PAGE_SIZE = int(os.environ.get('PROFILE_PAGE_SIZE', 20))
+PROFILE_PAGE_MAX = int(os.environ.get('PROFILE_PAGE_MAX', 100))
+ROW_COUNT_TTL = int(os.environ.get('ROW_COUNT_TTL', 60))
+
+# SearchProfiles (user.profile_search): default and largest number of
+# results, and "database" (indexed, any size) or "memory" (sorted copy of
+# every nickname, rebuilt every PROFILE_SEARCH_INDEX_TTL seconds)
+PROFILE_SEARCH_LIMIT = int(os.environ.get('PROFILE_SEARCH_LIMIT', 10))
+PROFILE_SEARCH_MAX = int(os.environ.get('PROFILE_SEARCH_MAX', 50))
+PROFILE_SEARCH_BACKEND = os.environ.get('PROFILE_SEARCH_BACKEND', 'database')
+PROFILE_SEARCH_INDEX_TTL = int(os.environ.get('PROFILE_SEARCH_INDEX_TTL', 300))
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
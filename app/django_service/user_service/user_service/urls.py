@@ -11,44 +11,47 @@ from user_service.user.profile_grpc_handler import ProfileServiceHandler
 from user_service.user.permission_grpc_handler import PermissionServiceHandler
 from user_service.user.notification_grpc_handler import NotificationServiceHandler
 from user_service.user.friendship_grpc_handler import FriendshipServiceHandler
+from user_service.handler_pool import nonblocking, start_metrics_server
 
 urlpatterns = [
 ]
 
 
 def grpc_handlers(server):
+    start_metrics_server()
+
     # Register User Service
-    user_service_handler = UserServiceHandler.as_servicer()
+    user_service_handler = nonblocking(UserServiceHandler.as_servicer())
     user_pb2_grpc.add_UserServiceServicer_to_server(user_service_handler, server)
 
     # Register User Achievement Service
-    user_achievement_service_handler = UserAchievementServiceHandler.as_servicer()
+    user_achievement_service_handler = nonblocking(UserAchievementServiceHandler.as_servicer())
     userAchievement_pb2_grpc.add_UserAchievementServiceServicer_to_server(user_achievement_service_handler, server)
 
     # Register Setting Service
-    setting_service_handler = SettingServiceHandler.as_servicer()
+    setting_service_handler = nonblocking(SettingServiceHandler.as_servicer())
     settings_pb2_grpc.add_SettingServiceServicer_to_server(setting_service_handler, server)
 
     # Register Role Permission Service
-    role_permission_service_handler = RolePermissionServiceHandler.as_servicer()
+    role_permission_service_handler = nonblocking(RolePermissionServiceHandler.as_servicer())
     rolePermission_pb2_grpc.add_RolePermissionServiceServicer_to_server(role_permission_service_handler, server)
 
     # Register Role Service
-    role_service_handler = RoleServiceHandler.as_servicer()
+    role_service_handler = nonblocking(RoleServiceHandler.as_servicer())
     role_pb2_grpc.add_RoleServiceServicer_to_server(role_service_handler, server)
 
     # Register Profile Service
-    profile_service_handler = ProfileServiceHandler.as_servicer()
+    profile_service_handler = nonblocking(ProfileServiceHandler.as_servicer())
     profile_pb2_grpc.add_ProfileServiceServicer_to_server(profile_service_handler, server)
 
     # Register Permission Service
-    permission_service_handler = PermissionServiceHandler.as_servicer()
+    permission_service_handler = nonblocking(PermissionServiceHandler.as_servicer())
     permission_pb2_grpc.add_PermissionServiceServicer_to_server(permission_service_handler, server)
 
     # Register Notification Service
-    notification_service_handler = NotificationServiceHandler.as_servicer()
+    notification_service_handler = nonblocking(NotificationServiceHandler.as_servicer())
     notification_pb2_grpc.add_NotificationServiceServicer_to_server(notification_service_handler, server)
 
     # Register Friendship Service
-    friendship_service_handler = FriendshipServiceHandler.as_servicer()
+    friendship_service_handler = nonblocking(FriendshipServiceHandler.as_servicer())
     friendship_pb2_grpc.add_FriendshipServiceServicer_to_server(friendship_service_handler, server)
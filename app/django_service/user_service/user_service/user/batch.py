@@ -0,0 +1,16 @@
+import grpc
+from django.conf import settings
+
+
+def batch_ids(ids, context):
+    """
+    The distinct ids of a batch request, in request order. Returns None,
+    with INVALID_ARGUMENT set on ``context``, if there are more than
+    USER_BATCH_MAX_IDS of them.
+    """
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > settings.USER_BATCH_MAX_IDS:
+        context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+        context.set_details(f'At most {settings.USER_BATCH_MAX_IDS} ids per request, got {len(ids)}')
+        return None
+    return ids
@@ -0,0 +1,41 @@
+import threading
+import time
+
+from django.conf import settings
+
+
+class CachedCount:
+    """
+    Row count of a model, queried at most once every ROW_COUNT_TTL
+    seconds instead of a COUNT(*) per listing. Rows this process creates or
+    deletes are added to the cached value right away with ``add``; changes
+    made by other processes show once the count expires.
+    """
+
+    def __init__(self, model, ttl=None):
+        self._model = model
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._count = None
+        self._expires = 0
+
+    @property
+    def ttl(self):
+        if self._ttl is None:
+            self._ttl = settings.ROW_COUNT_TTL
+        return self._ttl
+
+    def get(self):
+        with self._lock:
+            if self._count is not None and time.monotonic() < self._expires:
+                return self._count
+        count = self._model.objects.count()
+        with self._lock:
+            self._count = count
+            self._expires = time.monotonic() + self.ttl
+        return count
+
+    def add(self, delta):
+        with self._lock:
+            if self._count is not None:
+                self._count = max(self._count + delta, 0)
@@ -0,0 +1,131 @@
+"""
+In-memory adjacency index of the Friendship table.
+
+For every user that was looked at, the graph keeps compact int arrays: its
+friends (accepted, not blocked, in either direction) sorted by id, with the
+id, direction and start of each friendship alongside, and the users it has
+a pending or blocked friendship with. Users missing from the index are
+loaded together in one query, so a friends-of-friends walk costs at most
+two queries however many friends there are, and none once the users are
+warm.
+
+The Friendship handlers invalidate both users of every friendship they
+create, update or delete. Loads that raced with an invalidation are
+returned but not kept. At most FRIEND_GRAPH_MAX_USERS users are kept,
+least recently used ones are dropped first.
+"""
+import heapq
+import threading
+from array import array
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.db.models import Q
+
+from user.models import Friendship
+
+
+class Adjacency:
+    __slots__ = ("friends", "friendship_ids", "outgoing", "since", "excluded")
+
+    def __init__(self, friends, excluded):
+        # friends: (friend_id, friendship_id, outgoing, established_at seconds), sorted
+        self.friends = array("i", (friend[0] for friend in friends))
+        self.friendship_ids = array("i", (friend[1] for friend in friends))
+        self.outgoing = array("b", (friend[2] for friend in friends))
+        self.since = array("q", (friend[3] for friend in friends))
+        self.excluded = array("i", sorted(excluded))
+
+
+class FriendGraph:
+    def __init__(self, max_users=None):
+        self._max_users = max_users
+        self._lock = threading.Lock()
+        self._users = OrderedDict()
+        self._version = 0
+
+    @property
+    def max_users(self):
+        if self._max_users is None:
+            self._max_users = settings.FRIEND_GRAPH_MAX_USERS
+        return self._max_users
+
+    def adjacency(self, user_id):
+        return self.adjacencies([user_id])[user_id]
+
+    def adjacencies(self, user_ids):
+        """The Adjacency of each of ``user_ids``, loading the missing ones with one query."""
+        found = {}
+        with self._lock:
+            for user_id in user_ids:
+                adjacency = self._users.get(user_id)
+                if adjacency is not None:
+                    self._users.move_to_end(user_id)
+                    found[user_id] = adjacency
+            version = self._version
+        missing = set(user_ids) - found.keys()
+        if not missing:
+            return found
+
+        loaded = self._load(missing)
+        with self._lock:
+            if self._version == version:
+                self._users.update(loaded)
+                while len(self._users) > self.max_users:
+                    self._users.popitem(last=False)
+        found.update(loaded)
+        return found
+
+    @staticmethod
+    def _load(user_ids):
+        friends = {user_id: {} for user_id in user_ids}
+        excluded = {user_id: set() for user_id in user_ids}
+        rows = Friendship.objects.filter(Q(user_id__in=user_ids) | Q(friend_id__in=user_ids)).values_list(
+            "id", "user_id", "friend_id", "established_at", "accepted", "blocked"
+        )
+        for id, user_id, friend_id, established_at, accepted, blocked in rows:
+            for me, other, outgoing in ((user_id, friend_id, 1), (friend_id, user_id, 0)):
+                if me not in friends:
+                    continue
+                if accepted and not blocked:
+                    # Friends both ways shows up twice, the first friendship stands
+                    friends[me].setdefault(other, (other, id, outgoing, int(established_at.timestamp())))
+                else:
+                    excluded[me].add(other)
+        return {
+            # A block in either direction outweighs an accepted friendship
+            user_id: Adjacency(
+                sorted(friend for other, friend in friends[user_id].items() if other not in excluded[user_id]),
+                excluded[user_id],
+            )
+            for user_id in user_ids
+        }
+
+    def invalidate(self, *user_ids):
+        with self._lock:
+            self._version += 1
+            for user_id in user_ids:
+                self._users.pop(user_id, None)
+
+    def mutual_friends(self, user_id, other_user_id):
+        adjacencies = self.adjacencies([user_id, other_user_id])
+        return sorted(set(adjacencies[user_id].friends).intersection(adjacencies[other_user_id].friends))
+
+    def suggestions(self, user_id, limit):
+        """
+        Up to ``limit`` friends of friends of ``user_id`` as ``(user_id,
+        mutual friends)``, most mutual friends first. Friends and users with
+        a pending or blocked friendship with ``user_id`` are left out.
+        """
+        adjacency = self.adjacency(user_id)
+        counts = Counter()
+        for friend in self.adjacencies(adjacency.friends).values():
+            counts.update(friend.friends)
+        skip = {user_id, *adjacency.friends, *adjacency.excluded}
+        ranked = heapq.nsmallest(
+            limit, ((-count, candidate) for candidate, count in counts.items() if candidate not in skip)
+        )
+        return [(candidate, -count) for count, candidate in ranked]
+
+
+friend_graph = FriendGraph()
@@ -1,9 +1,11 @@
 import grpc
 from datetime import datetime
+from django.conf import settings
 from google.protobuf.timestamp_pb2 import Timestamp
 from django.db import IntegrityError
 from user_service.protos import friendship_pb2_grpc, friendship_pb2
 from user.models import Friendship, User
+from user.friend_graph import friend_graph
 
 
 class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
@@ -36,6 +38,7 @@ class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
                 context.set_code(grpc.StatusCode.ALREADY_EXISTS)
                 context.set_details('Friendship already exists')
                 return friendship_pb2.Friendship()
+            friend_graph.invalidate(friendship.user_id, friendship.friend_id)
 
             # Convert `established_at` to protobuf Timestamp
             established_at_proto = Timestamp()
@@ -44,8 +47,8 @@ class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
             # Return the new friendship as a protobuf message
             return friendship_pb2.Friendship(
                 id=friendship.id,
-                user_id=friendship.user.id,
-                friend_id=friendship.friend.id,
+                user_id=friendship.user_id,
+                friend_id=friendship.friend_id,
                 established_at=established_at_proto,
                 accepted=friendship.accepted,
                 blocked=friendship.blocked
@@ -82,6 +85,7 @@ class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
 
             # Save the updated Friendship
             friendship.save()
+            friend_graph.invalidate(friendship.user_id, friendship.friend_id)
 
             # Convert the updated `established_at` to protobuf Timestamp
             established_at_proto = Timestamp()
@@ -90,8 +94,8 @@ class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
             # Return the updated Friendship
             return friendship_pb2.Friendship(
                 id=friendship.id,
-                user_id=friendship.user.id,
-                friend_id=friendship.friend.id,
+                user_id=friendship.user_id,
+                friend_id=friendship.friend_id,
                 established_at=established_at_proto,
                 accepted=friendship.accepted,
                 blocked=friendship.blocked,
@@ -117,6 +121,7 @@ class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
 
             # Delete the Friendship
             friendship.delete()
+            friend_graph.invalidate(friendship.user_id, friendship.friend_id)
 
             # Return a success response
             return friendship_pb2.DeleteFriendshipResponse(success=True)
@@ -146,8 +151,8 @@ class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
             # Return the friendship as a protobuf message
             return friendship_pb2.Friendship(
                 id=friendship.id,
-                user_id=friendship.user.id,
-                friend_id=friendship.friend.id,
+                user_id=friendship.user_id,
+                friend_id=friendship.friend_id,
                 established_at=established_at_proto,
                 accepted=friendship.accepted,
                 blocked=friendship.blocked
@@ -172,8 +177,8 @@ class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
             friendships_proto = [
                 friendship_pb2.Friendship(
                     id=friendship.id,
-                    user_id=friendship.user.id,
-                    friend_id=friendship.friend.id,
+                    user_id=friendship.user_id,
+                    friend_id=friendship.friend_id,
                     established_at=Timestamp(seconds=int(friendship.established_at.timestamp())),
                     accepted=friendship.accepted,
                     blocked=friendship.blocked
@@ -206,11 +211,11 @@ class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
                 friendships_proto.append(
                     friendship_pb2.Friendship(
                         id=friendship.id,
-                        user_id=friendship.user.id,
-                        friend_id=friendship.friend.id,
+                        user_id=friendship.user_id,
+                        friend_id=friendship.friend_id,
                         established_at=established_at_proto,
                         accepted=friendship.accepted,
-                        bl0cked=friendship.blocked
+                        blocked=friendship.blocked
                     )
                 )
 
@@ -222,6 +227,85 @@ class FriendshipServiceHandler(friendship_pb2_grpc.FriendshipServiceServicer):
             context.set_details(f'Failed to retrieve friendships: {str(e)}')
             return friendship_pb2.FriendshipsResponse()
 
+    @staticmethod
+    def _friends_to_proto(user_id, adjacency):
+        return [
+            friendship_pb2.Friendship(
+                id=friendship_id,
+                user_id=user_id if outgoing else friend_id,
+                friend_id=friend_id if outgoing else user_id,
+                established_at=Timestamp(seconds=since),
+                accepted=True,
+                blocked=False,
+            )
+            for friend_id, friendship_id, outgoing, since in zip(
+                adjacency.friends, adjacency.friendship_ids, adjacency.outgoing, adjacency.since
+            )
+        ]
+
+    @staticmethod
+    def _suggestions_to_proto(user_id, limit):
+        limit = min(limit or settings.FRIEND_SUGGESTIONS, settings.FRIEND_SUGGESTIONS_MAX)
+        return [
+            friendship_pb2.FriendSuggestion(user_id=candidate, mutual_friends=mutual_friends)
+            for candidate, mutual_friends in friend_graph.suggestions(user_id, limit)
+        ]
+
+    def GetFriends(self, request, context):
+        """
+        Retrieve the accepted friendships of a user in both directions, from the friend graph.
+        """
+        try:
+            adjacency = friend_graph.adjacency(request.user_id)
+            return friendship_pb2.FriendshipsResponse(
+                friendships=self._friends_to_proto(request.user_id, adjacency)
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f'Failed to retrieve friends: {str(e)}')
+            return friendship_pb2.FriendshipsResponse()
+
+    def GetMutualFriends(self, request, context):
+        """
+        Retrieve the ids of the friends two users have in common.
+        """
+        try:
+            return friendship_pb2.FriendIdsResponse(
+                user_ids=friend_graph.mutual_friends(request.user_id, request.other_user_id)
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f'Failed to retrieve mutual friends: {str(e)}')
+            return friendship_pb2.FriendIdsResponse()
+
+    def GetFriendSuggestions(self, request, context):
+        """
+        Suggest friends of friends, ranked by the number of mutual friends.
+        """
+        try:
+            return friendship_pb2.FriendSuggestionsResponse(
+                suggestions=self._suggestions_to_proto(request.user_id, request.limit)
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f'Failed to suggest friends: {str(e)}')
+            return friendship_pb2.FriendSuggestionsResponse()
+
+    def GetFriendNetwork(self, request, context):
+        """
+        Retrieve the friends of a user and friend suggestions in one call, for the community page.
+        """
+        try:
+            adjacency = friend_graph.adjacency(request.user_id)
+            return friendship_pb2.FriendNetworkResponse(
+                friendships=self._friends_to_proto(request.user_id, adjacency),
+                suggestions=self._suggestions_to_proto(request.user_id, request.suggestion_limit),
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f'Failed to retrieve friend network: {str(e)}')
+            return friendship_pb2.FriendNetworkResponse()
+
     @classmethod
     def as_servicer(cls):
         """
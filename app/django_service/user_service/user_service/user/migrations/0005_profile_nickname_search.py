@@ -0,0 +1,23 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from django.db.models.functions import Collate, Upper
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0004_friendship_blocked'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(Collate(Upper('nickname'), 'C'), name='profile_nickname_prefix'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=GinIndex(OpClass(Upper('nickname'), name='gin_trgm_ops'), name='profile_nickname_trgm'),
+        ),
+    ]
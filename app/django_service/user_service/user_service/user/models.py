@@ -1,5 +1,7 @@
 import json
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Collate, Upper
 from django.utils import timezone
 
 class User(models.Model):
@@ -47,6 +49,13 @@ class Profile(models.Model):
     def get_additional_info(self):
         return json.loads(self.additional_info)
 
+    class Meta:
+        # Nickname search, see user.profile_search
+        indexes = [
+            models.Index(Collate(Upper('nickname'), 'C'), name='profile_nickname_prefix'),
+            GinIndex(OpClass(Upper('nickname'), name='gin_trgm_ops'), name='profile_nickname_trgm'),
+        ]
+
 class Role(models.Model):
     name = models.CharField(max_length=255, unique=True)
 
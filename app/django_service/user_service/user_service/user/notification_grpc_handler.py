@@ -193,6 +193,39 @@ class NotificationServiceHandler(notification_pb2_grpc.NotificationServiceServic
             context.set_details(f'Failed to retrieve notifications: {str(e)}')
             return notification_pb2.NotificationsResponse()
 
+    def GetNotificationsByUserIds(self, request, context):
+        """
+        Retrieve the Notifications of several users with a single query,
+        ordered by sent_at timestamp. Callers group them by user_id.
+        """
+        try:
+            notifications = Notification.objects.filter(
+                user_id__in=set(request.user_ids)
+            ).order_by('-sent_at')
+
+            notifications_proto = []
+            for notification in notifications:
+                sent_at_proto = Timestamp()
+                sent_at_proto.FromDatetime(notification.sent_at)
+
+                notifications_proto.append(
+                    notification_pb2.Notification(
+                        id=notification.id,
+                        user_id=notification.user_id,
+                        message=notification.message,
+                        read=notification.read,
+                        sent_at=sent_at_proto
+                    )
+                )
+
+            return notification_pb2.NotificationsResponse(
+                notifications=notifications_proto
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f'Failed to retrieve notifications: {str(e)}')
+            return notification_pb2.NotificationsResponse()
+
     @classmethod
     def as_servicer(cls):
         """
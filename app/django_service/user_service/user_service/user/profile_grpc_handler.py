@@ -2,9 +2,19 @@ import logging
 
 import grpc
 import json
+from django.conf import settings
 from django.db import IntegrityError
+from user_service.handler_pool import handler_pool
 from user_service.protos import profile_pb2_grpc, profile_pb2
 from user.models import Profile
+from user.batch import batch_ids
+from user.counts import CachedCount
+from user.profile_search import nickname_index, search_profiles
+
+# Profile columns, named like the Profile message fields
+PROFILE_FIELDS = ("id", "user_id", "avatar_url", "nickname", "bio", "additional_info")
+
+profile_count = CachedCount(Profile)
 
 
 class ProfileServiceHandler(profile_pb2_grpc.ProfileServiceServicer):
@@ -21,7 +31,7 @@ class ProfileServiceHandler(profile_pb2_grpc.ProfileServiceServicer):
                 avatar_url=profile.avatar_url,
                 nickname=profile.nickname,
                 bio=profile.bio,
-                additional_info=json.dumps(profile.additional_info),
+                additional_info=profile.additional_info,
             )
         except Profile.DoesNotExist:
             context.set_code(grpc.StatusCode.NOT_FOUND)
@@ -37,13 +47,39 @@ class ProfileServiceHandler(profile_pb2_grpc.ProfileServiceServicer):
                 avatar_url=profile.avatar_url,
                 nickname=profile.nickname,
                 bio=profile.bio,
-                additional_info=json.dumps(profile.additional_info),
+                additional_info=profile.additional_info,
             )
         except Profile.DoesNotExist:
             context.set_code(grpc.StatusCode.NOT_FOUND)
             context.set_details('Profile not found')
             return profile_pb2.Profile()
 
+    # Fetch the profiles of several users with a single query
+    def GetProfilesByUserIds(self, request, context):
+        user_ids = batch_ids(request.user_ids, context)
+        if user_ids is None:
+            return profile_pb2.ProfilesResponse()
+        try:
+            by_user = {profile.user_id: profile for profile in Profile.objects.filter(user_id__in=user_ids)}
+            return profile_pb2.ProfilesResponse(
+                profiles=[
+                    profile_pb2.Profile(
+                        id=profile.id,
+                        user_id=profile.user_id,
+                        avatar_url=profile.avatar_url,
+                        nickname=profile.nickname,
+                        bio=profile.bio,
+                        additional_info=profile.additional_info,
+                    )
+                    for profile in (by_user[user_id] for user_id in user_ids if user_id in by_user)
+                ],
+                missing_user_ids=[user_id for user_id in user_ids if user_id not in by_user],
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details('Failed to fetch profiles: ' + str(e))
+            return profile_pb2.ProfilesResponse()
+
     # Create a new profile
     def CreateProfile(self, request, context):
         try:
@@ -70,6 +106,8 @@ class ProfileServiceHandler(profile_pb2_grpc.ProfileServiceServicer):
                 bio=request.bio,
                 additional_info=json.dumps(additional_info),
             )
+            profile_count.add(1)
+            nickname_index.update(profile.id, profile.nickname)
             return profile_pb2.Profile(
                 id=profile.id,
                 user_id=profile.user.id,
@@ -120,6 +158,7 @@ class ProfileServiceHandler(profile_pb2_grpc.ProfileServiceServicer):
                 return profile_pb2.Profile()
 
             profile.save()
+            nickname_index.update(profile.id, profile.nickname)
             logging.info("Successfully updated profile for user_id: %s", request.user_id)  # Log successful update
 
             return profile_pb2.Profile(
@@ -141,7 +180,10 @@ class ProfileServiceHandler(profile_pb2_grpc.ProfileServiceServicer):
     def DeleteProfile(self, request, context):
         try:
             profile = Profile.objects.get(user_id=request.user_id)
+            profile_id = profile.id
             profile.delete()
+            profile_count.add(-1)
+            nickname_index.remove(profile_id)
             return profile_pb2.ProfileDeleteResponse(
                 success=True
             )
@@ -164,25 +206,11 @@ class ProfileServiceHandler(profile_pb2_grpc.ProfileServiceServicer):
     def GetAllProfiles(self, request, context):
         try:
             # Query profiles with requested limit and offset
-            profiles_queryset = Profile.objects.all()[request.offset: request.offset + request.limit]
-            total_count = Profile.objects.count()
-
-            # Build response
-            profiles = [
-                profile_pb2.Profile(
-                    id=profile.id,
-                    user_id=profile.user.id,
-                    avatar_url=profile.avatar_url,
-                    nickname=profile.nickname,
-                    bio=profile.bio,
-                    additional_info=json.dumps(profile.additional_info),  # Serialize additional_info
-                )
-                for profile in profiles_queryset
-            ]
-
+            rows = Profile.objects.order_by("id").values(*PROFILE_FIELDS)[request.offset: request.offset + request.limit]
             return profile_pb2.GetAllProfilesResponse(
-                profiles=profiles,
-                total_count=total_count - 1
+                # additional_info is stored as JSON text already
+                profiles=[profile_pb2.Profile(**row) for row in rows],
+                total_count=profile_count.get() - 1
             )
         except Exception as e:
             context.set_code(grpc.StatusCode.INTERNAL)
@@ -192,6 +220,62 @@ class ProfileServiceHandler(profile_pb2_grpc.ProfileServiceServicer):
                 total_count=0
             )
 
+    @staticmethod
+    def _profile_rows(request, context):
+        """Up to ``request.limit`` profile rows with an id above ``request.after_id``, by id."""
+        return list(
+            Profile.objects.filter(id__gt=request.after_id).order_by("id").values(*PROFILE_FIELDS)[:request.limit]
+        )
+
+    # Fetch a page of profiles after a profile id, costs the same on every page
+    def ListProfiles(self, request, context):
+        limit = max(1, min(request.limit or settings.PROFILE_PAGE_SIZE, settings.PROFILE_PAGE_MAX))
+        try:
+            # One more row than asked tells whether there is a next page
+            rows = self._profile_rows(
+                profile_pb2.ListProfilesRequest(after_id=request.after_id, limit=limit + 1), context
+            )
+            return profile_pb2.ListProfilesResponse(
+                profiles=[profile_pb2.Profile(**row) for row in rows[:limit]],
+                next_after_id=rows[limit - 1]["id"] if len(rows) > limit else 0,
+                total_count=profile_count.get(),
+            )
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details('Failed to fetch profiles: ' + str(e))
+            return profile_pb2.ListProfilesResponse()
+
+    # Search profiles by nickname prefix (autocomplete) or substring
+    def SearchProfiles(self, request, context):
+        limit = max(1, min(request.limit or settings.PROFILE_SEARCH_LIMIT, settings.PROFILE_SEARCH_MAX))
+        try:
+            rows = search_profiles(request.prefix.strip(), request.query.strip(), limit, PROFILE_FIELDS)
+            return profile_pb2.ProfilesResponse(profiles=[profile_pb2.Profile(**row) for row in rows])
+        except Exception as e:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details('Failed to search profiles: ' + str(e))
+            return profile_pb2.ProfilesResponse()
+
+    # Stream every profile after a profile id, for bulk consumers
+    async def StreamProfiles(self, request, context):
+        # Each batch is read on the handler pool, no thread is held while the client catches up
+        batch = profile_pb2.ListProfilesRequest(
+            after_id=request.after_id,
+            limit=max(1, min(request.batch_size or settings.PROFILE_PAGE_MAX, settings.PROFILE_PAGE_MAX)),
+        )
+        while True:
+            try:
+                rows = await handler_pool.run("ProfileServiceHandler.StreamProfiles", self._profile_rows, batch, context)
+            except grpc.aio.AbortError:
+                raise
+            except Exception as e:
+                await context.abort(grpc.StatusCode.INTERNAL, 'Failed to fetch profiles: ' + str(e))
+            for row in rows:
+                yield profile_pb2.Profile(**row)
+            if len(rows) < batch.limit:
+                return
+            batch.after_id = rows[-1]["id"]
+
     @classmethod
     def as_servicer(cls):
         # Setup to add this servicer to the gRPC server
@@ -0,0 +1,126 @@
+"""
+Nickname search for SearchProfiles, case-insensitive.
+
+A prefix search (autocomplete) is a range scan of the
+profile_nickname_prefix index, UPPER(nickname) in "C" collation, which
+reads the first ``limit`` matches in nickname order and stops. A query
+search matches anywhere in the nickname through the profile_nickname_trgm
+trigram index, shortest nicknames first. Trigrams need three characters,
+shorter queries are searched as prefixes.
+
+With PROFILE_SEARCH_BACKEND = "memory" the matching is done on a sorted
+in-memory copy of every nickname instead, for small deployments. The
+Profile handlers keep it current for the profiles they change; changes by
+other processes show once it is rebuilt, PROFILE_SEARCH_INDEX_TTL seconds
+after it was built.
+"""
+import bisect
+import heapq
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Value
+from django.db.models.functions import Collate, Length, Upper
+
+from user.models import Profile
+
+TRIGRAM = 3
+# Sorts after every character, so PREFIX <= key < PREFIX + MAX_CHAR holds for keys starting with PREFIX
+MAX_CHAR = "\U0010ffff"
+
+
+def _database_search(prefix, query, limit, fields):
+    profiles = Profile.objects.annotate(key=Collate(Upper("nickname"), "C"))
+    if prefix:
+        profiles = profiles.filter(
+            key__gte=Upper(Value(prefix)), key__lt=Upper(Value(prefix + MAX_CHAR))
+        ).order_by("key", "id")
+    else:
+        profiles = profiles.filter(nickname__icontains=query).order_by(Length("nickname"), "key", "id")
+    return list(profiles.values(*fields)[:limit])
+
+
+class NicknameIndex:
+    def __init__(self, ttl=None):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._keys = None
+        self._by_id = {}
+        self._expires = 0
+
+    @property
+    def ttl(self):
+        if self._ttl is None:
+            self._ttl = settings.PROFILE_SEARCH_INDEX_TTL
+        return self._ttl
+
+    def _build(self):
+        with self._lock:
+            if self._keys is not None and time.monotonic() < self._expires:
+                return
+        rows = Profile.objects.values_list("id", "nickname")
+        by_id = {id: nickname.upper() for id, nickname in rows}
+        keys = sorted((key, id) for id, key in by_id.items())
+        with self._lock:
+            self._keys, self._by_id = keys, by_id
+            self._expires = time.monotonic() + self.ttl
+
+    def search(self, prefix, query, limit):
+        """Ids of the first ``limit`` profiles matching, in the order of the database search."""
+        self._build()
+        with self._lock:
+            if prefix:
+                prefix = prefix.upper()
+                start = bisect.bisect_left(self._keys, (prefix,))
+                matches = []
+                for key, id in self._keys[start:start + limit]:
+                    if not key.startswith(prefix):
+                        break
+                    matches.append(id)
+                return matches
+            query = query.upper()
+            ranked = heapq.nsmallest(
+                limit, ((len(key), key, id) for key, id in self._keys if query in key)
+            )
+            return [id for _, _, id in ranked]
+
+    def update(self, profile_id, nickname):
+        with self._lock:
+            if self._keys is None:
+                return
+            self._discard(profile_id)
+            key = nickname.upper()
+            self._by_id[profile_id] = key
+            bisect.insort(self._keys, (key, profile_id))
+
+    def remove(self, profile_id):
+        with self._lock:
+            if self._keys is not None:
+                self._discard(profile_id)
+
+    def _discard(self, profile_id):
+        key = self._by_id.pop(profile_id, None)
+        if key is not None:
+            index = bisect.bisect_left(self._keys, (key, profile_id))
+            if index < len(self._keys) and self._keys[index] == (key, profile_id):
+                del self._keys[index]
+
+
+nickname_index = NicknameIndex()
+
+
+def search_profiles(prefix, query, limit, fields):
+    """
+    Up to ``limit`` profiles, as ``fields`` values, whose nickname starts
+    with ``prefix`` or, without one, contains ``query``.
+    """
+    if not prefix and len(query) < TRIGRAM:
+        prefix, query = query, ""
+    if not prefix and not query:
+        return []
+    if settings.PROFILE_SEARCH_BACKEND != "memory":
+        return _database_search(prefix, query, limit, fields)
+    ids = nickname_index.search(prefix, query, limit)
+    rows = {row["id"]: row for row in Profile.objects.filter(id__in=ids).values(*fields)}
+    return [rows[id] for id in ids if id in rows]
@@ -3,6 +3,7 @@ import grpc
 from django.utils import timezone
 from user_service.protos import user_pb2_grpc, user_pb2
 from user.models import User
+from user.batch import batch_ids
 
 class UserServiceHandler(user_pb2_grpc.UserServiceServicer):
     def __init__(self):
@@ -27,6 +28,30 @@ class UserServiceHandler(user_pb2_grpc.UserServiceServicer):
             context.set_details('User not found')
             return user_pb2.User()
 
+    # Fetch several users with a single query
+    def GetUsersByIds(self, request, context):
+        ids = batch_ids(request.ids, context)
+        if ids is None:
+            return user_pb2.UsersByIdsResponse()
+        by_id = {user.id: user for user in User.objects.filter(id__in=ids)}
+        return user_pb2.UsersByIdsResponse(
+            users=[
+                user_pb2.User(
+                    id=user.id,
+                    name=user.name,
+                    mail=user.mail,
+                    blocked=user.blocked,
+                    created_at=google.protobuf.timestamp_pb2.Timestamp(seconds=int(user.created_at.timestamp())),
+                    updated_at=google.protobuf.timestamp_pb2.Timestamp(seconds=int(user.updated_at.timestamp())),
+                    role_id=user.role_id,
+                    last_login=google.protobuf.timestamp_pb2.Timestamp(seconds=int(user.last_login.timestamp())) if user.last_login else None,
+                    last_login_ip=user.last_login_ip
+                )
+                for user in (by_id[id] for id in ids if id in by_id)
+            ],
+            missing_ids=[id for id in ids if id not in by_id],
+        )
+
     def CreateUser(self, request, context):
         try:
             user = User(